@@ -0,0 +1,73 @@
+"""
+Benchmark - Procedural case generation and the subsystems it feeds
+Times generating cases with different worker counts, then uses the generated
+cases as load for the rest of the engine: streaming them to JSON lines, to a
+directory of case packs (validated and compiled through CasePackLibrary) and
+into the Case Files archive and evidence archive, then scoring the archive
+with case analytics.
+Run from the repository root: python -m benchmarks.bench_case_generator
+"""
+
+import argparse
+import io
+import os
+import tempfile
+import time
+
+def rate(count: int, start: float) -> str:
+    elapsed = time.perf_counter() - start
+    return f"{count / elapsed:,.0f}/s ({elapsed:.2f} s)"
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the case generator and downstream loading")
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    parser.add_argument("--packs", type=int, default=2000, help="cases written as pack files and loaded")
+    args = parser.parse_args()
+    
+    from src.modules.case_analytics import run_report
+    from src.modules.case_generator import generate_serialized, write_cases
+    from src.modules.case_packs import CasePackLibrary
+    from src.modules.case_repository import CaseRepository
+    
+    options = {"seed": 1}
+    for workers in sorted(set(args.workers)):
+        start = time.perf_counter()
+        generated = sum(1 for _ in generate_serialized(args.count, options, workers))
+        print(f"generate {generated} cases, {workers} worker(s): {rate(generated, start)}")
+    
+    workers = max(args.workers)
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        written = write_cases(generate_serialized(args.count, options, workers), os.path.join(directory, "cases.jsonl"))
+        print(f"stream to JSON lines: {rate(written, start)}")
+        
+        archive = os.path.join(directory, "cases.db")
+        evidence = os.path.join(directory, "evidence.db")
+        start = time.perf_counter()
+        written = write_cases(generate_serialized(args.count, options, workers), os.path.join(directory, "more.jsonl"),
+                              archive=archive)
+        print(f"stream + Case Files archive: {rate(written, start)}")
+        repository = CaseRepository(archive)
+        print(f"  archive holds {repository.count()} cases, {repository.count('Active')} active")
+        repository.close()
+        
+        pack_dir = os.path.join(directory, "packs")
+        start = time.perf_counter()
+        written = write_cases(generate_serialized(args.packs, options, workers), pack_dir, evidence=evidence)
+        print(f"write pack files + evidence archive: {rate(written, start)}")
+        
+        cache_dir = os.path.join(directory, "cache")
+        for label in ("cold (validate + compile)", "cached"):
+            library = CasePackLibrary(pack_dir, cache_dir)
+            start = time.perf_counter()
+            for case_id in library.case_ids():
+                library.load(case_id)
+            print(f"load packs, {label}: {rate(args.packs, start)}")
+        
+        start = time.perf_counter()
+        summary = run_report(evidence, io.StringIO(), workers)
+        print(f"case analytics over ground-truth graphs: {rate(summary['cases'], start)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark - Case pack loading
+Writes generated case packs of increasing size and times loading one the way
+the game does: a cold load (parse, validate, write the cache), a warm load from
+the compiled cache, a load after the source was touched without changing it
+(hash check only) and building the crime scene from the loaded pack.
+Run from the repository root: python -m benchmarks.bench_case_packs
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+TYPES = ["forensic", "digital", "testimony", "physical"]
+WORDS = ["office", "diamond", "fraud", "murder", "poison", "heist", "witness", "forgery",
+         "warehouse", "hotel", "harbour", "temple", "bank", "mansion", "train", "studio"]
+
+def make_pack(case_id: str, evidence: int, suspects: int, rng: random.Random) -> dict:
+    def sentence(length: int) -> str:
+        return " ".join(rng.choice(WORDS) for _ in range(length))
+    
+    names = [f"Suspect {i}" for i in range(suspects)]
+    return {
+        "case_id": case_id,
+        "title": sentence(3).title(),
+        "status": "Active",
+        "victim": "Mr. Sharma",
+        "location": "Mumbai",
+        "date": "2024-12-20",
+        "description": sentence(40),
+        "scene": {
+            "name": sentence(4).title(),
+            "evidence": [{"id": f"ev_{i}", "name": sentence(3), "type": rng.choice(TYPES),
+                          "x": rng.randrange(1024), "y": rng.randrange(768)} for i in range(evidence)]
+        },
+        "suspects": [{"name": name, "age": rng.randint(20, 70), "occupation": sentence(2),
+                      "background": sentence(20), "personality_traits": [sentence(1) for _ in range(3)],
+                      "guilty": i == 0, "alibi": sentence(8), "secrets": [sentence(6) for _ in range(4)],
+                      "stress_triggers": [sentence(1) for _ in range(5)]} for i, name in enumerate(names)],
+        "interrogation": {
+            "suspect": names[0],
+            "evidence": [{"id": f"ex_{i}", "label": sentence(2), "description": sentence(8),
+                          "strength": round(rng.random(), 2)} for i in range(9)]
+        },
+        "briefings": {member: {"status": sentence(2), "current_task": sentence(6),
+                               "briefing": [sentence(12) for _ in range(20)], "availability": sentence(2)}
+                      for member in ("ACP", "DAYA", "ABHIJEET", "SALUNKHE")},
+        "updates": [sentence(8) for _ in range(50)]
+    }
+
+def timed(function, repeat: int = 10) -> float:
+    """Median milliseconds per call"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark case pack loading")
+    parser.add_argument("--evidence", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--suspects", type=int, default=50)
+    args = parser.parse_args()
+    
+    from src.engine.config import Config
+    from src.engine.game_state import GameStateManager
+    from src.modules.case_packs import CasePackLibrary
+    
+    Config.STATE_WARMUP_ENABLED = False
+    Config.AUTOSAVE_ENABLED = False
+    Config.AI_BACKEND = "offline"
+    pygame.init()
+    screen = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+    
+    with tempfile.TemporaryDirectory() as directory:
+        Config.CASE_PACK_DIR = os.path.join(directory, "cases")
+        Config.CASE_PACK_CACHE_DIR = os.path.join(directory, "cache")
+        os.makedirs(Config.CASE_PACK_DIR)
+        
+        for evidence in args.evidence:
+            case_id = f"BENCH_{evidence}"
+            path = os.path.join(Config.CASE_PACK_DIR, f"{case_id}.json")
+            with open(path, "w") as pack_file:
+                json.dump(make_pack(case_id, evidence, args.suspects, random.Random(evidence)), pack_file, indent=2)
+            
+            def load():
+                CasePackLibrary(Config.CASE_PACK_DIR, Config.CASE_PACK_CACHE_DIR).load(case_id)
+            
+            def load_cold():
+                cache_path = os.path.join(Config.CASE_PACK_CACHE_DIR, f"{case_id}.json.pack")
+                if os.path.exists(cache_path):
+                    os.remove(cache_path)
+                load()
+            
+            def load_touched():
+                os.utime(path)
+                load()
+            
+            def open_scene():
+                manager = GameStateManager(screen)
+                manager.open_case(case_id)
+                manager.get_state(Config.STATE_CRIME_SCENE)
+            
+            results = {
+                "cold": timed(load_cold),
+                "cached": timed(load),
+                "touched": timed(load_touched),
+                "open crime scene": timed(open_scene)
+            }
+            print(f"{evidence:>6} evidence ({os.path.getsize(path) / 1024:.0f} KiB): " +
+                  " | ".join(f"{name} {ms:.2f} ms" for name, ms in results.items()))
+    
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
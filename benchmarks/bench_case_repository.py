@@ -0,0 +1,109 @@
+"""
+Benchmark - Case archive queries
+Fills a CaseRepository with generated cases and times the queries the Case
+Files screen makes: the count on entry (first and cached), the first, a deep
+and the last page of summaries, a full case file, an FTS search (run on a
+worker thread by the screen) and a page of its matches, plus opening the
+screen itself.
+Run from the repository root: python -m benchmarks.bench_case_repository
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+WORDS = ["office", "diamond", "fraud", "murder", "poison", "heist", "kidnapping", "forgery",
+         "warehouse", "hotel", "harbour", "temple", "bank", "mansion", "train", "studio"]
+NAMES = ["Rajesh", "Priya", "Amit", "Sunita", "Vikram", "Neha", "Arjun", "Kavita", "Rohit", "Meera"]
+STATUSES = ["Active", "Cold", "Solved"]
+
+def make_case(rng: random.Random, index: int) -> dict:
+    return {
+        "case_id": f"CASE_{index:06d}",
+        "title": f"The {rng.choice(WORDS).title()} {rng.choice(WORDS).title()}",
+        "status": rng.choice(STATUSES),
+        "victim": rng.choice(NAMES),
+        "location": f"{rng.choice(WORDS).title()}, Mumbai",
+        "date": f"{rng.randint(1998, 2024)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        "evidence_count": rng.randint(0, 12),
+        "suspects": rng.sample(NAMES, rng.randint(1, 4)),
+        "description": " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 30))),
+        "progress": rng.randint(0, 100)
+    }
+
+def timed(function, repeat: int = 20) -> float:
+    """Median milliseconds per call"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CaseRepository queries")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    args = parser.parse_args()
+    
+    from src.engine.config import Config
+    from src.modules.case_repository import CaseRepository, sort_key
+    
+    Config.STATE_WARMUP_ENABLED = False
+    pygame.init()
+    screen = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+    
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            rng = random.Random(size)
+            Config.CASE_DATABASE = os.path.join(directory, f"cases_{size}.db")
+            repository = CaseRepository(Config.CASE_DATABASE)
+            
+            start = time.perf_counter()
+            repository.add_cases(make_case(rng, i) for i in range(size))
+            load_ms = (time.perf_counter() - start) * 1000
+            
+            middle = size // 2
+            middle_key = sort_key(repository.get_case(f"CASE_{middle:06d}"))
+            start = time.perf_counter()
+            repository.count("Active")
+            results = {"count active": (time.perf_counter() - start) * 1000}
+            matches = repository.search("diamond rajesh")
+            results.update({
+                "cached count": timed(lambda: repository.count("Active")),
+                "first page": timed(lambda: repository.list_cases(limit=Config.CASE_PAGE_SIZE)),
+                "middle page": timed(lambda: repository.list_cases(limit=Config.CASE_PAGE_SIZE, after=middle_key)),
+                "last page": timed(lambda: repository.list_cases(limit=Config.CASE_PAGE_SIZE, last=True)),
+                "title page": timed(lambda: repository.list_cases("Cold", Config.CASE_PAGE_SIZE, "title")),
+                "case file": timed(lambda: repository.get_case(f"CASE_{middle:06d}")),
+                "search (worker)": timed(lambda: repository.search("diamond rajesh")),
+                "match page": timed(lambda: repository.summaries(matches[len(matches) // 2:][:Config.CASE_PAGE_SIZE]))
+            })
+            repository.close()
+            
+            # Opening the screen: enter() plus its first full render
+            from src.engine.game_state import GameStateManager
+            manager = GameStateManager(screen)
+            
+            def open_case_files():
+                manager.change_state(Config.STATE_CASE_FILES)
+                manager.render()
+                manager.change_state(Config.STATE_BUREAU)
+            
+            open_case_files()  # build the state and open its database once
+            results["open screen"] = timed(open_case_files, repeat=10)
+            manager.get_state(Config.STATE_CASE_FILES).repository.close()
+            
+            print(f"{size:>7} cases (load {load_ms:.0f} ms): " +
+                  " | ".join(f"{name} {ms:.3f} ms" for name, ms in results.items()))
+    
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
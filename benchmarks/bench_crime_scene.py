@@ -0,0 +1,130 @@
+"""
+Benchmark - Crime scenes with many markers
+Opens generated cases whose scenes grow with their marker count (about one
+marker per 120x120 pixels of floor) and times the work behind input: click hit
+tests on and off the markers (grid against the old distance scan over every
+marker), a hover move with its dirty-rect redraw, a Space collection, a full
+redraw and a frame of panning and zooming. Panning frames should cost about
+the same whatever the scene size.
+Run from the repository root: python -m benchmarks.bench_crime_scene
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import statistics
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+def timed(function, repeat: int = 200) -> float:
+    """Median milliseconds per call"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+def linear_hit(evidence_list, pos):
+    """The scan the grid replaced: square root distance to every marker"""
+    for evidence in evidence_list:
+        if not evidence["found"]:
+            distance = ((pos[0] - evidence["x"]) ** 2 + (pos[1] - evidence["y"]) ** 2) ** 0.5
+            if distance < 50:
+                return evidence
+    return None
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark crime scene hit testing and camera frames")
+    parser.add_argument("--markers", type=int, nargs="+", default=[100, 1000, 10000, 100000])
+    parser.add_argument("--spacing", type=int, default=120, help="floor pixels per marker along each axis")
+    args = parser.parse_args()
+    
+    from benchmarks.bench_case_packs import make_pack
+    from src.engine.config import Config
+    from src.engine.game_state import GameStateManager
+    
+    Config.STATE_WARMUP_ENABLED = False
+    Config.AUTOSAVE_ENABLED = False
+    Config.AI_BACKEND = "offline"
+    pygame.init()
+    screen = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+    
+    with tempfile.TemporaryDirectory() as directory:
+        Config.CASE_PACK_DIR = directory
+        Config.CASE_PACK_CACHE_DIR = None
+        
+        for markers in args.markers:
+            rng = random.Random(markers)
+            case_id = f"BENCH_{markers}"
+            pack = make_pack(case_id, markers, 1, rng)
+            side = int(math.sqrt(markers) * args.spacing)
+            width, height = max(Config.SCREEN_WIDTH, side * 4 // 3), max(Config.SCREEN_HEIGHT, side * 3 // 4)
+            pack["scene"].update(width=width, height=height)
+            for evidence in pack["scene"]["evidence"]:
+                evidence["x"], evidence["y"] = rng.randrange(width), rng.randrange(height)
+            with open(os.path.join(directory, f"{case_id}.json"), "w") as pack_file:
+                json.dump(pack, pack_file)
+            
+            manager = GameStateManager(screen)
+            manager.open_case(case_id)
+            manager.change_state(Config.STATE_CRIME_SCENE)
+            scene = manager.current_state
+            manager.render()
+            
+            # Random clicks over the scene
+            points = [(rng.randrange(Config.SCREEN_WIDTH), rng.randrange(Config.SCREEN_HEIGHT)) for _ in range(200)]
+            point = iter(points * 1000)
+            
+            def hover():
+                manager.handle_event(pygame.event.Event(pygame.MOUSEMOTION, pos=next(point), rel=(0, 0), buttons=(0, 0, 0)))
+                manager.render()
+            
+            def full_redraw():
+                scene.invalidate()
+                manager.render()
+            
+            direction = [7]
+            
+            def pan_frame():
+                # Sweep back and forth so new tiles keep scrolling into view
+                if not scene.camera.pan(direction[0], direction[0] // 2):
+                    direction[0] = -direction[0]
+                scene._camera_moved()
+                manager.render()
+            
+            zoom_step = [1]
+            
+            def zoom_frame():
+                if not scene.camera.zoom_at(zoom_step[0], scene.camera.viewport.center):
+                    zoom_step[0] = -zoom_step[0]
+                scene._camera_moved()
+                manager.render()
+            
+            # A click on empty floor: the old scan visits every marker
+            miss = (-Config.SCREEN_WIDTH, -Config.SCREEN_HEIGHT)
+            results = {
+                "grid hit": timed(lambda: scene._evidence_at(next(point))),
+                "linear hit": timed(lambda: linear_hit(scene.available_evidence, next(point))),
+                "grid miss": timed(lambda: scene._evidence_at(miss)),
+                "linear miss": timed(lambda: linear_hit(scene.available_evidence, miss)),
+                "hover + redraw": timed(hover),
+                "full redraw": timed(full_redraw, repeat=20),
+                "pan frame": timed(pan_frame, repeat=300),
+                "zoom frame": timed(zoom_frame, repeat=50),
+                "space collect": timed(lambda: scene._investigate_nearby_evidence(), repeat=min(markers, 200))
+            }
+            tiles = scene.tiles
+            print(f"{markers:>6} markers, {width}x{height} scene (tile hit rate "
+                  f"{tiles.hits / max(1, tiles.hits + tiles.misses):.0%}): " + " | ".join(f"{name} {ms:.3f} ms" for name, ms in results.items()))
+    
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
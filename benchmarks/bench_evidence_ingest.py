@@ -0,0 +1,89 @@
+"""
+Benchmark - Bulk evidence ingestion into EvidenceGraph
+Run from the repository root: python -m benchmarks.bench_evidence_ingest
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from src.modules.evidence_graph import EvidenceGraph
+from src.modules.evidence_io import read_jsonl
+
+EVIDENCE_TYPES = ["forensic", "witness", "digital", "physical"]
+CONNECTION_TYPES = list(EvidenceGraph.CONNECTION_TYPE_STRENGTHS)
+
+def generate_nodes(count: int):
+    for i in range(count):
+        yield (f"ev_{i}", EVIDENCE_TYPES[i % len(EVIDENCE_TYPES)], f"Evidence item {i}", f"Floor {i % 40}")
+
+def generate_connections(count: int, node_count: int, seed: int):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield (f"ev_{rng.randrange(node_count)}", f"ev_{rng.randrange(node_count)}", rng.choice(CONNECTION_TYPES))
+
+def bench_bulk(node_count: int, connection_count: int, seed: int):
+    graph = EvidenceGraph()
+    
+    # Materialize records first so the timing covers ingestion only
+    records = list(generate_connections(connection_count, node_count, seed))
+    
+    start = time.perf_counter()
+    graph.add_evidence_bulk(generate_nodes(node_count))
+    nodes_done = time.perf_counter()
+    added = graph.connect_bulk(records)
+    end = time.perf_counter()
+    
+    print(f"bulk: {node_count:,} nodes in {nodes_done - start:.2f}s, "
+          f"{connection_count:,} connections ({added:,} after dedupe) in {end - nodes_done:.2f}s "
+          f"-> {connection_count / (end - nodes_done):,.0f} connections/s, score {graph.deduction_score:.1f}")
+
+def bench_jsonl(node_count: int, connection_count: int, seed: int):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "connections.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            for from_id, to_id, connection_type in generate_connections(connection_count, node_count, seed):
+                f.write(json.dumps({"from": from_id, "to": to_id, "type": connection_type}) + "\n")
+        
+        graph = EvidenceGraph()
+        graph.add_evidence_bulk(generate_nodes(node_count))
+        start = time.perf_counter()
+        added = graph.connect_bulk(read_jsonl(path))
+        elapsed = time.perf_counter() - start
+    
+    print(f"jsonl: {connection_count:,} connections streamed from disk ({added:,} after dedupe) "
+          f"in {elapsed:.2f}s -> {connection_count / elapsed:,.0f} connections/s")
+
+def bench_per_item(node_count: int, connection_count: int, seed: int):
+    graph = EvidenceGraph()
+    for record in generate_nodes(node_count):
+        graph.add_evidence(*record)
+    
+    start = time.perf_counter()
+    for from_id, to_id, connection_type in generate_connections(connection_count, node_count, seed):
+        graph.connect_evidence(from_id, to_id, connection_type)
+    elapsed = time.perf_counter() - start
+    
+    print(f"per-item: {connection_count:,} connect_evidence calls in {elapsed:.2f}s "
+          f"-> {connection_count / elapsed:,.0f} connections/s")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark EvidenceGraph bulk ingestion")
+    parser.add_argument("--nodes", type=int, default=100_000)
+    parser.add_argument("--connections", type=int, default=1_000_000)
+    parser.add_argument("--per-item-connections", type=int, default=None,
+                        help="connections for the per-item baseline (default: --connections)")
+    parser.add_argument("--jsonl", action="store_true", help="also time streaming ingestion from a JSON lines file")
+    parser.add_argument("--seed", type=int, default=1203)
+    args = parser.parse_args()
+    
+    bench_bulk(args.nodes, args.connections, args.seed)
+    if args.jsonl:
+        bench_jsonl(args.nodes, args.connections, args.seed)
+    bench_per_item(args.nodes, args.per_item_connections or args.connections, args.seed)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark - EvidenceGraph snapshots and undo versus deep copies
+Run from the repository root: python -m benchmarks.bench_evidence_snapshots
+"""
+
+import argparse
+import copy
+import random
+import time
+import tracemalloc
+
+from benchmarks.bench_evidence_ingest import generate_connections, generate_nodes, CONNECTION_TYPES
+from src.modules.evidence_graph import EvidenceGraph
+
+def build_graph(node_count: int, connection_count: int, seed: int) -> EvidenceGraph:
+    graph = EvidenceGraph()
+    graph.add_evidence_bulk(generate_nodes(node_count))
+    graph.connect_bulk(generate_connections(connection_count, node_count, seed))
+    return graph
+
+def measure_memory(action) -> int:
+    """Bytes still allocated after running action"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = action()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del result
+    return sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark EvidenceGraph snapshots")
+    parser.add_argument("--nodes", type=int, default=20_000)
+    parser.add_argument("--connections", type=int, default=100_000)
+    parser.add_argument("--changes", type=int, default=1_000, help="player actions between snapshot and revert")
+    parser.add_argument("--seed", type=int, default=1203)
+    args = parser.parse_args()
+    
+    graph = build_graph(args.nodes, args.connections, args.seed)
+    print(f"graph: {args.nodes:,} nodes, {len(graph.connections):,} connections")
+    
+    # Snapshot cost
+    iterations = 100_000
+    start = time.perf_counter()
+    for _ in range(iterations):
+        version = graph.snapshot()
+    snapshot_us = (time.perf_counter() - start) / iterations * 1e6
+    
+    start = time.perf_counter()
+    copy.deepcopy(graph)
+    deepcopy_ms = (time.perf_counter() - start) * 1000
+    deepcopy_bytes = measure_memory(lambda: copy.deepcopy(graph))
+    print(f"snapshot(): {snapshot_us:.3f} us | deepcopy: {deepcopy_ms:.1f} ms, {deepcopy_bytes / 1e6:.1f} MB")
+    
+    # Journal overhead and revert cost for a burst of player actions
+    rng = random.Random(args.seed)
+    
+    def play():
+        for _ in range(args.changes):
+            from_id = f"ev_{rng.randrange(args.nodes)}"
+            to_id = f"ev_{rng.randrange(args.nodes)}"
+            graph.connect_evidence(from_id, to_id, rng.choice(CONNECTION_TYPES))
+    
+    journal_bytes = measure_memory(play)
+    branch = graph.snapshot()
+    start = time.perf_counter()
+    graph.revert(version)
+    revert_ms = (time.perf_counter() - start) * 1000
+    
+    start = time.perf_counter()
+    graph.revert(branch)
+    redo_ms = (time.perf_counter() - start) * 1000
+    
+    # A second what-if branch from the same snapshot, then back to the first one
+    graph.revert(version)
+    play()
+    start = time.perf_counter()
+    graph.revert(branch)
+    switch_ms = (time.perf_counter() - start) * 1000
+    
+    print(f"{args.changes:,} actions: journal + new connections {journal_bytes / 1e3:.1f} KB | "
+          f"revert {revert_ms:.2f} ms | redo {redo_ms:.2f} ms | switch branch {switch_ms:.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark - Batch interrogation simulator against the interactive engine
+Times InterrogationEngine.ask_question with offline replies (one question at
+a time, as the game asks them), StressModel.ask putting one question to a
+board of suspects at once, and the vectorized simulator over batches of
+generated suspects, up to at least a million simulated questions.
+Run from the repository root: python -m benchmarks.bench_interrogation_sim
+"""
+
+import argparse
+import time
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the batch interrogation simulator")
+    parser.add_argument("--cases", type=int, default=2000)
+    parser.add_argument("--turns", type=int, default=30)
+    parser.add_argument("--engine-questions", type=int, default=20000, help="questions asked through the engine")
+    parser.add_argument("--board", type=int, nargs="+", default=[10, 1000, 10000], help="suspects per StressModel")
+    parser.add_argument("--repeats", type=int, nargs="+", default=[1, 10, 50])
+    args = parser.parse_args()
+    
+    from src.modules.case_generator import CaseGenerator
+    from src.modules.case_packs import interrogation_evidence, suspect_profile
+    from src.modules.interrogation import InterrogationEngine
+    from src.modules.interrogation_sim import InterrogationSimulator, RandomPolicy, SessionBatch
+    from src.modules.stress_model import StressModel
+    
+    generator = CaseGenerator(seed=1)
+    packs = [generator.generate(index) for index in range(args.cases)]
+    
+    engine = InterrogationEngine("offline")
+    asked = 0
+    start = time.perf_counter()
+    for pack in packs:
+        engine.start_interrogation(suspect_profile(pack, pack["interrogation"]["suspect"]),
+                                   interrogation_evidence(pack))
+        for _ in range(args.turns):
+            engine.ask_question("Where were you that night? Admit it", "DAYA")
+            asked += 1
+        if asked >= args.engine_questions:
+            break
+    elapsed = time.perf_counter() - start
+    print(f"engine: {asked} questions in {elapsed:.2f} s ({asked / elapsed:,.0f} turns/s)")
+    
+    suspects = [suspect_profile(pack, suspect["name"]) for pack in packs for suspect in pack["suspects"]]
+    evidence = interrogation_evidence(packs[0])
+    questions = [f"Where were you that night? What about {suspect.stress_triggers[0]}?"
+                 for suspect in suspects[:args.turns]]
+    for size in args.board:
+        board = (suspects * (size // len(suspects) + 1))[:size]
+        start = time.perf_counter()
+        model = StressModel.for_suspects(board, evidence)
+        built = time.perf_counter() - start
+        start = time.perf_counter()
+        for turn, question in enumerate(questions):
+            model.ask(question, "ACP", evidence[turn % len(evidence)].id)
+        elapsed = time.perf_counter() - start
+        turns = size * len(questions)
+        print(f"stress model: {size} suspects, build {built * 1000:.1f} ms, {len(questions)} questions in "
+              f"{elapsed:.3f} s ({turns / elapsed:,.0f} turns/s)")
+    
+    simulator = InterrogationSimulator()
+    base = SessionBatch.from_packs(packs)
+    for repeat in args.repeats:
+        batch = base.repeat(repeat)
+        result = simulator.run(batch, RandomPolicy(), args.turns, seed=repeat)
+        turns = len(batch) * args.turns
+        summary = result.questions_to_breakthrough()
+        print(f"simulator: {len(batch)} sessions x {args.turns} = {turns:,} turns in {result.elapsed:.2f} s "
+              f"({turns / result.elapsed:,.0f} turns/s), median {summary.get('median')} questions to breakthrough")
+
+if __name__ == "__main__":
+    main()
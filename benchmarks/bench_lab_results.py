@@ -0,0 +1,66 @@
+"""
+Benchmark - Lab result store under a memory budget
+Stores many enhancement results with full-size original/enhanced images,
+then reads them back in random order, with memory-mapped and compressed
+spill files: time per put and per buffer read, bytes kept in memory and on
+disk, and the process's peak memory.
+Run from the repository root: python -m benchmarks.bench_lab_results
+"""
+
+import argparse
+import random
+import resource
+import tempfile
+import time
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the lab result store")
+    parser.add_argument("--results", type=int, default=24)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    parser.add_argument("--budget-mb", type=int, default=64)
+    parser.add_argument("--reads", type=int, default=200)
+    args = parser.parse_args()
+    
+    import numpy as np
+    from src.modules.lab_results import LabResultStore
+    
+    # Camera-like frame: smooth gradient plus sensor noise
+    rng = np.random.default_rng(1)
+    gradient = np.linspace(0, 160, args.width, dtype=np.float32)[None, :, None]
+    base = (gradient + rng.normal(0, 12, (args.height, args.width, 3))).clip(0, 255).astype(np.uint8)
+    image_mb = base.nbytes * 2 / 2 ** 20
+    print(f"{args.results} results x {image_mb:.1f} MB of images = {args.results * image_mb:,.0f} MB, "
+          f"budget {args.budget_mb} MB")
+    
+    for compress in (False, True):
+        with tempfile.TemporaryDirectory() as directory:
+            store = LabResultStore(args.budget_mb * 2 ** 20, directory, compress)
+            start = time.perf_counter()
+            for index in range(args.results):
+                store.put(f"result_{index}", {
+                    "original": base.copy(),
+                    "enhanced": np.roll(base, index, axis=1),
+                    "faces_detected": index % 3,
+                    "enhancement_score": 0.5
+                })
+            put_ms = (time.perf_counter() - start) * 1000 / args.results
+            
+            reader = random.Random(1)
+            start = time.perf_counter()
+            for _ in range(args.reads):
+                image = store.get(f"result_{reader.randrange(args.results)}")["enhanced"]
+                int(image[args.height // 2].sum())  # touch a row, as drawing a thumbnail would
+            read_ms = (time.perf_counter() - start) * 1000 / args.reads
+            
+            disk_mb = store.disk_bytes / 2 ** 20
+            print(f"{'compressed .npz' if compress else 'memory-mapped .npy':>18}: put {put_ms:7.2f} ms, "
+                  f"read {read_ms:6.2f} ms, resident {store.resident_bytes / 2 ** 20:5.1f} MB, "
+                  f"disk {disk_mb:7.1f} MB, spills {store.spills}, reloads {store.reloads}")
+            store.close()
+    
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"peak RSS {peak:,.0f} MB")
+
+if __name__ == "__main__":
+    main()
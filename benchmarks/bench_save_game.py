@@ -0,0 +1,102 @@
+"""
+Benchmark - Save and load of large sessions
+Builds sessions with big evidence graphs and long interrogation transcripts,
+then times a full save, an incremental autosave after a small change (main
+thread snapshot and background write) and loading the session back.
+Run from the repository root: python -m benchmarks.bench_save_game
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+TYPES = ["forensic", "digital", "testimony", "physical"]
+CONNECTION_TYPES = ["location_match", "time_correlation", "physical_match", "witness_testimony", "forensic_match"]
+WORDS = ["suspect", "alibi", "office", "money", "victim", "promotion", "evidence", "night",
+         "desk", "argument", "witness", "security", "camera", "phone", "call", "debt"]
+
+def build_session(manager, nodes: int, transcript_entries: int, rng: random.Random):
+    from src.engine.config import Config
+    
+    manager.evidence_graph.add_evidence_bulk(
+        (f"ev_{i}", rng.choice(TYPES), f"Exhibit {i}", f"Room {i % 200}", rng.random() < 0.3)
+        for i in range(nodes)
+    )
+    manager.evidence_graph.connect_bulk(
+        ((f"ev_{rng.randrange(nodes)}", f"ev_{rng.randrange(nodes)}", rng.choice(CONNECTION_TYPES))
+         for _ in range(nodes * 2)),
+        deduplicate=False
+    )
+    
+    room = manager.get_state(Config.STATE_INTERROGATION)
+    for i in range(transcript_entries):
+        line = " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 30)))
+        room._add_line(f"SUSPECT: {line}" if i % 2 else f"ACP Pradyuman: {line}")
+    
+    lab = manager.get_state(Config.STATE_LAB)
+    for i in range(50):
+        lab.analysis_results[f"analysis_{i}"] = {"status": "Complete", "progress": 100,
+                                                 "result": f"Result {i}", "evidence_id": f"ev_{i}"}
+    lab.mark_unsaved()
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SaveGame on large sessions")
+    parser.add_argument("--nodes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--transcript", type=int, default=5000, help="interrogation transcript entries")
+    args = parser.parse_args()
+    
+    from src.engine.config import Config
+    from src.engine.game_state import GameStateManager
+    from src.modules.save_game import CODEC_MSGPACK
+    
+    Config.STATE_WARMUP_ENABLED = False
+    Config.AI_BACKEND = "offline"
+    pygame.init()
+    screen = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+    
+    with tempfile.TemporaryDirectory() as directory:
+        for nodes in args.nodes:
+            Config.SAVE_PATH = os.path.join(directory, f"session_{nodes}.cid")
+            manager = GameStateManager(screen)
+            build_session(manager, nodes, args.transcript, random.Random(nodes))
+            save_game = manager.save_game
+            
+            # Full save: every section is dirty
+            start = time.perf_counter()
+            manager.autosave()
+            snapshot_ms = (time.perf_counter() - start) * 1000
+            save_game.flush()
+            full_ms = save_game.last_save_ms
+            
+            # Incremental: only the lab changed, the rest reuses encoded bytes
+            lab = manager.get_state(Config.STATE_LAB)
+            lab.analysis_results["analysis_0"]["result"] = "Revised"
+            lab.mark_unsaved()
+            start = time.perf_counter()
+            sections = manager.autosave()
+            incremental_snapshot_ms = (time.perf_counter() - start) * 1000
+            save_game.flush()
+            incremental_ms = save_game.last_save_ms
+            
+            # Load into a fresh manager
+            loader = GameStateManager(screen)
+            start = time.perf_counter()
+            loader.load_game()
+            load_ms = (time.perf_counter() - start) * 1000
+            
+            codec = "msgpack" if save_game.codec == CODEC_MSGPACK else "json"
+            print(f"{nodes:>6} nodes, {args.transcript} lines ({codec}, {save_game.last_size / 1024:.0f} KiB): "
+                  f"full save {snapshot_ms:.1f} ms snapshot + {full_ms:.1f} ms write | "
+                  f"autosave {sections} {incremental_snapshot_ms:.2f} ms snapshot + {incremental_ms:.1f} ms write | "
+                  f"load {load_ms:.1f} ms (read+decode {loader.save_game.last_load_ms:.1f} ms)")
+    
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
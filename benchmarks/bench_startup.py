@@ -0,0 +1,43 @@
+"""
+Benchmark - Engine startup cost
+Times GameStateManager construction with the SDL dummy video driver.
+Run from the repository root: python -m benchmarks.bench_startup
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark GameStateManager startup")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    
+    start = time.perf_counter()
+    from src.engine.game_state import GameStateManager
+    from src.engine.config import Config
+    import_ms = (time.perf_counter() - start) * 1000
+    
+    pygame.init()
+    screen = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+    
+    timings = []
+    for _ in range(args.runs):
+        pygame.font.quit()  # make every run pay for font loading again
+        start = time.perf_counter()
+        manager = GameStateManager(screen)
+        timings.append((time.perf_counter() - start) * 1000)
+    
+    fonts = getattr(manager, "fonts", None)
+    font_loads = fonts.load_count if fonts else "n/a"
+    print(f"import: {import_ms:.1f} ms | construct: median {statistics.median(timings):.2f} ms, "
+          f"max {max(timings):.2f} ms over {args.runs} runs | font loads per manager: {font_loads}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
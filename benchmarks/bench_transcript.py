@@ -0,0 +1,65 @@
+"""
+Benchmark - Interrogation transcript scrolling
+Fills a TranscriptView with thousands of exchanges and times frames while
+scrolling through it, to check per-frame cost stays flat as history grows.
+Run from the repository root: python -m benchmarks.bench_transcript
+"""
+
+import argparse
+import os
+import random
+import statistics
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+WORDS = ["suspect", "alibi", "office", "money", "victim", "promotion", "evidence", "night",
+         "desk", "argument", "witness", "security", "camera", "phone", "call", "debt"]
+
+def make_line(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 40)))
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark TranscriptView scrolling")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+    
+    from src.engine.config import Config
+    from src.engine.transcript_view import TranscriptView
+    
+    pygame.init()
+    screen = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+    font = pygame.font.Font(None, 36)
+    palette = {"suspect": Config.WHITE, "team": Config.CID_GRAY}
+    
+    for size in args.sizes:
+        rng = random.Random(size)
+        view = TranscriptView(font, (60, 180, Config.SCREEN_WIDTH - 120, 280), palette)
+        
+        start = time.perf_counter()
+        for i in range(size):
+            view.append(make_line(rng), "suspect" if i % 2 else "team")
+        append_ms = (time.perf_counter() - start) * 1000
+        
+        # Scroll from the newest entry back toward the top, one smooth step per frame
+        timings = []
+        for frame in range(args.frames):
+            if frame % 10 == 0:
+                view.page(-1)
+            start = time.perf_counter()
+            view.update(1 / 60)
+            view.render(screen)
+            timings.append((time.perf_counter() - start) * 1000)
+        
+        timings.sort()
+        print(f"{size:>6} entries ({view.total_lines} lines): append {append_ms:.0f} ms | "
+              f"frame median {statistics.median(timings):.3f} ms, "
+              f"p99 {timings[int(len(timings) * 0.99) - 1]:.3f} ms")
+    
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -1,59 +1,18 @@
-<<<<<<< HEAD
 """
 CID: The Silicon Casefiles
 Main entry point for the detective simulation game
 """
 
-import pygame
-import sys
-from src.engine.game_state import GameStateManager
-from src.engine.config import Config
-
-def main():
-    """Initialize and run the game"""
-    pygame.init()
-    
-    # Initialize display
-    screen = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
-    pygame.display.set_caption("CID: The Silicon Casefiles")
-    
-    # Initialize game state manager
-    game_state_manager = GameStateManager(screen)
-    
-    # Game loop
-    clock = pygame.time.Clock()
-    running = True
-    
-    while running:
-        dt = clock.tick(Config.FPS) / 1000.0
-        
-        # Handle events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            else:
-                game_state_manager.handle_event(event)
-        
-        # Update game state
-        game_state_manager.update(dt)
-        
-        # Render
-        game_state_manager.render()
-        pygame.display.flip()
-    
-    pygame.quit()
-    sys.exit()
+import time
 
-if __name__ == "__main__":
-=======
-"""
-CID: The Silicon Casefiles
-Main entry point for the detective simulation game
-"""
+# Taken before the heavy imports so the startup telemetry event covers them
+PROCESS_START = time.perf_counter()
 
 import pygame
 import sys
+from src.engine.game_loop import GameLoop
 from src.engine.game_state import GameStateManager
+from src.engine.replay import InputRecorder
 from src.engine.config import Config
 
 def main():
@@ -64,33 +23,21 @@ def main():
     screen = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
     pygame.display.set_caption("CID: The Silicon Casefiles")
     
+    # Seed RNGs and record input when CID_RECORD is set
+    recorder = InputRecorder.from_environment()
+    
     # Initialize game state manager
     game_state_manager = GameStateManager(screen)
+    game_state_manager.recorder = recorder
     
     # Game loop
-    clock = pygame.time.Clock()
-    running = True
-    
-    while running:
-        dt = clock.tick(Config.FPS) / 1000.0
-        
-        # Handle events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            else:
-                game_state_manager.handle_event(event)
-        
-        # Update game state
-        game_state_manager.update(dt)
-        
-        # Render
-        game_state_manager.render()
-        pygame.display.flip()
+    game_loop = GameLoop(game_state_manager)
+    game_loop.run_frame()
+    game_state_manager.telemetry.emit("startup", first_frame_ms=round((time.perf_counter() - PROCESS_START) * 1000, 1))
+    game_loop.run()
     
     pygame.quit()
     sys.exit()
 
 if __name__ == "__main__":
->>>>>>> 48f43f693cdb2cc0d8bb427d4a3a3d510711a451
     main()
\ No newline at end of file
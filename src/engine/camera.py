@@ -0,0 +1,90 @@
+"""
+Camera - Pan and zoom over a world larger than the screen
+World coordinates are scene pixels at zoom 1. The camera keeps the world
+position shown at the viewport's top-left corner and snaps zoom to fixed
+levels, so background tiles rendered for a level can be reused.
+"""
+
+from typing import Tuple
+
+import pygame
+
+class Camera:
+    """Maps world coordinates onto a screen viewport"""
+    
+    ZOOM_LEVELS = (0.5, 0.75, 1.0, 1.5, 2.0)
+    
+    def __init__(self, viewport: pygame.Rect, world_width: int, world_height: int):
+        self.viewport = pygame.Rect(viewport)
+        self.world_width = world_width
+        self.world_height = world_height
+        self.zoom_index = self.ZOOM_LEVELS.index(1.0)
+        self.x = 0.0
+        self.y = 0.0
+        self.clamp()
+    
+    @property
+    def zoom(self) -> float:
+        return self.ZOOM_LEVELS[self.zoom_index]
+    
+    @property
+    def offset(self) -> Tuple[int, int]:
+        """Top-left of the viewport in zoomed world pixels (whole pixels, so tiles line up)"""
+        return round(self.x * self.zoom), round(self.y * self.zoom)
+    
+    def world_to_screen(self, x: float, y: float) -> Tuple[int, int]:
+        offset_x, offset_y = self.offset
+        zoom = self.zoom
+        return (round(x * zoom) - offset_x + self.viewport.x,
+                round(y * zoom) - offset_y + self.viewport.y)
+    
+    def screen_to_world(self, x: float, y: float) -> Tuple[float, float]:
+        offset_x, offset_y = self.offset
+        zoom = self.zoom
+        return ((x - self.viewport.x + offset_x) / zoom,
+                (y - self.viewport.y + offset_y) / zoom)
+    
+    def world_rect(self, rect: pygame.Rect) -> Tuple[float, float, float, float]:
+        """A screen rect as (left, top, width, height) in world coordinates"""
+        left, top = self.screen_to_world(rect.left, rect.top)
+        return left, top, rect.width / self.zoom, rect.height / self.zoom
+    
+    def clamp(self):
+        """Keep the view inside the world, centring axes where the world is smaller than the view"""
+        visible_width = self.viewport.width / self.zoom
+        visible_height = self.viewport.height / self.zoom
+        if self.world_width <= visible_width:
+            self.x = (self.world_width - visible_width) / 2
+        else:
+            self.x = min(max(self.x, 0.0), self.world_width - visible_width)
+        if self.world_height <= visible_height:
+            self.y = (self.world_height - visible_height) / 2
+        else:
+            self.y = min(max(self.y, 0.0), self.world_height - visible_height)
+    
+    def pan(self, dx: float, dy: float) -> bool:
+        """Move the view by screen pixels; True when it moved"""
+        before = self.offset
+        self.x += dx / self.zoom
+        self.y += dy / self.zoom
+        self.clamp()
+        return self.offset != before
+    
+    def zoom_at(self, step: int, screen_pos: Tuple[int, int]) -> bool:
+        """Change zoom level by step, keeping the world point under screen_pos in place"""
+        index = min(max(self.zoom_index + step, 0), len(self.ZOOM_LEVELS) - 1)
+        if index == self.zoom_index:
+            return False
+        
+        world_x, world_y = self.screen_to_world(*screen_pos)
+        self.zoom_index = index
+        self.x = world_x - (screen_pos[0] - self.viewport.x) / self.zoom
+        self.y = world_y - (screen_pos[1] - self.viewport.y) / self.zoom
+        self.clamp()
+        return True
+    
+    def reset(self):
+        """Zoom 1, top-left corner of the world"""
+        self.zoom_index = self.ZOOM_LEVELS.index(1.0)
+        self.x = self.y = 0.0
+        self.clamp()
@@ -8,6 +8,64 @@ class Config:
     SCREEN_HEIGHT = 720
     FPS = 60
     
+    # Frame pacing: simulation step in seconds (None for variable dt), the cap
+    # on catch-up updates per frame, and how long an idle frame waits for input
+    FIXED_TIMESTEP = 1 / 60
+    MAX_UPDATES_PER_FRAME = 5
+    IDLE_WAIT_MS = 500
+    
+    # Fonts shared by every state: name -> (font file or None for default, size)
+    FONTS = {
+        "body": (None, 36),
+        "title": (None, 48)
+    }
+    
+    # Rendered text surfaces kept by the shared text cache
+    TEXT_CACHE_SIZE = 1024
+    
+    # Wrapped paragraphs kept by the shared text layout cache
+    TEXT_LAYOUT_CACHE_SIZE = 256
+    
+    # Case archive (SQLite) and how many case summaries are fetched per query
+    CASE_DATABASE = "data/cases.db"
+    CASE_PAGE_SIZE = 50
+    # Searches rank every match, so they run on a worker thread (headless runs and replays search
+    # inline, so results show up on the same frame every time)
+    CASE_SEARCH_THREADED = True
+    
+    # Case packs (JSON/YAML) and their compiled cache; DEFAULT_CASE is played until another is opened
+    CASE_PACK_DIR = "src/assets/cases"
+    CASE_PACK_CACHE_DIR = "data/cache"
+    DEFAULT_CASE = "CASE_001"
+    
+    # Crime scene background tiles (pixels) and how many stay cached across zoom levels
+    SCENE_TILE_SIZE = 256
+    SCENE_TILE_CACHE = 96
+    
+    # Lab results: memory for image buffers before the least recently viewed are spilled to disk
+    # (memory-mapped .npy files, or compressed .npz with LAB_RESULT_COMPRESS)
+    LAB_RESULT_MEMORY_BUDGET = 64 * 1024 * 1024
+    LAB_RESULT_SPILL_DIR = "data/lab_results"
+    LAB_RESULT_COMPRESS = False
+    
+    # Save file ("Load Case" in the menu); autosaves run on state changes and on this interval
+    SAVE_PATH = "data/savegame.cid"
+    AUTOSAVE_ENABLED = True
+    AUTOSAVE_INTERVAL = 30.0
+    
+    # Profiler (F3 toggles the overlay, F4 exports; see src/engine/profiler.py)
+    PROFILER_MAX_SAMPLES = 36000  # ten minutes at 60 FPS
+    PROFILER_GRAPH_FRAMES = 240
+    PROFILER_EXPORT_PATH = "profile_trace.json"
+    
+    # Telemetry (CID_TELEMETRY=1 or a .jsonl path; see src/engine/telemetry.py): rolling JSON lines
+    # file, in-memory ring buffer size and the fraction of each event type kept
+    TELEMETRY_PATH = "data/telemetry.jsonl"
+    TELEMETRY_MAX_BYTES = 5 * 1024 * 1024
+    TELEMETRY_BACKUPS = 3
+    TELEMETRY_RING_SIZE = 2000
+    TELEMETRY_SAMPLING = {"frame": 1 / 60}  # about one frame stats event per second
+    
     # Colors (CID theme - dark blues and grays)
     BLACK = (0, 0, 0)
     WHITE = (255, 255, 255)
@@ -25,6 +83,13 @@ class Config:
     STATE_CASE_FILES = "case_files"
     STATE_TEAM_BRIEFING = "team_briefing"
     
+    # States whose modules (and case pack) are loaded in the background after entering a state
+    STATE_WARMUP_ENABLED = True
+    STATE_WARMUP = {
+        STATE_MENU: [STATE_BUREAU],
+        STATE_BUREAU: [STATE_CRIME_SCENE, STATE_LAB, STATE_INTERROGATION, STATE_CASE_FILES, STATE_TEAM_BRIEFING]
+    }
+    
     # Team members
     TEAM_MEMBERS = {
         "ACP": {"name": "ACP Pradyuman", "specialty": "Logic & Leadership"},
@@ -34,5 +99,6 @@ class Config:
     }
     
     # API Configuration
+    AI_BACKEND = "ollama"  # "ollama", "gemini" or "offline" (scripted fallback replies)
     GEMINI_API_KEY = None  # Set this in environment or config file
     OLLAMA_BASE_URL = "http://localhost:11434"
\ No newline at end of file
@@ -0,0 +1,27 @@
+"""
+Font Registry - Loads each configured font once for the whole engine
+"""
+
+import pygame
+from src.engine.config import Config
+from src.engine.profiler import CountingFont
+
+class FontRegistry:
+    """Shares font objects between states instead of loading them per state"""
+    
+    def __init__(self, font_specs=None):
+        self.font_specs = font_specs or Config.FONTS
+        self._fonts = {}
+        self.load_count = 0
+    
+    def get(self, name: str) -> pygame.font.Font:
+        """Return the named font, loading it on first use"""
+        font = self._fonts.get(name)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            face, size = self.font_specs[name]
+            font = CountingFont(face, size)
+            self._fonts[name] = font
+            self.load_count += 1
+        return font
@@ -0,0 +1,96 @@
+"""
+Game Loop - Frame pacing for the main loop
+Runs simulation on a fixed timestep, renders once per frame and sleeps in
+pygame.event.wait while the current state has nothing to animate.
+"""
+
+import time
+import pygame
+from src.engine.config import Config
+
+class GameLoop:
+    """Drives a GameStateManager with fixed-step updates and idle-aware pacing"""
+    
+    def __init__(self, state_manager):
+        self.state_manager = state_manager
+        self.clock = pygame.time.Clock()
+        self.running = True
+        self.frames = 0
+        self.idle_frames = 0
+        
+        # Simulation time not yet consumed by fixed-step updates
+        self._accumulator = 0.0
+    
+    def run(self):
+        """Run frames until the game quits"""
+        while self.running:
+            self.run_frame()
+        
+        self.state_manager.close()
+        if self.state_manager.recorder:
+            self.state_manager.recorder.close()
+        
+        profiler = self.state_manager.profiler
+        if profiler.export_path and profiler.samples:
+            print(f"Profile written to {profiler.export()}")
+    
+    def run_frame(self):
+        """Process input, advance the simulation and present one frame"""
+        idle = self.state_manager.is_idle()
+        events = []
+        if idle:
+            # Nothing is moving: block until input arrives (or the timeout lets timers run)
+            events.append(pygame.event.wait(Config.IDLE_WAIT_MS))
+            self.idle_frames += 1
+        
+        # Time spent waiting while idle is not simulated
+        frame_time = self.clock.tick(Config.FPS) / 1000.0
+        if idle:
+            frame_time = 0.0
+        
+        # Profiled frames cover the work only, not the pacing waits above
+        profiler = self.state_manager.profiler
+        profiler.begin_frame()
+        telemetry = self.state_manager.telemetry
+        work_start = time.perf_counter() if telemetry.enabled else 0.0
+        
+        events.extend(pygame.event.get())
+        for event in events:
+            self._handle_event(event)
+        
+        updates = self._advance(frame_time)
+        
+        # Render only what changed
+        dirty_rects = self.state_manager.render()
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
+        self.frames += 1
+        profiler.end_frame(self.state_manager.current_state_name)
+        if telemetry.enabled:
+            telemetry.emit("frame", frame=self.frames, state=self.state_manager.current_state_name, idle=idle,
+                           ms=round((time.perf_counter() - work_start) * 1000, 3), dt=round(frame_time, 4),
+                           events=len(events), updates=updates, dirty_rects=len(dirty_rects))
+        if self.state_manager.recorder:
+            self.state_manager.recorder.end_frame()
+    
+    def _handle_event(self, event):
+        if event.type == pygame.QUIT:
+            self.running = False
+        elif event.type != pygame.NOEVENT:
+            self.state_manager.handle_event(event)
+    
+    def _advance(self, frame_time):
+        """Run updates for the elapsed time (fixed steps when Config.FIXED_TIMESTEP is set); returns the updates run"""
+        step = Config.FIXED_TIMESTEP
+        if not step:
+            self.state_manager.update(frame_time)
+            return 1
+        
+        # Clamp long stalls so a hitch doesn't trigger a burst of catch-up updates
+        self._accumulator += min(frame_time, step * Config.MAX_UPDATES_PER_FRAME)
+        updates = 0
+        while self._accumulator >= step:
+            self.state_manager.update(step)
+            self._accumulator -= step
+            updates += 1
+        return updates
@@ -2,59 +2,281 @@
 Game State Manager - Handles switching between different game states
 """
 
+import importlib
+import threading
+import time
 import pygame
 from src.engine.config import Config
-from src.states.menu_state import MenuState
-from src.states.bureau_state import BureauState
-from src.states.crime_scene_state import CrimeSceneState
-from src.states.lab_state import LabState
-from src.states.interrogation_state import InterrogationState
-from src.states.case_files_state import CaseFilesState
-from src.states.team_briefing_state import TeamBriefingState
+from src.engine.fonts import FontRegistry
+from src.engine.profiler import Profiler
+from src.engine import telemetry
+from src.modules.case_packs import CasePackLibrary
+from src.modules.evidence_graph import EvidenceGraph
+from src.modules.save_game import SaveGame, evidence_graph_data, evidence_graph_from_data
+
+# State name -> (module, class); modules are imported when the state is first needed
+STATE_CLASSES = {
+    Config.STATE_MENU: ("src.states.menu_state", "MenuState"),
+    Config.STATE_BUREAU: ("src.states.bureau_state", "BureauState"),
+    Config.STATE_CRIME_SCENE: ("src.states.crime_scene_state", "CrimeSceneState"),
+    Config.STATE_LAB: ("src.states.lab_state", "LabState"),
+    Config.STATE_INTERROGATION: ("src.states.interrogation_state", "InterrogationState"),
+    Config.STATE_CASE_FILES: ("src.states.case_files_state", "CaseFilesState"),
+    Config.STATE_TEAM_BRIEFING: ("src.states.team_briefing_state", "TeamBriefingState")
+}
+
+# States built from the open case's pack; rebuilt when another case is opened
+CASE_STATES = (Config.STATE_CRIME_SCENE, Config.STATE_LAB, Config.STATE_INTERROGATION, Config.STATE_TEAM_BRIEFING)
+
+def lazy_state_factory(module_name, class_name):
+    """Build a factory that imports a state's module only when it is constructed"""
+    def factory(state_manager):
+        module = importlib.import_module(module_name)
+        return getattr(module, class_name)(state_manager)
+    return factory
 
 class GameStateManager:
     def __init__(self, screen):
         self.screen = screen
         self.states = {}
+        self.state_factories = {}
         self.current_state = None
+        self.current_state_name = None
+        
+        # Frame profiler (F3 / CID_PROFILE)
+        self.profiler = Profiler.from_environment()
+        
+        # Engine events (CID_TELEMETRY); the bus is shared, so only the first manager sets it up
+        self.telemetry = telemetry.bus
+        if not self.telemetry.enabled:
+            self.telemetry.configure_from_environment()
+        
+        # Input recorder for deterministic replays (see src/engine/replay.py)
+        self.recorder = None
+        
+        # Guards the state table, which autosave snapshots; the warm-up thread only preloads
+        self._state_lock = threading.RLock()
+        self._warmup_thread = None
+        
+        # Fonts are loaded once and shared by every state
+        self.fonts = FontRegistry()
+        
+        # Evidence shared by the crime scene, lab and interrogation
+        self.evidence_graph = EvidenceGraph()
         
-        # Initialize all game states
-        self._initialize_states()
+        # Case content comes from packs, read when the case is first needed
+        self.case_packs = CasePackLibrary(Config.CASE_PACK_DIR, Config.CASE_PACK_CACHE_DIR)
+        self.case_id = Config.DEFAULT_CASE
+        self._case = None
+        
+        # Save file: changed sections autosave in the background, "Load Case" restores it
+        self.save_game = SaveGame(Config.SAVE_PATH)
+        self._session_revision = 0
+        self._autosave_elapsed = 0.0
+        
+        # Register game states; each is built on first use
+        self._register_states()
         
         # Start with menu
         self.change_state(Config.STATE_MENU)
     
-    def _initialize_states(self):
-        """Initialize all game states"""
-        self.states[Config.STATE_MENU] = MenuState(self)
-        self.states[Config.STATE_BUREAU] = BureauState(self)
-        self.states[Config.STATE_CRIME_SCENE] = CrimeSceneState(self)
-        self.states[Config.STATE_LAB] = LabState(self)
-        self.states[Config.STATE_INTERROGATION] = InterrogationState(self)
-        self.states[Config.STATE_CASE_FILES] = CaseFilesState(self)
-        self.states[Config.STATE_TEAM_BRIEFING] = TeamBriefingState(self)
+    def _register_states(self):
+        """Register factories for all game states"""
+        for name, (module_name, class_name) in STATE_CLASSES.items():
+            self.register_state(name, lazy_state_factory(module_name, class_name))
+    
+    def register_state(self, name, factory):
+        """Register a callable that builds a state from the manager"""
+        with self._state_lock:
+            self.state_factories[name] = factory
+            self.states.pop(name, None)
+    
+    def get_state(self, name):
+        """Return a state, constructing it on first request"""
+        with self._state_lock:
+            state = self.states.get(name)
+            if state is None and name in self.state_factories:
+                state = self.state_factories[name](self)
+                self.states[name] = state
+            return state
     
     def change_state(self, new_state):
         """Change to a new game state"""
-        if new_state in self.states:
+        start = time.perf_counter()
+        built = new_state not in self.states
+        state = self.get_state(new_state)
+        if state:
             if self.current_state:
                 self.current_state.exit()
             
-            self.current_state = self.states[new_state]
+            previous = self.current_state_name
+            self.current_state = state
+            self.current_state_name = new_state
             self.current_state.enter()
+            self.current_state.invalidate()
+            self.telemetry.emit("state_change", previous=previous, state=new_state, built=built,
+                                ms=round((time.perf_counter() - start) * 1000, 3))
+            self.warm_up(Config.STATE_WARMUP.get(new_state, ()))
+            
+            # Leaving a screen is a natural checkpoint
+            self._session_revision += 1
+            self.autosave()
+    
+    @property
+    def case(self):
+        """The open case's pack, loaded on first use"""
+        if self._case is None:
+            self._case = self.case_packs.load(self.case_id)
+        return self._case
+    
+    def open_case(self, case_id):
+        """Make a case the one being investigated; False when it has no pack"""
+        if not self.case_packs.has_case(case_id):
+            return False
+        if case_id != self.case_id:
+            self.telemetry.emit("case_open", previous=self.case_id, case=case_id)
+            self._switch_case(case_id)
+            # The new case's graph and states count revisions from 0 again, so the old
+            # case's saved revisions (and sections) must not be compared against them
+            self.save_game.discard((*CASE_STATES, "evidence_graph"))
+            self._session_revision += 1
+        return True
+    
+    def _switch_case(self, case_id):
+        """Forget the open case's evidence and states; they are rebuilt from the new pack"""
+        with self._state_lock:
+            self.case_id = case_id
+            self._case = None
+            self.evidence_graph = EvidenceGraph()
+            for name in CASE_STATES:
+                self.states.pop(name, None)
+    
+    def warm_up(self, names):
+        """Import likely next states' modules, and the open case's pack they need, on a background thread"""
+        if not Config.STATE_WARMUP_ENABLED or self.warming_up:
+            return
+        
+        pending = [name for name in names if name not in self.states and name in STATE_CLASSES]
+        if pending:
+            case_id = self.case_id if any(name in CASE_STATES for name in pending) else None
+            self._warmup_thread = threading.Thread(target=self._preload_states, args=(pending, case_id),
+                                                   daemon=True)
+            self._warmup_thread.start()
+    
+    @property
+    def warming_up(self):
+        """True while background state construction is running"""
+        return self._warmup_thread is not None and self._warmup_thread.is_alive()
+    
+    def _preload_states(self, names, case_id):
+        # States are still constructed on the game thread: their constructors lay out text through
+        # fonts and the shared text caches, which aren't thread-safe
+        for name in names:
+            importlib.import_module(STATE_CLASSES[name][0])
+        if case_id is not None:
+            self.case_packs.load(case_id)
     
     def handle_event(self, event):
         """Handle pygame events"""
-        if self.current_state:
-            self.current_state.handle_event(event)
+        if self.recorder:
+            self.recorder.record_event(event)
+        
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.toggle_profiler()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4 and self.profiler.samples:
+            print(f"Profile written to {self.profiler.export()}")
+        elif self.current_state:
+            with self.profiler.measure("handle_event"):
+                self.current_state.handle_event(event)
     
     def update(self, dt):
         """Update current state"""
+        if self.recorder:
+            self.recorder.record_update(dt)
         if self.current_state:
-            self.current_state.update(dt)
+            with self.profiler.measure("update"):
+                self.current_state.update(dt)
+        
+        self._autosave_elapsed += dt
+        if self._autosave_elapsed >= Config.AUTOSAVE_INTERVAL:
+            self._autosave_elapsed = 0.0
+            self.autosave()
     
-    def render(self):
-        """Render current state"""
-        self.screen.fill(Config.BLACK)
+    def _save_sections(self):
+        """Section name -> (revision, snapshot function) for everything a save file holds"""
+        graph = self.evidence_graph
+        sections = {
+            "session": (self._session_revision, lambda: {"state": self.current_state_name, "case": self.case_id}),
+            "evidence_graph": (graph.revision, lambda: evidence_graph_data(graph))
+        }
+        with self._state_lock:
+            for name, state in self.states.items():
+                if state.persistent:
+                    sections[name] = (state.save_revision, state.save_data)
+        return sections
+    
+    def autosave(self):
+        """Queue a background write of the sections that changed (moving between screens alone doesn't count)"""
+        if not Config.AUTOSAVE_ENABLED:
+            return []
+        sections = self._save_sections()
+        if not set(self.save_game.dirty_sections(sections)) - {"session"}:
+            return []
+        return self.save_game.autosave(sections)
+    
+    def load_game(self):
+        """Restore the saved session and return to the screen it was saved on; False when there is no save"""
+        sections = self.save_game.load()
+        if sections is None:
+            return False
+        
+        session = sections.get("session", {})
+        case_id = session.get("case", Config.DEFAULT_CASE)
+        if case_id != self.case_id and self.case_packs.has_case(case_id):
+            self._switch_case(case_id)
+        if "evidence_graph" in sections:
+            self.evidence_graph = evidence_graph_from_data(sections["evidence_graph"])
+        for name in self.state_factories:
+            if name in sections:
+                self.get_state(name).load_data(sections[name])
+        self.save_game.mark_saved(self._save_sections())
+        self.telemetry.emit("load", sections=len(sections), ms=round(self.save_game.last_load_ms, 3))
+        
+        saved_state = session.get("state")
+        if saved_state not in self.state_factories or saved_state == Config.STATE_MENU:
+            saved_state = Config.STATE_BUREAU
+        self.change_state(saved_state)
+        return True
+    
+    def close(self):
+        """Save outstanding changes and wait for background writes (and telemetry)"""
+        self.autosave()
+        self.save_game.flush()
+        self.telemetry.flush()
+    
+    def toggle_profiler(self):
+        """Show or hide the profiler overlay, restoring the screen under it"""
+        self.profiler.toggle()
         if self.current_state:
-            self.current_state.render(self.screen)
\ No newline at end of file
+            self.current_state.invalidate()
+    
+    def is_idle(self):
+        """True when the current state is static and no background work is running"""
+        if self.warming_up:
+            return False
+        return self.current_state is None or self.current_state.is_idle()
+    
+    def render(self):
+        """Render current state and return the screen rects that changed"""
+        if not self.current_state:
+            return []
+        if not self.profiler.enabled:
+            return self.current_state.render(self.screen)
+        
+        # Profiling: draw into a counting back buffer, copy the changes, then the overlay
+        target = self.profiler.render_target(self.screen)
+        with self.profiler.measure("render"):
+            dirty_rects = self.current_state.render(target)
+        for rect in dirty_rects:
+            self.screen.blit(target, rect, rect)
+        return dirty_rects + [self.profiler.draw_overlay(self.screen, self.current_state_name)]
\ No newline at end of file
@@ -0,0 +1,297 @@
+"""
+Headless Runner - Drive the game without a window
+Runs GameStateManager on the SDL dummy video driver from scripted input, as
+fast as the CPU allows, with rendering optional. Used for soak tests in CI.
+
+Usage: python -m src.engine.headless --scenario all --iterations 1000 --no-render
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import traceback
+from typing import Callable, Dict, List, Optional
+
+import pygame
+
+from src.engine.config import Config
+
+def configure_headless(offline_ai: bool = True):
+    """Select the dummy SDL drivers and turn off features that need a network or threads"""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    Config.STATE_WARMUP_ENABLED = False  # load state modules on demand so runs are reproducible
+    Config.AUTOSAVE_ENABLED = False  # leave the player's save file alone
+    Config.CASE_SEARCH_THREADED = False  # search results arrive on the frame they were asked for
+    if offline_ai:
+        Config.AI_BACKEND = "offline"
+
+class HeadlessRunner:
+    """Feeds events to a GameStateManager and steps it on a fixed timestep"""
+    
+    def __init__(self, render: bool = True, dt: Optional[float] = None):
+        from src.engine.game_state import GameStateManager
+        
+        pygame.init()
+        if render:
+            self.screen = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+        else:
+            # States never draw, they only need a surface to hold on to
+            self.screen = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+        
+        self.render_enabled = render
+        self.dt = dt or Config.FIXED_TIMESTEP or 1 / Config.FPS
+        self.manager = GameStateManager(self.screen)
+        self.frames = 0
+        self.events = 0
+        self.quit_requested = False
+    
+    @property
+    def state_name(self) -> Optional[str]:
+        return self.manager.current_state_name
+    
+    @property
+    def state(self):
+        return self.manager.current_state
+    
+    def post(self, event: pygame.event.Event, frames: int = 1):
+        """Deliver one event, then advance frames"""
+        if event.type == pygame.QUIT:
+            self.quit_requested = True
+        else:
+            self.manager.handle_event(event)
+            self.events += 1
+        
+        # States request shutdown by posting QUIT (e.g. the menu's Exit option)
+        if pygame.event.get(pygame.QUIT):
+            self.quit_requested = True
+        self.step(frames)
+    
+    def step(self, frames: int = 1):
+        """Advance the simulation (and render, when enabled) by whole frames"""
+        for _ in range(frames):
+            self.manager.update(self.dt)
+            if self.render_enabled:
+                self.manager.render()
+            self.frames += 1
+    
+    def run_for(self, seconds: float):
+        """Advance simulated time without input"""
+        self.step(max(1, round(seconds / self.dt)))
+    
+    def key(self, key: int, unicode: str = "", frames: int = 1):
+        self.post(pygame.event.Event(pygame.KEYDOWN, key=key, unicode=unicode, mod=0, scancode=0), frames)
+    
+    def type_text(self, text: str):
+        """Type text one KEYDOWN per character"""
+        for char in text:
+            self.key(pygame.key.key_code(char) if char.isalnum() else pygame.K_SPACE, char, frames=0)
+        self.step()
+    
+    def click(self, pos, button: int = 1):
+        self.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=button))
+    
+    def scroll(self, y: int):
+        self.post(pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=y, flipped=False))
+    
+    def goto(self, state_name: str):
+        """Jump straight to a state, as a scenario setup step"""
+        self.manager.change_state(state_name)
+        self.step()
+    
+    def expect_state(self, state_name: str):
+        if self.state_name != state_name:
+            raise AssertionError(f"expected state {state_name!r}, got {self.state_name!r}")
+    
+    def close(self):
+        pygame.quit()
+
+# Scenarios take a runner and drive one iteration of a flow; errors fail the iteration
+
+def scenario_transitions(runner: HeadlessRunner):
+    """Menu -> bureau -> every bureau destination and back -> menu"""
+    runner.goto(Config.STATE_MENU)
+    runner.key(pygame.K_RETURN)
+    runner.expect_state(Config.STATE_BUREAU)
+    
+    bureau = runner.state
+    destinations = [action for _label, action in bureau.menu_options]
+    for index, destination in enumerate(destinations):
+        bureau.selected_option = 0
+        for _ in range(index):
+            runner.key(pygame.K_DOWN)
+        runner.key(pygame.K_RETURN)
+        runner.expect_state(destination)
+        if destination != Config.STATE_MENU:
+            runner.key(pygame.K_ESCAPE)
+            runner.expect_state(Config.STATE_BUREAU)
+
+def scenario_crime_scene(runner: HeadlessRunner):
+    """Collect every marker at the crime scene, by click and by search, then move the camera"""
+    runner.goto(Config.STATE_CRIME_SCENE)
+    scene = runner.state
+    for evidence in scene.available_evidence[::2]:
+        runner.click((evidence["x"], evidence["y"]))
+    for _ in scene.available_evidence:
+        runner.key(pygame.K_SPACE)
+    if any(not evidence["found"] for evidence in scene.available_evidence):
+        raise AssertionError("crime scene evidence left uncollected")
+    
+    # Zoom in, pan with a held key, then reset the view
+    runner.scroll(1)
+    runner.key(pygame.K_RIGHT, frames=10)
+    runner.post(pygame.event.Event(pygame.KEYUP, key=pygame.K_RIGHT, mod=0, scancode=0))
+    runner.key(pygame.K_HOME)
+    if scene.camera.zoom != 1.0 or scene.pan_keys:
+        raise AssertionError("crime scene view was not reset")
+    runner.key(pygame.K_ESCAPE)
+
+def scenario_interrogation(runner: HeadlessRunner):
+    """Question the suspect with each team member, present evidence and scroll the transcript"""
+    runner.goto(Config.STATE_INTERROGATION)
+    room = runner.state
+    entries = len(room.transcript)
+    for evidence_key in (pygame.K_1, pygame.K_2, pygame.K_3, None):
+        runner.type_text("where were you that night")
+        if evidence_key is None:
+            runner.key(pygame.K_RETURN)
+        else:
+            runner.key(evidence_key)
+        runner.key(pygame.K_TAB)
+    if len(room.transcript) <= entries:
+        raise AssertionError("interrogation transcript did not grow")
+    runner.key(pygame.K_PAGEUP)
+    runner.scroll(-2)
+    runner.key(pygame.K_END, frames=30)
+    runner.key(pygame.K_ESCAPE)
+
+def scenario_lab(runner: HeadlessRunner):
+    """Run a fingerprint analysis and an image enhancement to completion"""
+    runner.goto(Config.STATE_LAB)
+    lab = runner.state
+    lab.selected_option = 0
+    runner.key(pygame.K_RETURN)
+    runner.run_for(6.0)  # analyses progress at 20% per second
+    if lab.analysis_results["fingerprint_analysis"]["status"] != "Complete":
+        raise AssertionError("fingerprint analysis did not complete")
+    
+    # Collected security footage has an image, which goes through the result store
+    lab.selected_option = lab.analysis_options.index("Image Enhancement")
+    runner.key(pygame.K_RETURN)
+    runner.run_for(6.0)
+    enhancement = lab.analysis_results["image_enhancement"]
+    if enhancement["status"] != "Complete":
+        raise AssertionError("image enhancement did not complete")
+    if "image_enhancement" in lab.results and not enhancement["result"].startswith("Faces:"):
+        raise AssertionError(f"image enhancement failed: {enhancement['result']}")
+    runner.key(pygame.K_ESCAPE)
+
+def scenario_case_files(runner: HeadlessRunner):
+    """Page, filter, sort and search the case archive"""
+    runner.goto(Config.STATE_CASE_FILES)
+    files = runner.state
+    for key in (pygame.K_END, pygame.K_HOME, pygame.K_PAGEDOWN, pygame.K_RIGHT, pygame.K_TAB, pygame.K_LEFT):
+        runner.key(key)
+    runner.key(pygame.K_SLASH, "/")
+    runner.type_text("diamond")
+    runner.key(pygame.K_RETURN)
+    if not files.total or "Diamond" not in files._selected_details()["title"]:
+        raise AssertionError("case search did not find the diamond case")
+    runner.key(pygame.K_ESCAPE)  # clears the search
+    runner.key(pygame.K_ESCAPE)
+    runner.expect_state(Config.STATE_BUREAU)
+
+def scenario_exit(runner: HeadlessRunner):
+    """Choose Exit from the main menu and check it asks the loop to quit"""
+    runner.goto(Config.STATE_MENU)
+    menu = runner.state
+    menu.selected_option = [action for _label, action in menu.menu_options].index("exit")
+    runner.quit_requested = False
+    runner.key(pygame.K_RETURN)
+    if not runner.quit_requested:
+        raise AssertionError("Exit did not request shutdown")
+    runner.quit_requested = False
+
+SCENARIOS: Dict[str, Callable[[HeadlessRunner], None]] = {
+    "transitions": scenario_transitions,
+    "crime_scene": scenario_crime_scene,
+    "interrogation": scenario_interrogation,
+    "lab": scenario_lab,
+    "case_files": scenario_case_files,
+    "exit": scenario_exit
+}
+
+def soak(scenario_names: List[str], iterations: int, render: bool = True, fresh: bool = False,
+         fail_fast: bool = False) -> Dict:
+    """Run each scenario repeatedly and report throughput and failures"""
+    runner = HeadlessRunner(render=render)
+    results = {}
+    
+    for name in scenario_names:
+        scenario = SCENARIOS[name]
+        timings = []
+        errors = []
+        frames_before = runner.frames
+        start = time.perf_counter()
+        
+        for iteration in range(iterations):
+            if fresh:
+                runner = HeadlessRunner(render=render)
+            iteration_start = time.perf_counter()
+            try:
+                scenario(runner)
+            except Exception:
+                errors.append({"iteration": iteration, "error": traceback.format_exc()})
+                if fail_fast:
+                    break
+            timings.append((time.perf_counter() - iteration_start) * 1000)
+        
+        elapsed = time.perf_counter() - start
+        results[name] = {
+            "iterations": len(timings),
+            "errors": errors,
+            "elapsed_s": elapsed,
+            "per_minute": len(timings) / elapsed * 60 if elapsed > 0 else None,
+            "median_ms": statistics.median(timings) if timings else None,
+            "max_ms": max(timings) if timings else None,
+            "frames": runner.frames - frames_before if not fresh else None
+        }
+        if errors and fail_fast:
+            break
+    
+    runner.close()
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Soak-test game flows without a display")
+    parser.add_argument("--scenario", action="append", choices=[*SCENARIOS, "all"],
+                        help="scenario to run (repeatable, default: all)")
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--no-render", action="store_true", help="skip rendering entirely")
+    parser.add_argument("--fresh", action="store_true", help="build a new GameStateManager every iteration")
+    parser.add_argument("--fail-fast", action="store_true")
+    parser.add_argument("--live-ai", action="store_true", help="query the configured AI backend")
+    args = parser.parse_args()
+    
+    configure_headless(offline_ai=not args.live_ai)
+    names = args.scenario or ["all"]
+    if "all" in names:
+        names = list(SCENARIOS)
+    
+    results = soak(names, args.iterations, render=not args.no_render, fresh=args.fresh,
+                   fail_fast=args.fail_fast)
+    
+    failed = False
+    for name, result in results.items():
+        print(f"{name:>14}: {result['iterations']} runs in {result['elapsed_s']:.2f} s "
+              f"({result['per_minute']:.0f}/min) | median {result['median_ms']:.2f} ms, "
+              f"max {result['max_ms']:.2f} ms | errors {len(result['errors'])}")
+        for error in result["errors"][:3]:
+            print(f"  iteration {error['iteration']}:\n{error['error']}", file=sys.stderr)
+        failed = failed or bool(result["errors"])
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
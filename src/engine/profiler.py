@@ -0,0 +1,274 @@
+"""
+Profiler - Frame timing and hot-path counters
+Times handle_event, update and render per state, counts font rasterizations
+and screen blits, draws a live overlay and exports samples for offline
+analysis (CSV or Chrome trace JSON for chrome://tracing / Perfetto).
+
+Toggle with F3 in game or start with CID_PROFILE=1. Setting CID_PROFILE to a
+.csv or .json path also exports the samples there on exit.
+"""
+
+import csv
+import json
+import math
+import os
+import time
+from collections import deque
+from itertools import islice
+from typing import Dict, List, Optional
+
+import pygame
+
+from src.engine.config import Config
+
+PROFILE_ENV = "CID_PROFILE"
+
+SECTIONS = ("handle_event", "update", "render")
+
+CSV_FIELDS = ["frame", "state", "start_ms", "frame_ms", *(f"{name}_ms" for name in SECTIONS),
+              "font_renders", "blits"]
+
+class CountingFont(pygame.font.Font):
+    """Font that counts render() calls (every cache miss ends up here)"""
+    
+    render_calls = 0
+    
+    def render(self, *args, **kwargs):
+        CountingFont.render_calls += 1
+        return super().render(*args, **kwargs)
+
+class CountingSurface(pygame.Surface):
+    """Back buffer that counts blits while the profiler is on"""
+    
+    blit_calls = 0
+    
+    def blit(self, *args, **kwargs):
+        CountingSurface.blit_calls += 1
+        return super().blit(*args, **kwargs)
+    
+    def blits(self, blit_sequence, *args, **kwargs):
+        blit_sequence = list(blit_sequence)
+        CountingSurface.blit_calls += len(blit_sequence)
+        return super().blits(blit_sequence, *args, **kwargs)
+
+class _Section:
+    """Times one with-block and adds it to the current frame"""
+    
+    __slots__ = ("profiler", "name", "start")
+    
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.profiler._add_span(self.name, self.start, time.perf_counter())
+        return False
+
+class _NullSection:
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+
+_NULL_SECTION = _NullSection()
+
+class Profiler:
+    """Collects per-frame samples while enabled; costs one attribute check when off"""
+    
+    def __init__(self, enabled: bool = False, max_samples: int = None):
+        self.enabled = enabled
+        self.samples = deque(maxlen=max_samples or Config.PROFILER_MAX_SAMPLES)
+        self.export_path = None
+        
+        # Totals per (state, section) since profiling started
+        self.state_totals = {}
+        
+        self._epoch = time.perf_counter()
+        self._frame = None
+        self._frame_count = 0
+        self._back_buffer = None
+        self._font = None
+    
+    @classmethod
+    def from_environment(cls) -> "Profiler":
+        """Enable profiling when CID_PROFILE is set; a .csv/.json value is used as the export path"""
+        value = os.environ.get(PROFILE_ENV, "")
+        profiler = cls(enabled=value.lower() not in ("", "0", "false", "no"))
+        if value.lower().endswith((".csv", ".json")):
+            profiler.export_path = value
+        return profiler
+    
+    def toggle(self):
+        self.enabled = not self.enabled
+        self._back_buffer = None
+    
+    def measure(self, section: str):
+        """Context manager that times a section of the current frame"""
+        if self._frame is None:
+            return _NULL_SECTION
+        return _Section(self, section)
+    
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self._frame = {
+            "start": time.perf_counter(),
+            "sections": dict.fromkeys(SECTIONS, 0.0),
+            "spans": [],
+            "font_renders": CountingFont.render_calls,
+            "blits": CountingSurface.blit_calls
+        }
+    
+    def end_frame(self, state_name: Optional[str]):
+        """Close the current frame and store its sample"""
+        frame = self._frame
+        if frame is None:
+            return
+        self._frame = None
+        
+        end = time.perf_counter()
+        sections = {name: seconds * 1000 for name, seconds in frame["sections"].items()}
+        sample = {
+            "frame": self._frame_count,
+            "state": state_name,
+            "start_ms": (frame["start"] - self._epoch) * 1000,
+            "frame_ms": (end - frame["start"]) * 1000,
+            **{f"{name}_ms": ms for name, ms in sections.items()},
+            "font_renders": CountingFont.render_calls - frame["font_renders"],
+            "blits": CountingSurface.blit_calls - frame["blits"],
+            "spans": frame["spans"]
+        }
+        self.samples.append(sample)
+        self._frame_count += 1
+        
+        for name, ms in sections.items():
+            key = (state_name, name)
+            count, total = self.state_totals.get(key, (0, 0.0))
+            self.state_totals[key] = (count + 1, total + ms)
+    
+    def _add_span(self, name: str, start: float, end: float):
+        frame = self._frame
+        if frame is None:
+            return
+        frame["sections"][name] = frame["sections"].get(name, 0.0) + (end - start)
+        frame["spans"].append((name, start, end))
+    
+    def render_target(self, screen: pygame.Surface) -> pygame.Surface:
+        """Counting back buffer the states draw into while profiling (kept in sync by the caller)"""
+        if self._back_buffer is None or self._back_buffer.get_size() != screen.get_size():
+            self._back_buffer = CountingSurface(screen.get_size(), 0, screen)
+            self._back_buffer.blit(screen, (0, 0))
+        return self._back_buffer
+    
+    def frame_times(self, count: int = None) -> List[float]:
+        frames = reversed(list(islice(reversed(self.samples), count))) if count else self.samples
+        return [sample["frame_ms"] for sample in frames]
+    
+    def percentile(self, percent: float, count: int = None) -> float:
+        """Frame time percentile (nearest rank) over the last count frames"""
+        times = sorted(self.frame_times(count))
+        if not times:
+            return 0.0
+        rank = min(len(times), max(1, math.ceil(percent / 100 * len(times)))) - 1
+        return times[rank]
+    
+    def summary(self) -> Dict:
+        """Overall percentiles plus mean section times per state"""
+        return {
+            "frames": len(self.samples),
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "states": {
+                f"{state}.{section}": total / count
+                for (state, section), (count, total) in sorted(self.state_totals.items(), key=str)
+            }
+        }
+    
+    def export(self, path: str = None) -> str:
+        """Write samples as Chrome trace JSON (.json) or CSV (anything else)"""
+        path = path or self.export_path or Config.PROFILER_EXPORT_PATH
+        if path.lower().endswith(".json"):
+            self.export_chrome_trace(path)
+        else:
+            self.export_csv(path)
+        return path
+    
+    def export_csv(self, path: str):
+        """One row per frame with section times and counters"""
+        with open(path, "w", newline="", encoding="utf-8") as output:
+            writer = csv.DictWriter(output, fieldnames=CSV_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            for sample in self.samples:
+                writer.writerow({
+                    key: round(value, 4) if isinstance(value, float) else value
+                    for key, value in sample.items()
+                })
+    
+    def export_chrome_trace(self, path: str):
+        """Trace Event Format: a complete event per frame and section, plus counter tracks"""
+        events = []
+        for sample in self.samples:
+            frame_start_us = sample["start_ms"] * 1000
+            events.append({
+                "name": "frame", "cat": sample["state"] or "", "ph": "X", "pid": 0, "tid": 0,
+                "ts": frame_start_us, "dur": sample["frame_ms"] * 1000,
+                "args": {"frame": sample["frame"]}
+            })
+            for name, start, end in sample["spans"]:
+                events.append({
+                    "name": name, "cat": sample["state"] or "", "ph": "X", "pid": 0, "tid": 0,
+                    "ts": (start - self._epoch) * 1_000_000, "dur": (end - start) * 1_000_000
+                })
+            events.append({
+                "name": "counters", "ph": "C", "pid": 0, "tid": 0, "ts": frame_start_us,
+                "args": {"font_renders": sample["font_renders"], "blits": sample["blits"]}
+            })
+        
+        with open(path, "w", encoding="utf-8") as output:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, output)
+    
+    def draw_overlay(self, screen: pygame.Surface, state_name: Optional[str]) -> pygame.Rect:
+        """Draw stats and the frame-time graph in the top-right corner; returns the rect drawn"""
+        if self._font is None:
+            # Not a CountingFont, so the overlay doesn't count itself
+            self._font = pygame.font.Font(None, 20)
+        
+        graph_frames = Config.PROFILER_GRAPH_FRAMES
+        width, height = graph_frames + 20, 200
+        rect = pygame.Rect(screen.get_width() - width - 10, 10, width, height)
+        screen.fill((10, 10, 10), rect)
+        pygame.draw.rect(screen, Config.CID_GRAY, rect, 1)
+        
+        last = self.samples[-1] if self.samples else None
+        lines = [
+            f"{state_name}  frames {len(self.samples)}",
+            f"p50 {self.percentile(50, graph_frames):.2f}  p95 {self.percentile(95, graph_frames):.2f}  "
+            f"p99 {self.percentile(99, graph_frames):.2f} ms"
+        ]
+        if last:
+            lines.append(" ".join(f"{name[:6]} {last[name + '_ms']:.2f}" for name in SECTIONS))
+            lines.append(f"font.render {last['font_renders']}  blits {last['blits']}")
+        for i, line in enumerate(lines):
+            screen.blit(self._font.render(line, True, Config.WHITE), (rect.x + 10, rect.y + 8 + i * 18))
+        
+        # Frame-time graph, scaled so the 60 FPS budget sits halfway up
+        graph = pygame.Rect(rect.x + 10, rect.y + 88, graph_frames, height - 98)
+        budget_ms = 1000 / Config.FPS
+        scale = graph.height / (budget_ms * 2)
+        budget_y = graph.bottom - int(budget_ms * scale)
+        pygame.draw.line(screen, Config.CID_GRAY, (graph.x, budget_y), (graph.right, budget_y))
+        for i, frame_ms in enumerate(self.frame_times(graph_frames)):
+            bar = min(graph.height, int(frame_ms * scale))
+            color = Config.DANGER_RED if frame_ms > budget_ms else Config.EVIDENCE_YELLOW
+            pygame.draw.line(screen, color, (graph.x + i, graph.bottom), (graph.x + i, graph.bottom - bar))
+        
+        return rect
@@ -0,0 +1,305 @@
+"""
+Input Replay - Record a session and play it back deterministically
+The recorder logs every event the state manager handles and the simulation
+steps of each frame, plus the RNG seed, as JSON lines. The replay runner
+feeds the log back (headless or windowed) and reports frame times and input
+latency, and two reports can be diffed to compare revisions.
+
+Record:  CID_RECORD=session.jsonl [CID_SEED=1234] python main.py
+Replay:  python -m src.engine.replay run session.jsonl -o report.json [--windowed]
+Compare: python -m src.engine.replay diff base.json candidate.json --threshold 10
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Dict, Iterator, List, Optional
+
+import pygame
+
+from src.engine.config import Config
+
+RECORD_ENV = "CID_RECORD"
+SEED_ENV = "CID_SEED"
+
+LOG_VERSION = 1
+
+# Event attributes that can round-trip through JSON
+_PLAIN_TYPES = (bool, int, float, str, type(None))
+
+def seed_rngs(seed: Optional[int] = None) -> int:
+    """Seed Python's and NumPy's global RNGs (a time-based seed is picked when None)"""
+    if seed is None:
+        seed = time.time_ns() % (2 ** 32)
+    random.seed(seed)
+    try:
+        import numpy as np
+        np.random.seed(seed)
+    except ImportError:
+        pass
+    return seed
+
+def _event_attrs(event: pygame.event.Event) -> Dict:
+    attrs = {}
+    for name, value in event.dict.items():
+        if isinstance(value, _PLAIN_TYPES):
+            attrs[name] = value
+        elif isinstance(value, (tuple, list)) and all(isinstance(item, _PLAIN_TYPES) for item in value):
+            attrs[name] = list(value)
+    return attrs
+
+def _make_event(record: Dict) -> pygame.event.Event:
+    attrs = {name: tuple(value) if isinstance(value, list) else value
+             for name, value in record["attrs"].items()}
+    return pygame.event.Event(record["type"], attrs)
+
+class InputRecorder:
+    """Appends handled events and per-frame update steps to a JSON lines log"""
+    
+    def __init__(self, path: str, seed: int):
+        self.path = path
+        self.frame = 0
+        self._start = time.perf_counter()
+        self._updates = 0
+        self._dt = 0.0
+        self._output = open(path, "w", encoding="utf-8")
+        self._write({
+            "kind": "header",
+            "version": LOG_VERSION,
+            "seed": seed,
+            "fixed_timestep": Config.FIXED_TIMESTEP,
+            "ai_backend": Config.AI_BACKEND,
+            "screen": [Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT],
+            "pygame": pygame.version.ver
+        })
+    
+    @classmethod
+    def from_environment(cls) -> Optional["InputRecorder"]:
+        """Seed the RNGs and start recording when CID_RECORD is set"""
+        path = os.environ.get(RECORD_ENV)
+        if not path:
+            return None
+        seed = os.environ.get(SEED_ENV)
+        return cls(path, seed_rngs(int(seed) if seed else None))
+    
+    def record_event(self, event: pygame.event.Event):
+        self._write({
+            "kind": "event",
+            "frame": self.frame,
+            "t_ms": round(self._elapsed_ms(), 3),
+            "type": event.type,
+            "name": pygame.event.event_name(event.type),
+            "attrs": _event_attrs(event)
+        })
+    
+    def record_update(self, dt: float):
+        self._updates += 1
+        self._dt = dt
+    
+    def end_frame(self):
+        """Close the frame; frames without updates are implied by the frame counter"""
+        if self._updates:
+            self._write({
+                "kind": "frame",
+                "frame": self.frame,
+                "t_ms": round(self._elapsed_ms(), 3),
+                "updates": self._updates,
+                "dt": self._dt
+            })
+        self._updates = 0
+        self.frame += 1
+    
+    def close(self):
+        if not self._output.closed:
+            self._write({"kind": "end", "frame": self.frame, "t_ms": round(self._elapsed_ms(), 3)})
+            self._output.close()
+    
+    def _elapsed_ms(self) -> float:
+        return (time.perf_counter() - self._start) * 1000
+    
+    def _write(self, record: Dict):
+        self._output.write(json.dumps(record) + "\n")
+
+def read_log(path: str) -> Iterator[Dict]:
+    with open(path, encoding="utf-8") as log:
+        for line in log:
+            if line.strip():
+                yield json.loads(line)
+
+def _percentiles(values: List[float]) -> Dict:
+    if not values:
+        return {"count": 0}
+    ordered = sorted(values)
+    
+    def nearest_rank(percent):
+        return ordered[min(len(ordered), max(1, math.ceil(percent / 100 * len(ordered)))) - 1]
+    
+    return {
+        "count": len(ordered),
+        "mean": statistics.fmean(ordered),
+        "p50": nearest_rank(50),
+        "p95": nearest_rank(95),
+        "p99": nearest_rank(99),
+        "max": ordered[-1]
+    }
+
+def replay(path: str, windowed: bool = False, render: bool = True) -> Dict:
+    """
+    Feed a recorded session back frame by frame as fast as possible
+    Frame time covers events, updates and rendering of one recorded frame;
+    input latency runs from dispatching a frame's first event to the end of
+    presenting that frame.
+    """
+    records = list(read_log(path))
+    header = records[0]
+    if header.get("kind") != "header" or header.get("version") != LOG_VERSION:
+        raise ValueError(f"{path} is not a version {LOG_VERSION} replay log")
+    
+    from src.engine.headless import configure_headless
+    if windowed:
+        Config.STATE_WARMUP_ENABLED = False
+        Config.AUTOSAVE_ENABLED = False
+        Config.CASE_SEARCH_THREADED = False
+    else:
+        configure_headless(offline_ai=header["ai_backend"] == "offline")
+    Config.FIXED_TIMESTEP = header["fixed_timestep"]
+    seed_rngs(header["seed"])
+    
+    from src.engine.game_state import GameStateManager
+    pygame.init()
+    if render or windowed:
+        screen = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+    else:
+        screen = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+    manager = GameStateManager(screen)
+    
+    # Group the log by frame: events first, then that frame's update steps
+    frames = {}
+    for record in records[1:]:
+        if record["kind"] in ("event", "frame"):
+            frames.setdefault(record["frame"], {"events": [], "updates": 0, "dt": 0.0})
+        if record["kind"] == "event":
+            frames[record["frame"]]["events"].append(_make_event(record))
+        elif record["kind"] == "frame":
+            frames[record["frame"]]["updates"] = record["updates"]
+            frames[record["frame"]]["dt"] = record["dt"]
+    
+    frame_times = []
+    latencies = []
+    state_frames = {}
+    start = time.perf_counter()
+    for frame_index in sorted(frames):
+        frame = frames[frame_index]
+        frame_start = time.perf_counter()
+        for event in frame["events"]:
+            manager.handle_event(event)
+        for _ in range(frame["updates"]):
+            manager.update(frame["dt"])
+        if render or windowed:
+            dirty_rects = manager.render()
+            if dirty_rects and windowed:
+                pygame.display.update(dirty_rects)
+        frame_end = time.perf_counter()
+        
+        frame_ms = (frame_end - frame_start) * 1000
+        frame_times.append(frame_ms)
+        state_frames.setdefault(manager.current_state_name, []).append(frame_ms)
+        if frame["events"]:
+            latencies.append(frame_ms)
+        pygame.event.pump()
+    elapsed = time.perf_counter() - start
+    
+    report = {
+        "log": os.path.basename(path),
+        "seed": header["seed"],
+        "frames": len(frame_times),
+        "events": sum(len(frame["events"]) for frame in frames.values()),
+        "elapsed_s": elapsed,
+        "rendered": render or windowed,
+        "frame_ms": _percentiles(frame_times),
+        "latency_ms": _percentiles(latencies),
+        "states": {name: _percentiles(times) for name, times in sorted(state_frames.items(), key=str)},
+        "final_state": manager.current_state_name
+    }
+    if render or windowed:
+        # Identical revisions replaying the same log must end on identical pixels
+        report["screen_sha1"] = hashlib.sha1(pygame.image.tobytes(screen, "RGB")).hexdigest()
+    pygame.quit()
+    return report
+
+def diff_reports(base: Dict, candidate: Dict, threshold_pct: float = 10.0, min_delta_ms: float = 0.25) -> Dict:
+    """
+    Compare timing percentiles
+    A metric regresses when it grows by more than threshold_pct and by more
+    than min_delta_ms, so jitter on sub-millisecond frames isn't flagged.
+    """
+    rows = []
+    for section in ("frame_ms", "latency_ms"):
+        for metric in ("mean", "p50", "p95", "p99", "max"):
+            before = base[section].get(metric)
+            after = candidate[section].get(metric)
+            if before is None or after is None:
+                continue
+            change = (after - before) / before * 100 if before else 0.0
+            rows.append({
+                "metric": f"{section}.{metric}",
+                "base": before,
+                "candidate": after,
+                "change_pct": change,
+                "regression": change > threshold_pct and after - before > min_delta_ms
+            })
+    
+    return {
+        "same_workload": base["events"] == candidate["events"] and base["frames"] == candidate["frames"],
+        "same_output": base.get("screen_sha1") == candidate.get("screen_sha1"),
+        "rows": rows,
+        "regressions": [row["metric"] for row in rows if row["regression"]]
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded sessions and compare reports")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    run_parser = commands.add_parser("run", help="replay a session log and write a timing report")
+    run_parser.add_argument("log")
+    run_parser.add_argument("-o", "--output", help="report JSON file (default: stdout)")
+    run_parser.add_argument("--windowed", action="store_true", help="replay in a real window")
+    run_parser.add_argument("--no-render", action="store_true", help="skip rendering (simulation only)")
+    
+    diff_parser = commands.add_parser("diff", help="compare two replay reports")
+    diff_parser.add_argument("base")
+    diff_parser.add_argument("candidate")
+    diff_parser.add_argument("--threshold", type=float, default=10.0, help="allowed slowdown in percent")
+    diff_parser.add_argument("--min-delta", type=float, default=0.25, help="ignore slowdowns smaller than this (ms)")
+    args = parser.parse_args()
+    
+    if args.command == "run":
+        report = replay(args.log, windowed=args.windowed, render=not args.no_render)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as output:
+                json.dump(report, output, indent=2)
+        else:
+            print(json.dumps(report, indent=2))
+        return
+    
+    with open(args.base, encoding="utf-8") as base_file, open(args.candidate, encoding="utf-8") as candidate_file:
+        result = diff_reports(json.load(base_file), json.load(candidate_file), args.threshold, args.min_delta)
+    
+    if not result["same_workload"]:
+        print("warning: reports come from different workloads", file=sys.stderr)
+    if not result["same_output"]:
+        print("warning: final screens differ (behavior changed or non-deterministic)", file=sys.stderr)
+    for row in result["rows"]:
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(f"{row['metric']:>18}: {row['base']:9.3f} -> {row['candidate']:9.3f} ms "
+              f"({row['change_pct']:+6.1f}%){flag}")
+    sys.exit(1 if result["regressions"] else 0)
+
+if __name__ == "__main__":
+    main()
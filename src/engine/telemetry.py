@@ -0,0 +1,279 @@
+"""
+Telemetry - Structured engine events written off the game thread
+emit() stamps an event and puts it on a queue (no locks, no I/O, nothing
+formatted); a background writer drains the queue in batches and hands the
+records to sinks: JSON lines, size-rolled JSON lines files or an in-memory
+ring buffer. Per-event sampling rates keep chatty events such as per-frame
+stats cheap.
+
+Enable with CID_TELEMETRY=1 (rolling file at Config.TELEMETRY_PATH), a .jsonl
+path, or "ring" for the in-memory buffer alone. CID_TELEMETRY_SAMPLE
+overrides sampling rates, e.g. "frame=0.1,llm_request=1".
+
+Events: startup, state_change, case_open, frame, llm_request, forensic_stage,
+lab_analysis, lab_result, save, load.
+"""
+
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+from collections import deque
+from typing import Dict, Iterable, List, Optional
+
+from src.engine.config import Config
+
+TELEMETRY_ENV = "CID_TELEMETRY"
+SAMPLE_ENV = "CID_TELEMETRY_SAMPLE"
+
+# Records the writer hands to sinks at a time, and how long it rests after a partial batch
+# (waking per event would take the GIL from the game thread on every emit)
+WRITE_BATCH = 512
+WRITE_INTERVAL = 0.05
+
+class JsonLinesSink:
+    """Appends one JSON object per line to a file"""
+    
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+    
+    def write(self, records: List[Dict]):
+        self._file.write("".join(json.dumps(record, separators=(",", ":"), default=str) + "\n"
+                                 for record in records))
+    
+    def flush(self):
+        self._file.flush()
+    
+    def close(self):
+        self._file.close()
+
+class RollingFileSink(JsonLinesSink):
+    """JSON lines that roll over to path.1 ... path.<backups> once the file passes max_bytes"""
+    
+    def __init__(self, path: str, max_bytes: int = 5 * 1024 * 1024, backups: int = 3):
+        super().__init__(path)
+        self.max_bytes = max_bytes
+        self.backups = backups
+    
+    def write(self, records: List[Dict]):
+        super().write(records)
+        if self._file.tell() >= self.max_bytes:
+            self._roll()
+    
+    def _roll(self):
+        self._file.close()
+        for index in range(self.backups - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{index}"):
+                os.replace(f"{self.path}.{index}", f"{self.path}.{index + 1}")
+        if self.backups:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+class RingBufferSink:
+    """Keeps the last capacity records in memory"""
+    
+    def __init__(self, capacity: int = 2000):
+        self.records = deque(maxlen=capacity)
+    
+    def write(self, records: List[Dict]):
+        self.records.extend(records)
+    
+    def events(self, event: Optional[str] = None) -> List[Dict]:
+        """Buffered records, oldest first, optionally of one event type"""
+        records = list(self.records)
+        if event is None:
+            return records
+        return [record for record in records if record["event"] == event]
+    
+    def flush(self):
+        pass
+    
+    def close(self):
+        pass
+
+class _Span:
+    """Emits an event with the with-block's duration in ms"""
+    
+    __slots__ = ("telemetry", "event", "fields", "start")
+    
+    def __init__(self, telemetry, event, fields):
+        self.telemetry = telemetry
+        self.event = event
+        self.fields = fields
+        self.start = 0.0
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.fields["ms"] = round((time.perf_counter() - self.start) * 1000, 3)
+        if exc_info[0] is not None:
+            self.fields["error"] = repr(exc_info[1])
+        self.telemetry.emit(self.event, **self.fields)
+        return False
+
+class _NullSpan:
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+# Queued as (marker, threading.Event): the writer flushes its sinks (and stops, for _STOP) and sets the event
+_FLUSH = object()
+_STOP = object()
+
+class Telemetry:
+    """Event bus; costs one attribute check per emit while disabled"""
+    
+    def __init__(self):
+        self.enabled = False
+        self.sinks = []
+        self.ring = None
+        
+        # Event name -> fraction of events kept, and the credit carried towards the next kept one
+        self.sampling = {}
+        self._credit = {}
+        
+        # Events emitted, and events dropped by sampling, since configure()
+        self.emitted = 0
+        self.sampled_out = 0
+        
+        self._queue = queue.SimpleQueue()
+        self._writer = None
+        self._exit_hook = False
+    
+    def configure(self, sinks: Iterable, sampling: Optional[Dict[str, float]] = None):
+        """Replace the sinks (closing the old ones) and sampling rates; no sinks disables telemetry"""
+        self.close()
+        self.sinks = list(sinks)
+        self.ring = next((sink for sink in self.sinks if isinstance(sink, RingBufferSink)), None)
+        self.sampling = dict(sampling or {})
+        self._credit = {}
+        self.emitted = 0
+        self.sampled_out = 0
+        self.enabled = bool(self.sinks)
+        if self.enabled:
+            self._queue = queue.SimpleQueue()  # drop anything emitted after the last close
+            self._writer = threading.Thread(target=self._write_worker, name="telemetry", daemon=True)
+            self._writer.start()
+            if not self._exit_hook:
+                atexit.register(self.close)
+                self._exit_hook = True
+    
+    def configure_from_environment(self):
+        """Set up sinks from CID_TELEMETRY / CID_TELEMETRY_SAMPLE (disabled when unset)"""
+        value = os.environ.get(TELEMETRY_ENV, "")
+        if value.lower() in ("", "0", "false", "no"):
+            return
+        
+        sinks = [RingBufferSink(Config.TELEMETRY_RING_SIZE)]
+        if value.lower() != "ring":
+            path = value if value.lower().endswith(".jsonl") else Config.TELEMETRY_PATH
+            sinks.append(RollingFileSink(path, Config.TELEMETRY_MAX_BYTES, Config.TELEMETRY_BACKUPS))
+        
+        sampling = dict(Config.TELEMETRY_SAMPLING)
+        for setting in filter(None, os.environ.get(SAMPLE_ENV, "").split(",")):
+            event, _, rate = setting.partition("=")
+            sampling[event.strip()] = float(rate)
+        self.configure(sinks, sampling)
+    
+    def emit(self, event: str, **fields):
+        """Record an event; fields must be JSON-friendly (anything else is written with str())"""
+        if not self.enabled:
+            return
+        rate = self.sampling.get(event)
+        if rate is not None:
+            # Keep exactly rate of these events, evenly spaced (no RNG, so replays stay deterministic)
+            credit = self._credit.get(event, 0.0) + rate
+            if credit < 1.0:
+                self._credit[event] = credit
+                self.sampled_out += 1
+                return
+            self._credit[event] = credit - 1.0
+        self.emitted += 1
+        self._queue.put((time.time(), event, fields))
+    
+    def span(self, event: str, **fields):
+        """Context manager emitting event with the block's duration as ms"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, event, fields)
+    
+    def flush(self):
+        """Block until everything emitted so far has reached the sinks"""
+        if self._writer is None:
+            return
+        done = threading.Event()
+        self._queue.put((_FLUSH, done))
+        done.wait()
+    
+    def close(self):
+        """Write what is queued, stop the writer and close the sinks"""
+        writer = self._writer
+        if writer is None:
+            return
+        self.enabled = False
+        done = threading.Event()
+        self._queue.put((_STOP, done))
+        done.wait()
+        writer.join()
+        self._writer = None
+        for sink in self.sinks:
+            sink.close()
+    
+    def _write_worker(self):
+        """Drain the queue in batches into every sink until closed"""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < WRITE_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            partial = len(batch) < WRITE_BATCH
+            
+            records = []
+            for item in batch:
+                if item[0] is not _FLUSH and item[0] is not _STOP:
+                    timestamp, event, fields = item
+                    records.append({"ts": round(timestamp, 6), "event": event, **fields})
+                    continue
+                
+                # Flush or stop: everything before it is written first
+                self._write(records)
+                records = []
+                for sink in self.sinks:
+                    sink.flush()
+                kind, done = item
+                done.set()
+                if kind is _STOP:
+                    return
+            self._write(records)
+            if partial:
+                time.sleep(WRITE_INTERVAL)
+    
+    def _write(self, records: List[Dict]):
+        if not records:
+            return
+        for sink in self.sinks:
+            try:
+                sink.write(records)
+            except (OSError, ValueError) as error:
+                print(f"Telemetry sink {type(sink).__name__} failed: {error}")
+
+# The engine-wide bus; disabled until configured
+bus = Telemetry()
@@ -0,0 +1,53 @@
+"""
+Text Cache - Shared LRU cache of rendered text surfaces
+Static labels are rasterized once and reused on every frame
+"""
+
+from collections import OrderedDict
+from typing import Dict
+
+class TextCache:
+    """Caches font.render() results keyed on (font, text, color, antialias)"""
+    
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def render(self, font, text: str, color, antialias: bool = True):
+        """Return a cached surface, rendering it on first use (callers must not draw on it)"""
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+    
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+    
+    def stats(self) -> Dict:
+        """Cache statistics for diagnostics"""
+        return {
+            "entries": len(self._surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate
+        }
+    
+    def clear(self):
+        """Drop every cached surface (e.g. after fonts are reloaded)"""
+        self._surfaces.clear()
@@ -0,0 +1,118 @@
+"""
+Text Layout - Word wrapping by measured pixel width
+Wrapped paragraphs are rendered once into a single surface and reused until
+their text, style or width changes.
+"""
+
+from collections import OrderedDict
+from typing import Dict, List
+
+import pygame
+
+class TextLayout:
+    """Wraps text with font.size() and caches each laid-out paragraph as one surface"""
+    
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._paragraphs = OrderedDict()
+        self._lines = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def wrap(self, font, text: str, width: int) -> List[str]:
+        """Split text into lines no wider than width pixels (explicit newlines are kept)"""
+        key = (font, text, width)
+        lines = self._lines.get(key)
+        if lines is not None:
+            self._lines.move_to_end(key)
+            return lines
+        
+        lines = []
+        for paragraph in text.split("\n"):
+            lines.extend(self._wrap_paragraph(font, paragraph, width))
+        
+        self._lines[key] = lines
+        if len(self._lines) > self.max_entries:
+            self._lines.popitem(last=False)
+        return lines
+    
+    def render(self, font, text: str, color, width: int, line_height: int = None,
+               bullet: str = "") -> pygame.Surface:
+        """
+        Return the wrapped paragraph as one transparent surface
+        A bullet is drawn before the first line and continuation lines hang
+        under the text that follows it. Callers must not draw on the result.
+        """
+        line_height = line_height or font.get_linesize()
+        key = (font, text, tuple(color), width, line_height, bullet)
+        surface = self._paragraphs.get(key)
+        if surface is not None:
+            self._paragraphs.move_to_end(key)
+            self.hits += 1
+            return surface
+        
+        self.misses += 1
+        indent = font.size(bullet)[0] if bullet else 0
+        lines = self.wrap(font, text, max(1, width - indent))
+        
+        surface = pygame.Surface((width, max(1, len(lines)) * line_height), pygame.SRCALPHA)
+        if bullet:
+            surface.blit(font.render(bullet, True, color), (0, 0))
+        for i, line in enumerate(lines):
+            if line:
+                surface.blit(font.render(line, True, color), (indent, i * line_height))
+        
+        self._paragraphs[key] = surface
+        if len(self._paragraphs) > self.max_entries:
+            self._paragraphs.popitem(last=False)
+        return surface
+    
+    def _wrap_paragraph(self, font, paragraph: str, width: int) -> List[str]:
+        words = paragraph.split()
+        if not words:
+            return [""]
+        
+        lines = []
+        current_line = ""
+        for word in words:
+            candidate = f"{current_line} {word}" if current_line else word
+            if font.size(candidate)[0] <= width:
+                current_line = candidate
+                continue
+            
+            if current_line:
+                lines.append(current_line)
+            # A single word wider than the line is broken between characters
+            while font.size(word)[0] > width and len(word) > 1:
+                split = self._fit_characters(font, word, width)
+                lines.append(word[:split])
+                word = word[split:]
+            current_line = word
+        
+        lines.append(current_line)
+        return lines
+    
+    def _fit_characters(self, font, word: str, width: int) -> int:
+        """Longest prefix of word that fits in width (at least one character)"""
+        low, high = 1, len(word)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if font.size(word[:middle])[0] <= width:
+                low = middle
+            else:
+                high = middle - 1
+        return low
+    
+    def stats(self) -> Dict:
+        """Cache statistics for diagnostics"""
+        return {
+            "paragraphs": len(self._paragraphs),
+            "wrapped_texts": len(self._lines),
+            "hits": self.hits,
+            "misses": self.misses
+        }
+    
+    def clear(self):
+        """Drop every cached layout (e.g. after fonts are reloaded)"""
+        self._paragraphs.clear()
+        self._lines.clear()
@@ -0,0 +1,73 @@
+"""
+Tile Cache - Background tiles rendered on first use and kept in an LRU cache
+A large background is cut into square tiles per zoom level. Only tiles the
+camera can see are rendered, and the least recently drawn tile's surface is
+reused when the cache is full, so memory stays bounded however big the
+scene is.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import pygame
+
+from src.engine.camera import Camera
+
+# render(surface, zoom, tile_x, tile_y) draws one tile of the background at a zoom level
+TileRenderer = Callable[[pygame.Surface, float, int, int], None]
+
+class TileCache:
+    """Bounded cache of rendered background tiles keyed by (zoom level, column, row)"""
+    
+    def __init__(self, render_tile: TileRenderer, tile_size: int = 256, capacity: int = 96):
+        self.render_tile = render_tile
+        self.tile_size = tile_size
+        self.capacity = capacity
+        self.tiles = OrderedDict()
+        
+        # Tile lookups served from the cache vs rendered
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, zoom_index: int, zoom: float, tile_x: int, tile_y: int, template: pygame.Surface) -> pygame.Surface:
+        """A tile, rendering it (into a recycled surface when full) if it isn't cached"""
+        key = (zoom_index, tile_x, tile_y)
+        tile = self.tiles.get(key)
+        if tile is not None:
+            self.tiles.move_to_end(key)
+            self.hits += 1
+            return tile
+        
+        self.misses += 1
+        if len(self.tiles) >= self.capacity:
+            _key, tile = self.tiles.popitem(last=False)
+        else:
+            tile = pygame.Surface((self.tile_size, self.tile_size), 0, template)
+        self.render_tile(tile, zoom, tile_x, tile_y)
+        self.tiles[key] = tile
+        return tile
+    
+    def draw(self, surface: pygame.Surface, camera: Camera, area: Optional[pygame.Rect] = None):
+        """Blit the tiles covering area (the camera's viewport by default)"""
+        area = camera.viewport.clip(area) if area is not None else camera.viewport
+        size = self.tile_size
+        offset_x, offset_y = camera.offset
+        left = area.left - camera.viewport.x + offset_x
+        top = area.top - camera.viewport.y + offset_y
+        first_x, first_y = left // size, top // size
+        last_x = (left + area.width - 1) // size
+        last_y = (top + area.height - 1) // size
+        
+        zoom_index, zoom = camera.zoom_index, camera.zoom
+        origin_x = camera.viewport.x - offset_x
+        origin_y = camera.viewport.y - offset_y
+        previous_clip = surface.get_clip()
+        surface.set_clip(area.clip(previous_clip))
+        for tile_y in range(first_y, last_y + 1):
+            for tile_x in range(first_x, last_x + 1):
+                tile = self.get(zoom_index, zoom, tile_x, tile_y, surface)
+                surface.blit(tile, (origin_x + tile_x * size, origin_y + tile_y * size))
+        surface.set_clip(previous_clip)
+    
+    def clear(self):
+        self.tiles.clear()
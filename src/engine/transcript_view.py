@@ -0,0 +1,201 @@
+"""
+Transcript View - Virtualized scrollback for long conversations
+Keeps every entry in a compact store and only wraps and rasterizes the lines
+inside the viewport, so drawing costs the same at 10 or 10,000 entries.
+"""
+
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Dict
+
+import pygame
+
+from src.engine.text_layout import TextLayout
+
+class TranscriptView:
+    """Scrollable, word-wrapped transcript drawn into a fixed screen rect"""
+    
+    # Screen-heights of line surfaces kept around for scrolling back and forth
+    LINE_CACHE_SCREENS = 3
+    # Rate of the exponential ease toward the scroll target (per second)
+    SCROLL_SMOOTHING = 12.0
+    
+    def __init__(self, font, rect, palette: Dict[str, tuple], line_height: int = None,
+                 layout: TextLayout = None):
+        self.font = font
+        self.rect = pygame.Rect(rect)
+        self.line_height = line_height or font.get_linesize()
+        self.layout = layout or TextLayout()
+        
+        # Kind names map to palette indexes stored per entry
+        self.kinds = list(palette)
+        self.colors = [tuple(palette[kind]) for kind in self.kinds]
+        
+        # Compact store: entry text plus parallel typed arrays
+        self._texts = []
+        self._kind_ids = array("B")
+        self._line_starts = array("I")  # first wrapped line of each entry
+        self.total_lines = 0
+        
+        # Pixel offset of the viewport top; scroll eases toward scroll_target
+        self.scroll = 0.0
+        self.scroll_target = 0.0
+        self.follow = True  # stick to the newest entry while at the bottom
+        
+        self._line_surfaces = OrderedDict()
+        self._max_cached_lines = self.visible_line_count * self.LINE_CACHE_SCREENS
+    
+    def __len__(self):
+        return len(self._texts)
+    
+    @property
+    def visible_line_count(self) -> int:
+        return self.rect.height // self.line_height + 2
+    
+    @property
+    def content_height(self) -> int:
+        return self.total_lines * self.line_height
+    
+    @property
+    def max_scroll(self) -> float:
+        return max(0, self.content_height - self.rect.height)
+    
+    @property
+    def animating(self) -> bool:
+        """True while a smooth scroll is still moving"""
+        return self.scroll != self.scroll_target
+    
+    def append(self, text: str, kind: str):
+        """Add an entry; only its wrapped line count is computed now"""
+        line_count = len(self.layout.wrap(self.font, text, self.rect.width))
+        self._texts.append(text)
+        self._kind_ids.append(self.kinds.index(kind))
+        self._line_starts.append(self.total_lines)
+        self.total_lines += line_count
+        
+        if self.follow:
+            self.scroll_target = self.max_scroll
+    
+    def export(self) -> Dict:
+        """
+        The store as plain data for save files
+        Line counts are kept with the width they were wrapped at, so restoring
+        at the same width skips re-wrapping.
+        """
+        starts = self._line_starts
+        kinds = self.kinds
+        return {
+            "texts": list(self._texts),
+            "kinds": [kinds[kind_id] for kind_id in self._kind_ids],
+            "width": self.rect.width,
+            "line_counts": [end - start for start, end in zip(starts, [*starts[1:], self.total_lines])]
+        }
+    
+    def restore(self, data: Dict):
+        """Replace the store with exported data and jump to the newest entry"""
+        self.clear()
+        if data["width"] != self.rect.width:
+            for text, kind in zip(data["texts"], data["kinds"]):
+                self.append(text, kind)
+        else:
+            kind_ids = {kind: index for index, kind in enumerate(self.kinds)}
+            self._texts = list(data["texts"])
+            self._kind_ids = array("B", (kind_ids[kind] for kind in data["kinds"]))
+            for count in data["line_counts"]:
+                self._line_starts.append(self.total_lines)
+                self.total_lines += count
+        self.scroll_to(self.max_scroll, smooth=False)
+    
+    def clear(self):
+        """Remove every entry"""
+        self._texts.clear()
+        del self._kind_ids[:]
+        del self._line_starts[:]
+        self._line_surfaces.clear()
+        self.total_lines = 0
+        self.scroll = self.scroll_target = 0.0
+        self.follow = True
+    
+    def set_width(self, width: int):
+        """Re-wrap the store for a new width (the only operation that touches every entry)"""
+        if width == self.rect.width:
+            return
+        self.rect.width = width
+        self._line_surfaces.clear()
+        self.total_lines = 0
+        for i, text in enumerate(self._texts):
+            self._line_starts[i] = self.total_lines
+            self.total_lines += len(self.layout.wrap(self.font, text, width))
+        self.scroll_to(self.max_scroll if self.follow else self.scroll_target, smooth=False)
+    
+    def scroll_to(self, offset: float, smooth: bool = True):
+        """Scroll so offset (pixels from the top of the transcript) is at the viewport top"""
+        self.scroll_target = min(max(0.0, offset), self.max_scroll)
+        self.follow = self.scroll_target >= self.max_scroll
+        if not smooth:
+            self.scroll = self.scroll_target
+    
+    def scroll_by(self, pixels: float):
+        self.scroll_to(self.scroll_target + pixels)
+    
+    def scroll_lines(self, lines: int):
+        self.scroll_by(lines * self.line_height)
+    
+    def page(self, pages: int):
+        """Scroll by whole viewports, keeping one line of overlap"""
+        self.scroll_by(pages * (self.rect.height - self.line_height))
+    
+    def scroll_to_end(self):
+        self.scroll_to(self.max_scroll)
+    
+    def update(self, dt: float) -> bool:
+        """Advance smooth scrolling; returns True when the view moved"""
+        if not self.animating:
+            return False
+        
+        blend = min(1.0, dt * self.SCROLL_SMOOTHING)
+        self.scroll += (self.scroll_target - self.scroll) * blend
+        if abs(self.scroll_target - self.scroll) < 0.5:
+            self.scroll = self.scroll_target
+        return True
+    
+    def render(self, screen):
+        """Draw the lines that intersect the viewport"""
+        if not self._texts:
+            return
+        
+        clip = screen.get_clip()
+        screen.set_clip(self.rect.clip(clip))
+        
+        offset = int(self.scroll)
+        first_line = offset // self.line_height
+        last_line = min(self.total_lines, first_line + self.visible_line_count)
+        entry = bisect_right(self._line_starts, first_line) - 1
+        
+        line = first_line
+        while line < last_line and entry < len(self._texts):
+            lines = self.layout.wrap(self.font, self._texts[entry], self.rect.width)
+            for line_index in range(line - self._line_starts[entry], len(lines)):
+                if line >= last_line:
+                    break
+                surface = self._line_surface(entry, line_index, lines[line_index])
+                screen.blit(surface, (self.rect.x, self.rect.y + line * self.line_height - offset))
+                line += 1
+            entry += 1
+        
+        screen.set_clip(clip)
+    
+    def _line_surface(self, entry: int, line_index: int, text: str) -> pygame.Surface:
+        """Rasterize one wrapped line, reusing it while it stays near the viewport"""
+        key = (entry, line_index)
+        surface = self._line_surfaces.get(key)
+        if surface is not None:
+            self._line_surfaces.move_to_end(key)
+            return surface
+        
+        surface = self.font.render(text, True, self.colors[self._kind_ids[entry]])
+        self._line_surfaces[key] = surface
+        if len(self._line_surfaces) > self._max_cached_lines:
+            self._line_surfaces.popitem(last=False)
+        return surface
@@ -0,0 +1,107 @@
+"""
+Case Analytics - Archive-wide deduction scoring
+Scores every saved case's evidence graph across a process pool and streams
+one JSON line per case.
+
+Usage: python -m src.modules.case_analytics archive.db -o report.jsonl
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from typing import Dict, Iterable, Optional, TextIO
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from src.modules.evidence_store import EvidenceStore
+
+# Each worker process keeps its own read connection to the archive
+_worker_store = None
+
+def _init_worker(db_path: str):
+    global _worker_store
+    _worker_store = EvidenceStore(db_path)
+
+def _peak_rss_mb() -> Optional[float]:
+    """Peak resident memory of this process (ru_maxrss is KB on Linux, bytes on macOS)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak /= 1024
+    return round(peak / 1024, 1)
+
+def analyze_case(case_id: str, chain_limit: int = 3) -> Dict:
+    """Load one case graph in a worker and compute its analytics record"""
+    start = time.perf_counter()
+    graph = _worker_store.load_graph(case_id)
+    components = graph.get_components()
+    
+    return {
+        "case_id": case_id,
+        "evidence": len(graph.evidence_nodes),
+        "connections": len(graph.connections),
+        "deduction_score": round(graph.deduction_score, 3),
+        "components": len(components),
+        "largest_component": len(components[0]) if components else 0,
+        "strongest_chains": graph.get_strongest_chains(chain_limit),
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 3),
+        "worker_pid": os.getpid(),
+        "worker_peak_rss_mb": _peak_rss_mb()
+    }
+
+def run_report(db_path: str, output: TextIO, workers: Optional[int] = None,
+               case_ids: Optional[Iterable[str]] = None, chunksize: int = 16) -> Dict:
+    """
+    Score cases in parallel and write results to output as they complete
+    Returns a summary with throughput and peak memory per worker.
+    """
+    if case_ids is None:
+        store = EvidenceStore(db_path)
+        case_ids = store.list_cases()
+        store.close()
+    
+    workers = workers or os.cpu_count() or 1
+    worker_memory = {}
+    cases = 0
+    start = time.perf_counter()
+    
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(db_path,)) as pool:
+        for record in pool.imap_unordered(analyze_case, case_ids, chunksize=chunksize):
+            output.write(json.dumps(record) + "\n")
+            cases += 1
+            worker_memory[record["worker_pid"]] = record["worker_peak_rss_mb"]
+    
+    elapsed = time.perf_counter() - start
+    return {
+        "cases": cases,
+        "workers": workers,
+        "elapsed_s": round(elapsed, 3),
+        "cases_per_second": round(cases / elapsed, 1) if elapsed > 0 else None,
+        "worker_peak_rss_mb": worker_memory
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Score every case in an evidence archive")
+    parser.add_argument("db_path", help="SQLite evidence archive")
+    parser.add_argument("-o", "--output", default="-", help="JSON lines output file (default: stdout)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunksize", type=int, default=16, help="cases handed to a worker at a time")
+    args = parser.parse_args()
+    
+    if args.output == "-":
+        summary = run_report(args.db_path, sys.stdout, args.workers, chunksize=args.chunksize)
+    else:
+        with open(args.output, "w", encoding="utf-8") as output:
+            summary = run_report(args.db_path, output, args.workers, chunksize=args.chunksize)
+    
+    print(json.dumps(summary), file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+"""
+Case Generator - Seeded procedural cases
+Builds complete case packs (see case_packs.py): suspects with motives,
+triggers and secrets, crime scene markers, interrogation exhibits with
+strengths, team briefings and the ground-truth connections between the
+evidence. Case N of seed S is the same on every run and in every worker, so
+generation splits across a process pool and streams to disk in order.
+
+Usage: python -m src.modules.case_generator 10000 -o cases.jsonl --archive cases.db --evidence evidence.db
+"""
+
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import random
+import sys
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.modules.case_packs import TEAM_MEMBER_KEYS, case_summary, ground_truth_graph
+
+FIRST_NAMES = ["Rajesh", "Priya", "Amit", "Sunita", "Vikram", "Neha", "Arjun", "Kavita", "Rohit", "Meera",
+               "Sanjay", "Anjali", "Deepak", "Pooja", "Manoj", "Ritu", "Karan", "Shalini", "Nikhil", "Swati"]
+LAST_NAMES = ["Kumar", "Singh", "Patel", "Sharma", "Verma", "Gupta", "Mehta", "Iyer", "Nair", "Desai",
+              "Joshi", "Rao", "Malhotra", "Kapoor", "Chopra", "Bose"]
+OCCUPATIONS = ["Office Manager", "Accountant", "Security Guard", "Jeweller", "Driver", "Chef", "Lawyer",
+               "Doctor", "Shop Owner", "Film Producer", "Bank Clerk", "Architect", "Journalist", "Nurse"]
+TRAITS = ["nervous", "defensive", "ambitious", "calm", "arrogant", "evasive", "talkative", "proud",
+          "jealous", "loyal", "impulsive", "secretive", "charming", "bitter"]
+PLACES = ["Corporate Office", "Jewellery Store", "Beach House", "Film Studio", "Hotel Suite", "Warehouse",
+          "Railway Yard", "Art Gallery", "Private Hospital", "Textile Mill", "Harbour Office", "Old Mansion"]
+AREAS = ["Bandra", "Andheri", "Colaba", "Dadar", "Juhu", "Worli", "Powai", "Malad", "Thane", "Chembur"]
+CRIMES = [("Murder", "found dead"), ("Robbery", "robbed"), ("Poisoning", "poisoned"), ("Kidnapping", "abducted"),
+          ("Fraud", "defrauded"), ("Blackmail", "blackmailed"), ("Arson", "caught in a fire")]
+ADJECTIVES = ["Silent", "Midnight", "Broken", "Missing", "Crimson", "Last", "Hidden", "Locked", "Burning", "Stolen"]
+
+# Motive -> (stress triggers, secrets); the victim's name is always a trigger
+MOTIVES = {
+    "money": (["money", "debt", "loan"], ["Owed the victim a large sum", "Was being pressed by moneylenders"]),
+    "promotion": (["promotion", "job", "boss"], ["Was passed over for promotion", "Forged a performance review"]),
+    "affair": (["affair", "wife", "husband"], ["Was having an affair", "Wrote letters to the victim's spouse"]),
+    "inheritance": (["will", "inheritance", "property"], ["Stands to inherit the estate", "Saw the new will"]),
+    "revenge": (["revenge", "past", "brother"], ["Blamed the victim for a death", "Threatened the victim last year"]),
+    "blackmail": (["photos", "secret", "letter"], ["Was being blackmailed", "Paid the victim to stay quiet"])
+}
+ALIBIS = ["I was at home watching TV", "I was at a friend's wedding", "I was working late at the office",
+          "I was on a train to Pune", "I was at the temple with my mother", "I was asleep, alone"]
+
+# Evidence type -> (marker name, exhibit label, exhibit description) templates
+EVIDENCE_KINDS = {
+    "forensic": [("Fingerprint on {object}", "Fingerprint Evidence", "Fingerprints on the {object} match {suspect}"),
+                 ("Blood Sample", "Blood Analysis", "Blood near the {object} matches {suspect}"),
+                 ("Hair Strand", "Hair Sample", "A hair on the {object} belongs to {suspect}")],
+    "digital": [("Security Camera", "CCTV Footage", "Footage shows {suspect} near the {object}"),
+                ("Phone Records", "Call Records", "{suspect} called the victim an hour before"),
+                ("Laptop", "Deleted Emails", "Recovered emails from {suspect} mention the {object}")],
+    "testimony": [("Witness", "Witness Testimony", "A witness saw {suspect} by the {object}"),
+                  ("Neighbour", "Neighbour's Statement", "The neighbour heard {suspect} arguing")],
+    "physical": [("Broken {object}", "Physical Evidence", "The broken {object} has {suspect}'s marks on it"),
+                 ("Footprints", "Footprint Cast", "Footprints by the {object} match {suspect}'s shoes"),
+                 ("Torn Fabric", "Fabric Sample", "Fabric caught on the {object} matches {suspect}'s coat")]
+}
+OBJECTS = ["door", "desk", "window", "safe", "cupboard", "staircase", "lamp", "vase", "cabinet", "balcony"]
+
+# Evidence type pair -> ground-truth connection type
+CONNECTION_TYPES = {
+    frozenset(["forensic"]): "forensic_match",
+    frozenset(["forensic", "physical"]): "physical_match",
+    frozenset(["physical"]): "physical_match",
+    frozenset(["digital"]): "time_correlation",
+    frozenset(["digital", "forensic"]): "time_correlation",
+    frozenset(["digital", "physical"]): "time_correlation"
+}
+
+BRIEFING_LINES = {
+    "ACP": ("Coordinating Investigation", "Reviewing the {crime} case and planning next steps", "Available for consultation", [
+        "Team, {victim} was {crimed} at the {place}.",
+        "We have {evidence} pieces of evidence and {suspects} suspects.",
+        "Daya, secure the {place} and talk to the staff.",
+        "Abhijeet, trace {victim}'s movements that day.",
+        "Dr. Salunkhe, I need the forensic report first.",
+        "Something is wrong here. Every detail matters."]),
+    "DAYA": ("Field Investigation", "Searching the {place} and questioning staff", "Ready for field work", [
+        "Boss, the {place} in {area} has two entrances.",
+        "The guard remembers someone leaving in a hurry.",
+        "I found signs of forced entry near the {object}.",
+        "Give me the word and I'll bring the suspects in."]),
+    "ABHIJEET": ("Evidence Analysis", "Analysing {victim}'s background", "Analysing evidence", [
+        "{victim} had enemies, and at least {suspects} people with motives.",
+        "The timeline doesn't match what the witnesses said.",
+        "Someone close to {victim} is hiding something.",
+        "The pattern suggests this was planned."]),
+    "SALUNKHE": ("Forensic Analysis", "Processing evidence from the {place}", "In laboratory", [
+        "The forensic report on the {place} is almost ready.",
+        "We lifted prints from the {object}.",
+        "The {crime_lower} happened between {hour} and {hour_after} PM.",
+        "Science does not lie, boys."])
+}
+UPDATES = ["New witness came forward with information", "Forensic analysis of fingerprints completed",
+           "Suspect's alibi has been questioned", "Additional evidence found at a secondary location",
+           "CCTV footage recovered from a nearby shop", "Victim's phone records obtained"]
+
+# Markers stay clear of the HUD on screen-sized scenes
+SCENE_MARGINS = (320, 170, 60, 90)  # left, top, right, bottom
+MARKER_SPACING = 110  # scene pixels per marker along each axis (up to 16 markers fit on screen)
+
+class CaseGenerator:
+    """Generates case packs; case N of a seed is always the same"""
+    
+    def __init__(self, seed: int = 0, evidence_range: Tuple[int, int] = (4, 12),
+                 suspect_range: Tuple[int, int] = (2, 5), screen_size: Tuple[int, int] = (1280, 720),
+                 prefix: str = "GEN"):
+        self.seed = seed
+        self.evidence_range = evidence_range
+        self.suspect_range = suspect_range
+        self.screen_size = screen_size
+        self.prefix = prefix
+    
+    def case_id(self, index: int) -> str:
+        return f"{self.prefix}_{self.seed}_{index:07d}"
+    
+    def generate(self, index: int) -> Dict:
+        """A complete, valid case pack"""
+        rng = random.Random(f"{self.seed}/{index}")
+        crime, crimed = rng.choice(CRIMES)
+        place = rng.choice(PLACES)
+        area = rng.choice(AREAS)
+        victim = f"{rng.choice(['Mr.', 'Mrs.', 'Dr.'])} {rng.choice(LAST_NAMES)}"
+        status = rng.choices(("Active", "Cold", "Solved"), (6, 2, 2))[0]
+        
+        suspects = self._suspects(rng, victim)
+        guilty = next(suspect for suspect in suspects if suspect["guilty"])
+        evidence, links = self._scene_evidence(rng, suspects)
+        hour = rng.randint(7, 10)
+        values = {
+            "crime": crime, "crime_lower": crime.lower(), "crimed": crimed, "victim": victim,
+            "place": place, "area": area, "object": rng.choice(OBJECTS),
+            "evidence": len(evidence), "suspects": len(suspects),
+            "hour": hour, "hour_after": hour + 1
+        }
+        
+        # Interrogate the culprit most of the time; exhibits point at whoever sits in the room
+        interrogated = guilty if rng.random() < 0.7 else rng.choice(suspects)
+        exhibits = self._exhibits(rng, evidence, links, interrogated["name"])
+        
+        return {
+            "case_id": self.case_id(index),
+            "title": f"The {rng.choice(ADJECTIVES)} {place} {crime}",
+            "status": status,
+            "victim": victim,
+            "location": f"{place}, {area}",
+            "date": f"{rng.randint(1998, 2024)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "description": f"{victim} was {crimed} at the {place} in {area}. "
+                           f"{len(suspects)} suspects, {len(evidence)} pieces of evidence.",
+            "scene": self._scene(rng, f"{place}, {area}", evidence),
+            "suspects": suspects,
+            "interrogation": {"suspect": interrogated["name"], "evidence": exhibits},
+            "briefings": {member: self._briefing(rng, member, values) for member in TEAM_MEMBER_KEYS},
+            "updates": rng.sample(UPDATES, rng.randint(2, 4)),
+            "connections": self._connections(rng, evidence, links)
+        }
+    
+    def generate_many(self, start: int, stop: int) -> Iterator[Dict]:
+        for index in range(start, stop):
+            yield self.generate(index)
+    
+    def _suspects(self, rng: random.Random, victim: str) -> List[Dict]:
+        count = rng.randint(*self.suspect_range)
+        names = set()
+        while len(names) < count:
+            names.add(f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}")
+        culprit = rng.randrange(count)
+        suspects = []
+        for i, name in enumerate(sorted(names)):
+            motive = rng.choice(list(MOTIVES))
+            triggers, secrets = MOTIVES[motive]
+            suspects.append({
+                "name": name,
+                "age": rng.randint(22, 68),
+                "occupation": rng.choice(OCCUPATIONS),
+                "background": f"Knew {victim} through work; motive: {motive}",
+                "personality_traits": rng.sample(TRAITS, 3),
+                "guilty": i == culprit,
+                "alibi": rng.choice(ALIBIS),
+                "secrets": list(secrets),
+                "stress_triggers": triggers + [victim.split()[-1].lower()]
+            })
+        return suspects
+    
+    def _scene_evidence(self, rng: random.Random, suspects: List[Dict]) -> Tuple[List[Dict], List[str]]:
+        """Scene markers (without positions) and the suspect each one points at"""
+        count = rng.randint(*self.evidence_range)
+        guilty = next(suspect["name"] for suspect in suspects if suspect["guilty"])
+        evidence, links = [], []
+        for i in range(count):
+            evidence_type = rng.choice(list(EVIDENCE_KINDS))
+            name, label, description = rng.choice(EVIDENCE_KINDS[evidence_type])
+            subject = rng.choice(OBJECTS)
+            # About half the evidence implicates the culprit, the rest are red herrings
+            links.append(guilty if rng.random() < 0.5 else rng.choice(suspects)["name"])
+            evidence.append({
+                "id": f"ev_{i}",
+                "name": name.format(object=subject.title()),
+                "type": evidence_type,
+                "label": label,
+                "description": description.format(object=subject, suspect=links[-1])
+            })
+        return evidence, links
+    
+    def _scene(self, rng: random.Random, name: str, evidence: List[Dict]) -> Dict:
+        """Place markers on a jittered grid so they don't overlap"""
+        screen_width, screen_height = self.screen_size
+        left, top, right, bottom = SCENE_MARGINS
+        side = math.ceil(math.sqrt(len(evidence)))
+        width = max(screen_width, side * MARKER_SPACING + left + right)
+        height = max(screen_height, side * MARKER_SPACING + top + bottom)
+        cell_width = (width - left - right) / side
+        cell_height = (height - top - bottom) / side
+        
+        markers = []
+        for item, cell in zip(evidence, rng.sample(range(side * side), len(evidence))):
+            column, row = divmod(cell, side)
+            markers.append({
+                "id": item["id"],
+                "name": item["name"],
+                "type": item["type"],
+                "x": int(left + (column + rng.uniform(0.2, 0.8)) * cell_width),
+                "y": int(top + (row + rng.uniform(0.2, 0.8)) * cell_height)
+            })
+        scene = {"name": name, "evidence": markers}
+        if (width, height) != self.screen_size:
+            scene.update(width=width, height=height)
+        return scene
+    
+    def _exhibits(self, rng: random.Random, evidence: List[Dict], links: List[str], suspect: str) -> List[Dict]:
+        """Up to nine exhibits; evidence pointing at the suspect in the room is strong"""
+        chosen = sorted(rng.sample(range(len(evidence)), min(9, len(evidence))))
+        return [{
+            "id": evidence[i]["id"],
+            "label": evidence[i]["label"],
+            "description": evidence[i]["description"],
+            "strength": round(rng.uniform(0.6, 0.95) if links[i] == suspect else rng.uniform(0.1, 0.5), 2)
+        } for i in chosen]
+    
+    def _connections(self, rng: random.Random, evidence: List[Dict], links: List[str]) -> List[Dict]:
+        """Chain the evidence pointing at each suspect, typed by what the two pieces are"""
+        by_suspect = {}
+        for item, suspect in zip(evidence, links):
+            by_suspect.setdefault(suspect, []).append(item)
+        connections = []
+        for items in by_suspect.values():
+            rng.shuffle(items)
+            for first, second in zip(items, items[1:]):
+                kinds = frozenset([first["type"], second["type"]])
+                connection_type = ("witness_testimony" if "testimony" in kinds
+                                   else CONNECTION_TYPES.get(kinds, "location_match"))
+                connections.append({"from": first["id"], "to": second["id"], "type": connection_type})
+        return connections
+    
+    def _briefing(self, rng: random.Random, member: str, values: Dict) -> Dict:
+        status, task, availability, lines = BRIEFING_LINES[member]
+        return {
+            "status": status,
+            "current_task": task.format(**values),
+            "briefing": [line.format(**values) for line in lines],
+            "availability": availability
+        }
+
+def _generate_chunk(job: Tuple[Dict, int, int]) -> List[Tuple[str, str]]:
+    """Worker: generate and serialize a range of cases as (case_id, json) pairs"""
+    options, start, stop = job
+    generator = CaseGenerator(**options)
+    return [(pack["case_id"], json.dumps(pack, separators=(",", ":")))
+            for pack in generator.generate_many(start, stop)]
+
+def generate_serialized(count: int, options: Optional[Dict] = None, workers: int = 1,
+                        chunk: int = 256, start: int = 0) -> Iterator[Tuple[str, str]]:
+    """
+    (case_id, JSON) for cases start..start+count, in order
+    Workers serialize too, so the parent process only has to write.
+    """
+    options = options or {}
+    jobs = [(options, first, min(first + chunk, start + count)) for first in range(start, start + count, chunk)]
+    if workers <= 1:
+        for job in jobs:
+            yield from _generate_chunk(job)
+        return
+    
+    with multiprocessing.Pool(workers) as pool:
+        for serialized in pool.imap(_generate_chunk, jobs):
+            yield from serialized
+
+def write_cases(serialized: Iterable[Tuple[str, str]], output: str, archive: Optional[str] = None,
+                evidence: Optional[str] = None, batch: int = 1000) -> int:
+    """
+    Stream generated cases to disk
+    output is a .jsonl file (one pack per line) or a directory of <case_id>.json
+    packs (a CASE_PACK_DIR). Optionally also adds each case to a CaseRepository
+    archive and its ground-truth graph to an EvidenceStore. Returns the count.
+    """
+    from src.modules.case_repository import CaseRepository
+    from src.modules.evidence_store import EvidenceStore
+    
+    lines = output.endswith(".jsonl")
+    if lines:
+        directory = os.path.dirname(output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        stream = open(output, "w", encoding="utf-8")
+    else:
+        os.makedirs(output, exist_ok=True)
+        stream = None
+    repository = CaseRepository(archive) if archive else None
+    store = EvidenceStore(evidence) if evidence else None
+    
+    written = 0
+    summaries = []
+    try:
+        for case_id, text in serialized:
+            if lines:
+                stream.write(text + "\n")
+            else:
+                with open(os.path.join(output, f"{case_id}.json"), "w", encoding="utf-8") as pack_file:
+                    pack_file.write(text)
+            if repository or store:
+                pack = json.loads(text)
+                if repository:
+                    summaries.append(case_summary(pack))
+                    if len(summaries) >= batch:
+                        repository.add_cases(summaries)
+                        summaries = []
+                if store:
+                    store.save_graph(case_id, ground_truth_graph(pack))
+            written += 1
+        if repository and summaries:
+            repository.add_cases(summaries)
+    finally:
+        if stream:
+            stream.close()
+        if repository:
+            repository.close()
+        if store:
+            store.close()
+    return written
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate procedural case packs")
+    parser.add_argument("count", type=int, help="cases to generate")
+    parser.add_argument("-o", "--output", default="data/generated_cases.jsonl",
+                        help="a .jsonl file, or a directory to write one pack per case into")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--start", type=int, default=0, help="index of the first case")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk", type=int, default=256, help="cases per worker job")
+    parser.add_argument("--evidence-range", type=int, nargs=2, default=(4, 12), metavar=("MIN", "MAX"))
+    parser.add_argument("--suspect-range", type=int, nargs=2, default=(2, 5), metavar=("MIN", "MAX"))
+    parser.add_argument("--archive", help="also add case summaries to this Case Files database")
+    parser.add_argument("--evidence", help="also store ground-truth graphs in this evidence archive")
+    args = parser.parse_args()
+    
+    options = {"seed": args.seed, "evidence_range": tuple(args.evidence_range),
+               "suspect_range": tuple(args.suspect_range)}
+    workers = args.workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    written = write_cases(generate_serialized(args.count, options, workers, args.chunk, args.start),
+                          args.output, args.archive, args.evidence)
+    elapsed = time.perf_counter() - start
+    print(json.dumps({
+        "cases": written,
+        "workers": workers,
+        "elapsed_s": round(elapsed, 3),
+        "cases_per_second": round(written / elapsed, 1) if elapsed > 0 else None
+    }), file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
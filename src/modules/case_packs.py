@@ -0,0 +1,371 @@
+"""
+Case Packs - Data-driven case content
+A case pack is a JSON (or YAML, with PyYAML installed) file holding one case:
+its crime scene, suspects, interrogation evidence and team briefings. Packs
+are validated once and compiled to a pickled cache keyed by the source's
+mtime, size and hash, so later runs load pre-validated data without parsing
+the source. Packs are read only when their case is opened.
+
+Usage: python -m src.modules.case_packs [--check]   (compile or validate every pack)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import sys
+import threading
+from typing import Dict, List, Optional
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+from src.modules.evidence_graph import EvidenceGraph
+from src.modules.interrogation import Evidence, SuspectProfile
+
+# Bump when the compiled layout changes so stale caches are rebuilt
+PACK_FORMAT = 4
+
+PACK_EXTENSIONS = (".json", ".yaml", ".yml")
+
+CASE_STATUSES = ("Active", "Cold", "Solved")
+EVIDENCE_TYPES = ("forensic", "digital", "testimony", "physical")
+TEAM_MEMBER_KEYS = ("ACP", "DAYA", "ABHIJEET", "SALUNKHE")
+
+def _field(data: Dict, key: str, kind, where: str, default=None, required: bool = True):
+    """Fetch a field, checking its type (bools are not accepted as numbers)"""
+    if key not in data:
+        if required:
+            raise ValueError(f"{where}: missing {key!r}")
+        return default
+    value = data[key]
+    if isinstance(value, bool) and kind is not bool:
+        raise ValueError(f"{where}.{key}: expected {_kind_name(kind)}, got a boolean")
+    if not isinstance(value, kind):
+        raise ValueError(f"{where}.{key}: expected {_kind_name(kind)}, got {type(value).__name__}")
+    return value
+
+def _kind_name(kind) -> str:
+    if isinstance(kind, tuple):
+        return " or ".join(item.__name__ for item in kind)
+    return kind.__name__
+
+def _strings(data: Dict, key: str, where: str, required: bool = True) -> List[str]:
+    values = _field(data, key, list, where, [], required)
+    for i, value in enumerate(values):
+        if not isinstance(value, str):
+            raise ValueError(f"{where}.{key}[{i}]: expected str, got {type(value).__name__}")
+    return list(values)
+
+def _choice(data: Dict, key: str, choices, where: str) -> str:
+    value = _field(data, key, str, where)
+    if value not in choices:
+        raise ValueError(f"{where}.{key}: {value!r} is not one of {', '.join(choices)}")
+    return value
+
+def validate_pack(data, source: str = "pack") -> Dict:
+    """
+    Check a parsed pack and return it normalized (defaults filled in, unknown keys dropped)
+    Raises ValueError naming the offending field.
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"{source}: a case pack must be an object")
+    
+    pack = {
+        "case_id": _field(data, "case_id", str, source),
+        "title": _field(data, "title", str, source),
+        "status": _choice(data, "status", CASE_STATUSES, source),
+        "victim": _field(data, "victim", str, source, "", required=False),
+        "location": _field(data, "location", str, source, "", required=False),
+        "date": _field(data, "date", str, source),
+        "description": _field(data, "description", str, source, "", required=False)
+    }
+    
+    scene_where = f"{source}.scene"
+    scene = _field(data, "scene", dict, source)
+    evidence = []
+    seen = set()
+    for i, item in enumerate(_field(scene, "evidence", list, scene_where)):
+        where = f"{scene_where}.evidence[{i}]"
+        if not isinstance(item, dict):
+            raise ValueError(f"{where}: expected an object")
+        evidence_id = _field(item, "id", str, where)
+        if evidence_id in seen:
+            raise ValueError(f"{where}: duplicate evidence id {evidence_id!r}")
+        seen.add(evidence_id)
+        evidence.append({
+            "id": evidence_id,
+            "name": _field(item, "name", str, where),
+            "type": _choice(item, "type", EVIDENCE_TYPES, where),
+            "x": _field(item, "x", int, where),
+            "y": _field(item, "y", int, where),
+            # Image the lab enhances (digital evidence), relative to the pack directory
+            "image": _field(item, "image", str, where, None, required=False)
+        })
+    if not evidence:
+        raise ValueError(f"{scene_where}.evidence: a scene needs at least one piece of evidence")
+    
+    # Scenes may be larger than the screen (None: screen sized); markers must lie inside
+    width = _field(scene, "width", int, scene_where, None, required=False)
+    height = _field(scene, "height", int, scene_where, None, required=False)
+    for i, item in enumerate(evidence):
+        if item["x"] < 0 or item["y"] < 0 or (width and item["x"] > width) or (height and item["y"] > height):
+            raise ValueError(f"{scene_where}.evidence[{i}]: position ({item['x']}, {item['y']}) is outside the scene")
+    pack["scene"] = {"name": _field(scene, "name", str, scene_where), "width": width, "height": height,
+                     "evidence": evidence}
+    
+    suspects = {}
+    for i, item in enumerate(_field(data, "suspects", list, source)):
+        where = f"{source}.suspects[{i}]"
+        if not isinstance(item, dict):
+            raise ValueError(f"{where}: expected an object")
+        name = _field(item, "name", str, where)
+        suspects[name] = {
+            "name": name,
+            "age": _field(item, "age", int, where),
+            "occupation": _field(item, "occupation", str, where),
+            "background": _field(item, "background", str, where, "", required=False),
+            "personality_traits": _strings(item, "personality_traits", where, required=False),
+            "guilty": _field(item, "guilty", bool, where),
+            "alibi": _field(item, "alibi", str, where, "", required=False),
+            "secrets": _strings(item, "secrets", where, required=False),
+            "stress_triggers": _strings(item, "stress_triggers", where, required=False)
+        }
+    pack["suspects"] = list(suspects.values())
+    
+    interrogation_where = f"{source}.interrogation"
+    interrogation = _field(data, "interrogation", dict, source)
+    suspect = _field(interrogation, "suspect", str, interrogation_where)
+    if suspect not in suspects:
+        raise ValueError(f"{interrogation_where}.suspect: {suspect!r} is not one of the case's suspects")
+    exhibits = []
+    for i, item in enumerate(_field(interrogation, "evidence", list, interrogation_where)):
+        where = f"{interrogation_where}.evidence[{i}]"
+        if not isinstance(item, dict):
+            raise ValueError(f"{where}: expected an object")
+        strength = _field(item, "strength", (int, float), where)
+        if not 0.0 <= strength <= 1.0:
+            raise ValueError(f"{where}.strength: must be between 0 and 1")
+        exhibits.append({
+            "id": _field(item, "id", str, where),
+            "label": _field(item, "label", str, where),
+            "description": _field(item, "description", str, where),
+            "strength": float(strength)
+        })
+    if len(exhibits) > 9:
+        raise ValueError(f"{interrogation_where}.evidence: at most 9 exhibits (keys 1-9)")
+    pack["interrogation"] = {"suspect": suspect, "evidence": exhibits}
+    
+    briefings = _field(data, "briefings", dict, source)
+    pack["briefings"] = {}
+    for member in TEAM_MEMBER_KEYS:
+        where = f"{source}.briefings.{member}"
+        briefing = _field(briefings, member, dict, f"{source}.briefings")
+        pack["briefings"][member] = {
+            "status": _field(briefing, "status", str, where),
+            "current_task": _field(briefing, "current_task", str, where),
+            "briefing": _strings(briefing, "briefing", where),
+            "availability": _field(briefing, "availability", str, where)
+        }
+    pack["updates"] = _strings(data, "updates", source, required=False)
+    
+    # Ground-truth links between scene evidence (the deductions the case expects)
+    connections = []
+    for i, item in enumerate(_field(data, "connections", list, source, [], required=False)):
+        where = f"{source}.connections[{i}]"
+        if not isinstance(item, dict):
+            raise ValueError(f"{where}: expected an object")
+        for end in ("from", "to"):
+            if _field(item, end, str, where) not in seen:
+                raise ValueError(f"{where}.{end}: {item[end]!r} is not scene evidence")
+        connections.append({
+            "from": item["from"],
+            "to": item["to"],
+            "type": _choice(item, "type", tuple(EvidenceGraph.CONNECTION_TYPE_STRENGTHS), where)
+        })
+    pack["connections"] = connections
+    return pack
+
+def suspect_profile(pack: Dict, name: str) -> SuspectProfile:
+    """The interrogation engine's profile of one of the case's suspects"""
+    return SuspectProfile(**next(suspect for suspect in pack["suspects"] if suspect["name"] == name))
+
+def interrogation_evidence(pack: Dict) -> List[Evidence]:
+    """The exhibits that can be presented in interrogation, as engine Evidence"""
+    return [Evidence(exhibit["id"], exhibit["description"], exhibit["strength"])
+            for exhibit in pack["interrogation"]["evidence"]]
+
+def ground_truth_graph(pack: Dict) -> EvidenceGraph:
+    """Every scene marker, connected the way the case's solution links them"""
+    graph = EvidenceGraph()
+    location = pack["scene"]["name"]
+    graph.add_evidence_bulk((evidence["id"], evidence["type"], evidence["name"], location)
+                            for evidence in pack["scene"]["evidence"])
+    graph.connect_bulk(pack["connections"])
+    return graph
+
+def case_summary(pack: Dict, progress: int = 0) -> Dict:
+    """The pack as a CaseRepository record (for the Case Files archive)"""
+    return {
+        "case_id": pack["case_id"],
+        "title": pack["title"],
+        "status": pack["status"],
+        "victim": pack["victim"],
+        "location": pack["location"],
+        "date": pack["date"],
+        "evidence_count": len(pack["scene"]["evidence"]),
+        "suspects": [suspect["name"] for suspect in pack["suspects"]],
+        "description": pack["description"],
+        "progress": progress
+    }
+
+def parse_pack(path: str, source: bytes) -> Dict:
+    """Parse pack source by file extension"""
+    if path.endswith((".yaml", ".yml")):
+        if yaml is None:
+            raise ValueError(f"{path}: YAML case packs need PyYAML (pip install pyyaml)")
+        try:
+            return yaml.safe_load(source)
+        except yaml.YAMLError as error:
+            raise ValueError(f"{path}: {error}") from error
+    return json.loads(source)  # JSONDecodeError is a ValueError
+
+class CasePackLibrary:
+    """Finds case packs in a directory and loads them on demand through a compiled cache"""
+    
+    def __init__(self, pack_dir: str, cache_dir: Optional[str] = None):
+        self.pack_dir = pack_dir
+        self.cache_dir = cache_dir
+        self._packs = {}
+        self._lock = threading.Lock()
+        self._paths = None
+        
+        # How each load was satisfied, for benchmarks and diagnostics
+        self.stats = {"cached": 0, "revalidated": 0, "compiled": 0}
+    
+    def case_ids(self) -> List[str]:
+        """Case IDs with a pack (lists the directory; no pack is read)"""
+        return sorted(self._pack_paths())
+    
+    def has_case(self, case_id: str) -> bool:
+        return case_id in self._pack_paths()
+    
+    def load(self, case_id: str) -> Dict:
+        """The validated pack for a case (callers must not modify it)"""
+        with self._lock:
+            pack = self._packs.get(case_id)
+            if pack is None:
+                path = self._pack_paths().get(case_id)
+                if path is None:
+                    raise KeyError(f"no case pack for {case_id!r} in {self.pack_dir}")
+                pack = self._load_path(path)
+                if pack["case_id"] != case_id:
+                    raise ValueError(f"{path}: case_id {pack['case_id']!r} does not match the file name")
+                self._packs[case_id] = pack
+            return pack
+    
+    def refresh(self):
+        """Forget discovered and loaded packs (e.g. after editing them)"""
+        with self._lock:
+            self._packs.clear()
+            self._paths = None
+    
+    def _pack_paths(self) -> Dict[str, str]:
+        if self._paths is None:
+            paths = {}
+            if os.path.isdir(self.pack_dir):
+                for name in os.listdir(self.pack_dir):
+                    case_id, extension = os.path.splitext(name)
+                    if extension in PACK_EXTENSIONS:
+                        paths[case_id] = os.path.join(self.pack_dir, name)
+            self._paths = paths
+        return self._paths
+    
+    def _cache_path(self, path: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, os.path.basename(path) + ".pack")
+    
+    def _load_path(self, path: str) -> Dict:
+        """
+        Load through the cache
+        Matching mtime and size trusts the cache without reading the source;
+        otherwise a matching content hash still skips parsing and validation.
+        """
+        stat = os.stat(path)
+        cache_path = self._cache_path(path)
+        cached = self._read_cache(cache_path)
+        if cached and cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+            self.stats["cached"] += 1
+            return cached["pack"]
+        
+        with open(path, "rb") as source_file:
+            source = source_file.read()
+        digest = hashlib.sha1(source).hexdigest()
+        if cached and cached["sha1"] == digest:
+            self.stats["revalidated"] += 1
+            pack = cached["pack"]
+        else:
+            self.stats["compiled"] += 1
+            pack = validate_pack(parse_pack(path, source), os.path.basename(path))
+        
+        self._write_cache(cache_path, {
+            "format": PACK_FORMAT,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha1": digest,
+            "pack": pack
+        })
+        return pack
+    
+    def _read_cache(self, cache_path: Optional[str]) -> Optional[Dict]:
+        if not cache_path or not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path, "rb") as cache_file:
+                cached = pickle.load(cache_file)
+        except Exception:
+            return None  # the cache is disposable: anything unreadable is rebuilt from source
+        if not isinstance(cached, dict) or cached.get("format") != PACK_FORMAT:
+            return None
+        return cached
+    
+    def _write_cache(self, cache_path: Optional[str], record: Dict):
+        if not cache_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            temp_path = cache_path + ".tmp"
+            with open(temp_path, "wb") as cache_file:
+                pickle.dump(record, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+        except OSError as error:
+            print(f"Could not cache case pack: {error}")
+
+def main():
+    from src.engine.config import Config
+    
+    parser = argparse.ArgumentParser(description="Validate and compile case packs")
+    parser.add_argument("--packs", default=Config.CASE_PACK_DIR)
+    parser.add_argument("--cache", default=Config.CASE_PACK_CACHE_DIR)
+    parser.add_argument("--check", action="store_true", help="validate only, don't write the cache")
+    args = parser.parse_args()
+    
+    library = CasePackLibrary(args.packs, None if args.check else args.cache)
+    failed = False
+    for case_id in library.case_ids():
+        try:
+            pack = library.load(case_id)
+        except ValueError as error:
+            print(f"{case_id}: {error}", file=sys.stderr)
+            failed = True
+            continue
+        print(f"{case_id}: {pack['title']} ({len(pack['scene']['evidence'])} evidence, "
+              f"{len(pack['suspects'])} suspects)")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
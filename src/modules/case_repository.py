@@ -0,0 +1,212 @@
+"""
+Case Repository - SQLite archive of case files
+Indexed by status, date and title with FTS5 search over titles, descriptions
+and suspects. Lists are fetched a page at a time with keyset pagination (each
+page continues from the sort key of a row already shown), so any page costs
+the same index seek however deep it is. A search returns the ids of every
+match at once, best first, and its pages are then read by id.
+"""
+
+import json
+import os
+import sqlite3
+from typing import Dict, Iterable, List, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cases (
+    case_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    status TEXT NOT NULL,
+    victim TEXT NOT NULL DEFAULT '',
+    location TEXT NOT NULL DEFAULT '',
+    date TEXT NOT NULL,
+    evidence_count INTEGER NOT NULL DEFAULT 0,
+    suspects TEXT NOT NULL DEFAULT '[]',
+    description TEXT NOT NULL DEFAULT '',
+    progress INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_cases_date ON cases (date, case_id);
+CREATE INDEX IF NOT EXISTS idx_cases_status_date ON cases (status, date, case_id);
+CREATE INDEX IF NOT EXISTS idx_cases_title ON cases (title, case_id);
+CREATE INDEX IF NOT EXISTS idx_cases_status_title ON cases (status, title, case_id);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS cases_fts USING fts5(
+    title, description, suspects, content='cases', content_rowid='rowid'
+);
+CREATE TRIGGER IF NOT EXISTS cases_fts_insert AFTER INSERT ON cases BEGIN
+    INSERT INTO cases_fts (rowid, title, description, suspects)
+    VALUES (new.rowid, new.title, new.description, new.suspects);
+END;
+CREATE TRIGGER IF NOT EXISTS cases_fts_delete AFTER DELETE ON cases BEGIN
+    INSERT INTO cases_fts (cases_fts, rowid, title, description, suspects)
+    VALUES ('delete', old.rowid, old.title, old.description, old.suspects);
+END;
+CREATE TRIGGER IF NOT EXISTS cases_fts_update AFTER UPDATE ON cases BEGIN
+    INSERT INTO cases_fts (cases_fts, rowid, title, description, suspects)
+    VALUES ('delete', old.rowid, old.title, old.description, old.suspects);
+    INSERT INTO cases_fts (rowid, title, description, suspects)
+    VALUES (new.rowid, new.title, new.description, new.suspects);
+END;
+"""
+
+# Columns shown in list rows; full case files are fetched one at a time
+SUMMARY_COLUMNS = ("case_id", "title", "status", "date", "progress")
+CASE_COLUMNS = ("case_id", "title", "status", "victim", "location", "date",
+                "evidence_count", "suspects", "description", "progress")
+
+# Sort orders: key columns (backed by the indexes above) and whether the list runs backwards
+# through them (newest first); keys compare as (column, case_id) row values in a single direction
+ORDERINGS = {
+    "date": (("date", "case_id"), True),
+    "title": (("title", "case_id"), False)
+}
+
+def sort_key(summary: Dict, order: str = "date") -> tuple:
+    """The keyset position of a listed case, for list_cases(after=...) or (before=...)"""
+    columns, _ = ORDERINGS[order]
+    return tuple(summary[column] for column in columns)
+
+def fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query matching every word as a prefix"""
+    words = [word.replace('"', '""') for word in text.split()]
+    return " ".join(f'"{word}"*' for word in words)
+
+class CaseRepository:
+    """Case files in a single SQLite database, read a page at a time"""
+    
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory and db_path != ":memory:":
+            os.makedirs(directory, exist_ok=True)
+        
+        self.connection = sqlite3.connect(db_path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        
+        # Status (None for all) -> number of cases; cleared by every write
+        self._counts = {}
+    
+    def close(self):
+        self.connection.close()
+    
+    def add_cases(self, cases: Iterable[Dict]):
+        """Insert or replace case dicts (suspects is a list of names)"""
+        self._counts.clear()
+        with self.connection:
+            # An upsert fires the update trigger, keeping the FTS index in step
+            self.connection.executemany(
+                f"INSERT INTO cases ({', '.join(CASE_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(CASE_COLUMNS))}) "
+                f"ON CONFLICT (case_id) DO UPDATE SET "
+                f"{', '.join(f'{column} = excluded.{column}' for column in CASE_COLUMNS[1:])}",
+                (self._case_row(case) for case in cases)
+            )
+    
+    def delete_case(self, case_id: str):
+        self._counts.clear()
+        with self.connection:
+            self.connection.execute("DELETE FROM cases WHERE case_id = ?", (case_id,))
+    
+    def count(self, status: Optional[str] = None) -> int:
+        """Number of cases with a status (or all), cached until the archive changes"""
+        if status not in self._counts:
+            where, params = self._filters(status)
+            self._counts[status] = self.connection.execute(
+                f"SELECT COUNT(*) FROM cases c {where}", params
+            ).fetchone()[0]
+        return self._counts[status]
+    
+    def list_cases(self, status: Optional[str] = None, limit: int = 50, order: str = "date",
+                   after: Optional[tuple] = None, before: Optional[tuple] = None, last: bool = False) -> List[Dict]:
+        """
+        One page of case summaries in index order
+        The page starts just after the row whose sort_key is after, or ends
+        just before the one at before; last gives the final page.
+        """
+        columns, descending = ORDERINGS[order]
+        key = f"({', '.join('c.' + column for column in columns)})"
+        conditions = []
+        if after is not None:
+            conditions.append((f"{key} {'<' if descending else '>'} (?, ?)", after))
+        if before is not None:
+            conditions.append((f"{key} {'>' if descending else '<'} (?, ?)", before))
+        where, params = self._filters(status, conditions)
+        # Pages ending at a row are read walking the index the other way, then flipped
+        backwards = before is not None or last
+        direction = "DESC" if descending != backwards else "ASC"
+        rows = self.connection.execute(
+            f"SELECT {', '.join('c.' + column for column in SUMMARY_COLUMNS)} FROM cases c {where} "
+            f"ORDER BY {', '.join(f'c.{column} {direction}' for column in columns)} LIMIT ?",
+            [*params, limit]
+        ).fetchall()
+        if backwards:
+            rows.reverse()
+        return [dict(zip(SUMMARY_COLUMNS, row)) for row in rows]
+    
+    def search(self, text: str, status: Optional[str] = None) -> List[str]:
+        """
+        Ids of every case matching the search words, most relevant first
+        Ranking scores every match, so screens should run this off the frame
+        thread and read pages of the result with summaries().
+        """
+        where, params = self._filters(status, [("cases_fts MATCH ?", (fts_query(text),))])
+        rows = self.connection.execute(
+            f"SELECT c.case_id FROM cases_fts JOIN cases c ON c.rowid = cases_fts.rowid {where} "
+            f"ORDER BY bm25(cases_fts)", params
+        )
+        return [row[0] for row in rows]
+    
+    def summaries(self, case_ids: List[str]) -> List[Dict]:
+        """Case summaries for the given ids, in the same order (unknown ids are skipped)"""
+        if not case_ids:
+            return []
+        rows = self.connection.execute(
+            f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM cases WHERE case_id IN ({', '.join('?' * len(case_ids))})",
+            case_ids
+        )
+        by_id = {row[0]: dict(zip(SUMMARY_COLUMNS, row)) for row in rows}
+        return [by_id[case_id] for case_id in case_ids if case_id in by_id]
+    
+    def get_case(self, case_id: str) -> Optional[Dict]:
+        """The full case file"""
+        row = self.connection.execute(
+            f"SELECT {', '.join(CASE_COLUMNS)} FROM cases WHERE case_id = ?", (case_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        case = dict(zip(CASE_COLUMNS, row))
+        case["suspects"] = json.loads(case["suspects"])
+        return case
+    
+    def statuses(self) -> List[str]:
+        """Distinct case statuses (walks the status index)"""
+        return [row[0] for row in self.connection.execute("SELECT DISTINCT status FROM cases ORDER BY status")]
+    
+    def _filters(self, status: Optional[str], conditions: Iterable = ()):
+        """WHERE clause and parameters for a status filter plus (clause, parameters) conditions"""
+        clauses = []
+        params = []
+        if status:
+            clauses.append("c.status = ?")
+            params.append(status)
+        for clause, values in conditions:
+            clauses.append(clause)
+            params.extend(values)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+    
+    def _case_row(self, case: Dict) -> tuple:
+        return (
+            case["case_id"],
+            case["title"],
+            case["status"],
+            case.get("victim", ""),
+            case.get("location", ""),
+            case["date"],
+            case.get("evidence_count", 0),
+            json.dumps(case.get("suspects", [])),
+            case.get("description", ""),
+            case.get("progress", 0)
+        )
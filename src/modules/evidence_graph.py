@@ -0,0 +1,586 @@
+"""
+Evidence Graph - Logical connections between pieces of evidence
+"""
+
+import gc
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional
+
+@contextmanager
+def _gc_paused():
+    """Suspend cyclic GC while allocating many container objects at once"""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+class EvidenceGraph:
+    """Manages the logical connections between evidence pieces"""
+    
+    # Base strength based on connection type
+    CONNECTION_TYPE_STRENGTHS = {
+        "location_match": 0.8,
+        "time_correlation": 0.7,
+        "physical_match": 0.9,
+        "witness_testimony": 0.6,
+        "forensic_match": 0.95
+    }
+    DEFAULT_CONNECTION_STRENGTH = 0.5
+    FORENSIC_STRENGTH_BONUS = 1.2
+    
+    # Number of undoable actions kept in the change journal
+    HISTORY_LIMIT = 10000
+    
+    def __init__(self):
+        self.evidence_nodes = {}
+        self.connections = []
+        self.deduction_score = 0
+        
+        # Secondary indexes: value -> ordered set (dict keys) of evidence IDs
+        self._type_index = {}
+        self._location_index = {}
+        self._analyzed_index = {True: {}, False: {}}
+        
+        # Running sum of connection strengths so scoring stays O(1)
+        self._total_strength = 0.0
+        
+        # Change journal for undo/redo, kept as a tree of versions so reverting and then
+        # changing the graph starts a new branch instead of discarding the old one.
+        # Version -> the change leading to it from its parent (oldest first); entries
+        # share node and connection objects with the live graph rather than copying them
+        self._changes = OrderedDict()
+        self._parents = {}
+        # Version -> the child redo() returns to (the one last undone or created)
+        self._redo_child = {}
+        self._version = 0
+        self._next_version = 1
+        self._journaling = True
+        
+        # Counts every change, undo and redo; unlike the version it never repeats,
+        # so save files can tell whether the graph changed since they were written
+        self.revision = 0
+    
+    def add_evidence(self, evidence_id: str, evidence_type: str, description: str, location: str):
+        """Add a piece of evidence to the graph"""
+        node = {
+            "type": evidence_type,
+            "description": description,
+            "location": location,
+            "connected_to": [],
+            "analyzed": False
+        }
+        previous = self.evidence_nodes.get(evidence_id)
+        self._store_node(evidence_id, node)
+        self._record(("nodes", [(evidence_id, previous, node)]))
+    
+    def update_evidence(self, evidence_id: str, evidence_type: Optional[str] = None,
+                        description: Optional[str] = None, location: Optional[str] = None,
+                        analyzed: Optional[bool] = None) -> bool:
+        """Update fields of an existing piece of evidence, keeping the indexes in sync"""
+        node = self.evidence_nodes.get(evidence_id)
+        if node is None:
+            return False
+        
+        fields = {}
+        if evidence_type is not None:
+            fields["type"] = evidence_type
+        if description is not None:
+            fields["description"] = description
+        if location is not None:
+            fields["location"] = location
+        if analyzed is not None:
+            fields["analyzed"] = bool(analyzed)
+        
+        previous = {key: node[key] for key in fields}
+        self._apply_fields(evidence_id, fields)
+        self._record(("update", evidence_id, previous, fields))
+        return True
+    
+    def mark_analyzed(self, evidence_id: str, analyzed: bool = True) -> bool:
+        """Record the lab analysis status of a piece of evidence"""
+        return self.update_evidence(evidence_id, analyzed=analyzed)
+    
+    def find_evidence(self, evidence_type: Optional[str] = None, location: Optional[str] = None,
+                      analyzed: Optional[bool] = None) -> List[str]:
+        """
+        Find evidence IDs matching every given filter using the secondary indexes
+        e.g. find_evidence("forensic", "Floor 12", analyzed=False)
+        """
+        candidates = []
+        if evidence_type is not None:
+            candidates.append(self._type_index.get(evidence_type, {}))
+        if location is not None:
+            candidates.append(self._location_index.get(location, {}))
+        if analyzed is not None:
+            candidates.append(self._analyzed_index[bool(analyzed)])
+        
+        if not candidates:
+            return list(self.evidence_nodes)
+        
+        # Walk the smallest index and probe the others
+        candidates.sort(key=len)
+        smallest, others = candidates[0], candidates[1:]
+        return [ev_id for ev_id in smallest if all(ev_id in other for other in others)]
+    
+    def _store_node(self, evidence_id: str, node: Dict):
+        """Insert or replace a node and index it"""
+        existing = self.evidence_nodes.get(evidence_id)
+        if existing is not None:
+            self._unindex_node(evidence_id, existing)
+        self.evidence_nodes[evidence_id] = node
+        self._index_node(evidence_id, node)
+    
+    def _remove_node(self, evidence_id: str):
+        node = self.evidence_nodes.pop(evidence_id)
+        self._unindex_node(evidence_id, node)
+    
+    def _apply_fields(self, evidence_id: str, fields: Dict):
+        node = self.evidence_nodes[evidence_id]
+        self._unindex_node(evidence_id, node)
+        node.update(fields)
+        self._index_node(evidence_id, node)
+    
+    def _index_node(self, evidence_id: str, node: Dict):
+        self._type_index.setdefault(node["type"], {})[evidence_id] = None
+        self._location_index.setdefault(node["location"], {})[evidence_id] = None
+        self._analyzed_index[node["analyzed"]][evidence_id] = None
+    
+    def _unindex_node(self, evidence_id: str, node: Dict):
+        for index, key in ((self._type_index, node["type"]), (self._location_index, node["location"])):
+            bucket = index.get(key)
+            if bucket is not None:
+                bucket.pop(evidence_id, None)
+                if not bucket:
+                    del index[key]
+        self._analyzed_index[node["analyzed"]].pop(evidence_id, None)
+    
+    def connect_evidence(self, evidence1_id: str, evidence2_id: str, connection_type: str) -> bool:
+        """Connect two pieces of evidence with a logical relationship"""
+        if evidence1_id in self.evidence_nodes and evidence2_id in self.evidence_nodes:
+            connection = {
+                "from": evidence1_id,
+                "to": evidence2_id,
+                "type": connection_type,
+                "strength": self._calculate_connection_strength(evidence1_id, evidence2_id, connection_type)
+            }
+            
+            self.connections.append(connection)
+            self.evidence_nodes[evidence1_id]["connected_to"].append(evidence2_id)
+            self.evidence_nodes[evidence2_id]["connected_to"].append(evidence1_id)
+            self._total_strength += connection["strength"]
+            
+            self._update_deduction_score()
+            self._record(("connect", 1))
+            return True
+        
+        return False
+    
+    def add_evidence_bulk(self, records: Iterable) -> int:
+        """
+        Add many pieces of evidence in one pass
+        Records are dicts with id/type/description/location (and optional analyzed)
+        or (id, type, description, location[, analyzed]) tuples.
+        Nothing is added if any record is invalid. Returns the number of records added.
+        """
+        with _gc_paused():
+            return self._add_evidence_bulk(records)
+    
+    def _add_evidence_bulk(self, records: Iterable) -> int:
+        staged = {}
+        for index, record in enumerate(records):
+            if isinstance(record, dict):
+                evidence_id = record.get("id")
+                evidence_type = record.get("type")
+                description = record.get("description", "")
+                location = record.get("location")
+                analyzed = record.get("analyzed", False)
+            elif len(record) in (4, 5):
+                evidence_id, evidence_type, description, location = record[:4]
+                analyzed = record[4] if len(record) == 5 else False
+            else:
+                raise ValueError(f"Evidence record {index} must have 4 or 5 fields")
+            
+            if not evidence_id or not evidence_type or location is None:
+                raise ValueError(f"Evidence record {index} needs an id, type and location")
+            
+            # CSV readers hand every field over as a string
+            if isinstance(analyzed, str):
+                analyzed = analyzed.strip().lower() in ("1", "true", "yes")
+            
+            staged[evidence_id] = {
+                "type": evidence_type,
+                "description": description,
+                "location": location,
+                "connected_to": [],
+                "analyzed": bool(analyzed)
+            }
+        
+        changes = []
+        for evidence_id, node in staged.items():
+            changes.append((evidence_id, self.evidence_nodes.get(evidence_id), node))
+            self._store_node(evidence_id, node)
+        
+        if changes:
+            self._record(("nodes", changes))
+        return len(staged)
+    
+    def connect_bulk(self, records: Iterable, deduplicate: bool = True) -> int:
+        """
+        Connect many evidence pairs and recompute the deduction score once
+        Records are dicts with from/to/type or (from, to, type) tuples, plus an
+        optional strength (e.g. one stored earlier) used instead of the computed one.
+        With deduplicate, an undirected edge of the same type is only added once,
+        including edges already in the graph. Nothing is connected if any record
+        is invalid. Returns the number of connections added.
+        """
+        with _gc_paused():
+            return self._connect_bulk(records, deduplicate)
+    
+    def _connect_bulk(self, records: Iterable, deduplicate: bool) -> int:
+        nodes = self.evidence_nodes
+        type_strengths = self.CONNECTION_TYPE_STRENGTHS
+        default_strength = self.DEFAULT_CONNECTION_STRENGTH
+        forensic_bonus = self.FORENSIC_STRENGTH_BONUS
+        
+        seen = None
+        if deduplicate:
+            seen = {self._edge_key(conn["from"], conn["to"], conn["type"]) for conn in self.connections}
+        
+        # Validate and score in a single pass, then apply
+        staged = []
+        for index, record in enumerate(records):
+            if isinstance(record, dict):
+                from_id = record.get("from")
+                to_id = record.get("to")
+                connection_type = record.get("type")
+                strength = record.get("strength")
+            elif len(record) in (3, 4):
+                from_id, to_id, connection_type = record[:3]
+                strength = record[3] if len(record) == 4 else None
+            else:
+                raise ValueError(f"Connection record {index} must have 3 or 4 fields")
+            
+            from_node = nodes.get(from_id)
+            to_node = nodes.get(to_id)
+            if from_node is None or to_node is None:
+                raise ValueError(f"Connection record {index} references unknown evidence: {from_id} -> {to_id}")
+            
+            if seen is not None:
+                key = (from_id, to_id, connection_type) if from_id <= to_id else (to_id, from_id, connection_type)
+                if key in seen:
+                    continue
+                seen.add(key)
+            
+            if strength is None:
+                strength = type_strengths.get(connection_type, default_strength)
+                if from_node["type"] == "forensic" or to_node["type"] == "forensic":
+                    strength *= forensic_bonus
+                strength = min(1.0, strength)
+            
+            staged.append((from_node, to_node, {
+                "from": from_id,
+                "to": to_id,
+                "type": connection_type,
+                "strength": float(strength)
+            }))
+        
+        connections = self.connections
+        total_strength = self._total_strength
+        for from_node, to_node, connection in staged:
+            from_node["connected_to"].append(connection["to"])
+            to_node["connected_to"].append(connection["from"])
+            connections.append(connection)
+            total_strength += connection["strength"]
+        self._total_strength = total_strength
+        
+        self._update_deduction_score()
+        if staged:
+            self._record(("connect", len(staged)))
+        return len(staged)
+    
+    @staticmethod
+    def _edge_key(from_id: str, to_id: str, connection_type: str) -> tuple:
+        """Direction-independent key for an edge"""
+        if from_id <= to_id:
+            return (from_id, to_id, connection_type)
+        return (to_id, from_id, connection_type)
+    
+    def _calculate_connection_strength(self, ev1_id: str, ev2_id: str, connection_type: str) -> float:
+        """Calculate how strong the logical connection is"""
+        ev1 = self.evidence_nodes[ev1_id]
+        ev2 = self.evidence_nodes[ev2_id]
+        
+        base_strength = self.CONNECTION_TYPE_STRENGTHS.get(connection_type, self.DEFAULT_CONNECTION_STRENGTH)
+        
+        # Modify based on evidence types
+        if ev1["type"] == "forensic" or ev2["type"] == "forensic":
+            base_strength *= self.FORENSIC_STRENGTH_BONUS
+        
+        return min(1.0, base_strength)
+    
+    def _update_deduction_score(self):
+        """Update the overall deduction score based on evidence connections"""
+        if not self.connections:
+            self.deduction_score = 0
+            return
+        
+        connection_bonus = len(self.connections) * 0.1
+        
+        self.deduction_score = min(100, (self._total_strength * 10) + connection_bonus)
+    
+    def snapshot(self) -> int:
+        """
+        Return a version handle for the current graph, restorable with revert()
+        O(1): a version is a node in the change journal, not a copy
+        """
+        return self._version
+    
+    def revert(self, version: int):
+        """
+        Move the graph to another version in O(changes between them)
+        Versions form a tree: a change made after reverting starts a new
+        "what-if" branch, and the branch left behind can still be reverted to.
+        """
+        # A parent is always older than its children, so stepping up from whichever
+        # side is newer meets at their common ancestor
+        undo_path = []
+        redo_path = []
+        current, target = self._version, version
+        while current != target:
+            if current > target:
+                undo_path.append(current)
+                current = self._parents.get(current)
+            else:
+                redo_path.append(target)
+                target = self._parents.get(target)
+            if current is None or target is None:
+                raise ValueError(f"Version {version} is not in the available history")
+        
+        for step in undo_path:
+            self._step(step, forward=False)
+        for step in reversed(redo_path):
+            self._step(step, forward=True)
+    
+    def undo(self) -> bool:
+        """Undo the most recent action (a single call, including bulk calls)"""
+        if self._version not in self._parents:
+            return False
+        self._step(self._version, forward=False)
+        return True
+    
+    def redo(self) -> bool:
+        """Re-apply the most recently undone action (on the branch last visited)"""
+        child = self._redo_child.get(self._version)
+        if child is None or self._parents.get(child) != self._version:
+            return False
+        self._step(child, forward=True)
+        return True
+    
+    @contextmanager
+    def unjournaled(self):
+        """
+        Apply changes that can't be undone, such as loading a stored graph
+        Every journaled version is dropped, since none of them leads to the new state.
+        """
+        self._changes.clear()
+        self._parents.clear()
+        self._redo_child.clear()
+        self._journaling = False
+        try:
+            yield self
+        finally:
+            self._journaling = True
+    
+    def _record(self, entry: tuple):
+        """Journal a new action as a child of the current version"""
+        self.revision += 1
+        if not self._journaling:
+            return
+        version = self._next_version
+        self._next_version += 1
+        self._changes[version] = entry
+        self._parents[version] = self._version
+        self._redo_child[self._version] = version
+        self._version = version
+        
+        if len(self._changes) > self.HISTORY_LIMIT:
+            # Forget the oldest change; the version it led to becomes a root
+            oldest, _entry = self._changes.popitem(last=False)
+            parent = self._parents.pop(oldest)
+            if self._redo_child.get(parent) == oldest:
+                del self._redo_child[parent]
+    
+    def _step(self, version: int, forward: bool):
+        """Apply the change leading to version (forward) or take it back, moving to that version or its parent"""
+        kind, *payload = self._changes[version]
+        parent = self._parents[version]
+        
+        if kind == "nodes":
+            changes, = payload
+            if forward:
+                for evidence_id, _previous, node in changes:
+                    self._store_node(evidence_id, node)
+            else:
+                for evidence_id, previous, _node in reversed(changes):
+                    if previous is None:
+                        self._remove_node(evidence_id)
+                    else:
+                        self._store_node(evidence_id, previous)
+        elif kind == "update":
+            evidence_id, previous, fields = payload
+            self._apply_fields(evidence_id, fields if forward else previous)
+        elif kind == "connect":
+            # Applied changes keep a count, undone ones keep the connections to restore
+            if forward:
+                connections, = payload
+                self._push_connections(connections)
+                self._changes[version] = (kind, len(connections))
+            else:
+                count, = payload
+                self._changes[version] = (kind, self._pop_connections(count))
+        
+        self._version = version if forward else parent
+        self._redo_child[parent] = version
+        self.revision += 1
+    
+    def _pop_connections(self, count: int) -> List[Dict]:
+        """Remove the newest connections (undo always unwinds from the end)"""
+        popped = self.connections[-count:]
+        del self.connections[-count:]
+        
+        nodes = self.evidence_nodes
+        for connection in reversed(popped):
+            nodes[connection["to"]]["connected_to"].pop()
+            nodes[connection["from"]]["connected_to"].pop()
+            self._total_strength -= connection["strength"]
+        
+        if not self.connections:
+            self._total_strength = 0.0
+        self._update_deduction_score()
+        return popped
+    
+    def _push_connections(self, connections: List[Dict]):
+        nodes = self.evidence_nodes
+        for connection in connections:
+            nodes[connection["from"]]["connected_to"].append(connection["to"])
+            nodes[connection["to"]]["connected_to"].append(connection["from"])
+            self._total_strength += connection["strength"]
+        self.connections.extend(connections)
+        self._update_deduction_score()
+    
+    def get_deduction_paths(self) -> List[List[str]]:
+        """Find logical paths through the evidence"""
+        paths = []
+        visited = set()
+        
+        for evidence_id in self.evidence_nodes:
+            if evidence_id not in visited:
+                path = self._dfs_path(evidence_id, visited.copy())
+                if len(path) > 1:
+                    paths.append(path)
+        
+        return paths
+    
+    def _dfs_path(self, start_id: str, visited: set) -> List[str]:
+        """Depth-first search to find evidence paths"""
+        if start_id in visited:
+            return []
+        
+        visited.add(start_id)
+        path = [start_id]
+        
+        for connected_id in self.evidence_nodes[start_id]["connected_to"]:
+            if connected_id not in visited:
+                sub_path = self._dfs_path(connected_id, visited.copy())
+                if sub_path:
+                    path.extend(sub_path)
+                    break
+        
+        return path
+    
+    def get_components(self) -> List[List[str]]:
+        """Group evidence into connected components, largest first"""
+        components = []
+        visited = set()
+        nodes = self.evidence_nodes
+        
+        for evidence_id in nodes:
+            if evidence_id in visited:
+                continue
+            
+            visited.add(evidence_id)
+            component = [evidence_id]
+            stack = [evidence_id]
+            while stack:
+                for connected_id in nodes[stack.pop()]["connected_to"]:
+                    if connected_id not in visited:
+                        visited.add(connected_id)
+                        component.append(connected_id)
+                        stack.append(connected_id)
+            components.append(component)
+        
+        components.sort(key=len, reverse=True)
+        return components
+    
+    def get_strongest_chains(self, limit: int = 3) -> List[Dict]:
+        """
+        Find the strongest chain of reasoning in each component
+        Each chain starts from the component's strongest connection and grows
+        both ends along the strongest link to unvisited evidence.
+        Returns up to `limit` chains ordered by average link strength.
+        """
+        adjacency = {}
+        strongest_edge = {}
+        for connection in self.connections:
+            from_id, to_id, strength = connection["from"], connection["to"], connection["strength"]
+            if from_id == to_id:
+                continue
+            adjacency.setdefault(from_id, []).append((strength, to_id))
+            adjacency.setdefault(to_id, []).append((strength, from_id))
+        
+        # Strongest edge per component, keyed by the component's first node
+        component_of = {}
+        for component in self.get_components():
+            for evidence_id in component:
+                component_of[evidence_id] = component[0]
+        for connection in self.connections:
+            if connection["from"] == connection["to"]:
+                continue
+            root = component_of[connection["from"]]
+            best = strongest_edge.get(root)
+            if best is None or connection["strength"] > best["strength"]:
+                strongest_edge[root] = connection
+        
+        chains = []
+        for connection in strongest_edge.values():
+            strengths = [connection["strength"]]
+            visited = {connection["from"], connection["to"]}
+            
+            # Extend away from each end of the strongest connection
+            ends = []
+            for end in (connection["from"], connection["to"]):
+                extension = [end]
+                while True:
+                    candidates = [(strength, neighbour) for strength, neighbour in adjacency.get(extension[-1], ())
+                                  if neighbour not in visited]
+                    if not candidates:
+                        break
+                    strength, neighbour = max(candidates, key=lambda candidate: candidate[0])
+                    visited.add(neighbour)
+                    strengths.append(strength)
+                    extension.append(neighbour)
+                ends.append(extension)
+            path = ends[0][::-1] + ends[1]
+            
+            chains.append({
+                "path": path,
+                "links": len(strengths),
+                "strength": sum(strengths) / len(strengths)
+            })
+        
+        chains.sort(key=lambda chain: (chain["strength"], chain["links"]), reverse=True)
+        return chains[:limit]
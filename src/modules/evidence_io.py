@@ -0,0 +1,21 @@
+"""
+Evidence I/O - Streaming readers for bulk evidence ingestion
+Each reader yields one record at a time so files never have to fit in memory
+"""
+
+import csv
+import json
+from typing import Dict, Iterator
+
+def read_jsonl(path: str) -> Iterator[Dict]:
+    """Yield one record per non-empty line of a JSON lines file"""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+def read_csv(path: str) -> Iterator[Dict]:
+    """Yield one record per row of a CSV file with a header row"""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        yield from csv.DictReader(f)
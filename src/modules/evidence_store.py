@@ -0,0 +1,263 @@
+"""
+Evidence Store - SQLite persistence for evidence graphs
+Keeps every case's evidence graph in one archive and loads them on demand
+"""
+
+import sqlite3
+import threading
+from typing import Iterable, List, Optional, Set, Tuple
+
+from src.engine import telemetry
+from src.modules.evidence_graph import EvidenceGraph
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS evidence_nodes (
+    case_id TEXT NOT NULL,
+    evidence_id TEXT NOT NULL,
+    type TEXT NOT NULL,
+    description TEXT NOT NULL,
+    location TEXT NOT NULL,
+    analyzed INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (case_id, evidence_id)
+);
+CREATE INDEX IF NOT EXISTS idx_nodes_evidence_id ON evidence_nodes (evidence_id);
+CREATE INDEX IF NOT EXISTS idx_nodes_type ON evidence_nodes (case_id, type);
+CREATE INDEX IF NOT EXISTS idx_nodes_location ON evidence_nodes (case_id, location);
+
+CREATE TABLE IF NOT EXISTS evidence_connections (
+    case_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    from_id TEXT NOT NULL,
+    to_id TEXT NOT NULL,
+    type TEXT NOT NULL,
+    strength REAL NOT NULL,
+    PRIMARY KEY (case_id, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_connections_from ON evidence_connections (case_id, from_id);
+CREATE INDEX IF NOT EXISTS idx_connections_to ON evidence_connections (case_id, to_id);
+"""
+
+# Keep IN (...) lists below SQLite's bound-parameter limit
+QUERY_CHUNK_SIZE = 500
+
+class EvidenceStore:
+    """Stores evidence graphs for many cases in a single WAL-mode SQLite file"""
+    
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.connection = self._connect()
+        self.connection.executescript(SCHEMA)
+        
+        # Background autosave state (latest snapshot per case wins)
+        self._autosave_lock = threading.Lock()
+        self._pending_autosaves = {}
+        self._autosave_thread = None
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection; WAL lets the game keep reading while autosaves write"""
+        connection = sqlite3.connect(self.db_path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+    
+    def close(self):
+        """Wait for pending autosaves and close the archive"""
+        self.flush()
+        self.connection.close()
+    
+    def list_cases(self) -> List[str]:
+        """List the case IDs that have stored evidence"""
+        rows = self.connection.execute("SELECT DISTINCT case_id FROM evidence_nodes ORDER BY case_id")
+        return [row[0] for row in rows]
+    
+    def save_graph(self, case_id: str, graph: EvidenceGraph):
+        """Replace the stored graph for a case in a single transaction"""
+        node_rows, connection_rows = self._graph_rows(graph)
+        self._write_graph(self.connection, case_id, node_rows, connection_rows)
+    
+    def insert_nodes(self, case_id: str, nodes: Iterable[Tuple[str, str, str, str, bool]]):
+        """Bulk insert (evidence_id, type, description, location, analyzed) rows"""
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO evidence_nodes VALUES (?, ?, ?, ?, ?, ?)",
+                ((case_id, ev_id, ev_type, desc, location, int(analyzed))
+                 for ev_id, ev_type, desc, location, analyzed in nodes)
+            )
+    
+    def insert_connections(self, case_id: str, connections: Iterable[Tuple[str, str, str, float]]):
+        """Bulk append (from_id, to_id, type, strength) rows after the existing ones"""
+        with self.connection:
+            row = self.connection.execute(
+                "SELECT COALESCE(MAX(seq), -1) FROM evidence_connections WHERE case_id = ?", (case_id,)
+            ).fetchone()
+            start = row[0] + 1
+            self.connection.executemany(
+                "INSERT INTO evidence_connections VALUES (?, ?, ?, ?, ?, ?)",
+                ((case_id, start + i, from_id, to_id, conn_type, strength)
+                 for i, (from_id, to_id, conn_type, strength) in enumerate(connections))
+            )
+    
+    def delete_case(self, case_id: str):
+        """Remove all stored evidence for a case"""
+        with self.connection:
+            self.connection.execute("DELETE FROM evidence_nodes WHERE case_id = ?", (case_id,))
+            self.connection.execute("DELETE FROM evidence_connections WHERE case_id = ?", (case_id,))
+    
+    def load_graph(self, case_id: str) -> EvidenceGraph:
+        """Load the full evidence graph for a case"""
+        node_rows = self.connection.execute(
+            "SELECT evidence_id, type, description, location, analyzed FROM evidence_nodes WHERE case_id = ?",
+            (case_id,)
+        ).fetchall()
+        connection_rows = self.connection.execute(
+            "SELECT seq, from_id, to_id, type, strength FROM evidence_connections WHERE case_id = ? ORDER BY seq",
+            (case_id,)
+        ).fetchall()
+        return self._build_graph(node_rows, connection_rows)
+    
+    def load_component(self, case_id: str, evidence_id: str) -> Optional[EvidenceGraph]:
+        """
+        Load only the connected component containing one piece of evidence
+        Walks the connection indexes outward instead of reading the whole case
+        """
+        if not self._node_exists(case_id, evidence_id):
+            return None
+        
+        component = {evidence_id}
+        frontier = [evidence_id]
+        connection_rows = {}
+        
+        while frontier:
+            next_frontier = []
+            for chunk_start in range(0, len(frontier), QUERY_CHUNK_SIZE):
+                chunk = frontier[chunk_start:chunk_start + QUERY_CHUNK_SIZE]
+                for row in self._connections_touching(case_id, chunk):
+                    connection_rows[row[0]] = row
+                    for node_id in (row[1], row[2]):
+                        if node_id not in component:
+                            component.add(node_id)
+                            next_frontier.append(node_id)
+            frontier = next_frontier
+        
+        node_rows = self._fetch_nodes(case_id, component)
+        ordered_connections = [connection_rows[seq] for seq in sorted(connection_rows)]
+        return self._build_graph(node_rows, ordered_connections)
+    
+    def autosave(self, case_id: str, graph: EvidenceGraph):
+        """
+        Save a graph on a background thread
+        Rows are copied here so the game can keep mutating the graph while the write runs
+        """
+        rows = self._graph_rows(graph)
+        with self._autosave_lock:
+            self._pending_autosaves[case_id] = rows
+            if self._autosave_thread is None:
+                self._autosave_thread = threading.Thread(target=self._autosave_worker, daemon=True)
+                self._autosave_thread.start()
+    
+    @property
+    def autosave_pending(self) -> bool:
+        """True while a background autosave is queued or writing"""
+        with self._autosave_lock:
+            return self._autosave_thread is not None
+    
+    def flush(self):
+        """Block until queued autosaves have been written"""
+        with self._autosave_lock:
+            thread = self._autosave_thread
+        if thread:
+            thread.join()
+    
+    def _autosave_worker(self):
+        """Drain queued autosaves using a dedicated connection"""
+        connection = None
+        try:
+            connection = self._connect()
+            while True:
+                with self._autosave_lock:
+                    if not self._pending_autosaves:
+                        self._autosave_thread = None
+                        return
+                    case_id, (node_rows, connection_rows) = self._pending_autosaves.popitem()
+                try:
+                    self._write_graph(connection, case_id, node_rows, connection_rows)
+                except sqlite3.Error as error:
+                    # Locked or full database: report it and keep draining the other cases
+                    print(f"Evidence autosave failed for {case_id}: {error}")
+                    telemetry.bus.emit("save", sections=["evidence_store"], case=case_id, error=str(error))
+        except (sqlite3.Error, OSError) as error:
+            print(f"Evidence autosave failed: {error}")
+            telemetry.bus.emit("save", sections=["evidence_store"], error=str(error))
+        finally:
+            # However the worker ends, the next autosave() must be able to start a new one
+            with self._autosave_lock:
+                if self._autosave_thread is threading.current_thread():
+                    self._autosave_thread = None
+            if connection is not None:
+                connection.close()
+    
+    def _graph_rows(self, graph: EvidenceGraph) -> Tuple[List[tuple], List[tuple]]:
+        """Flatten a graph into node and connection rows"""
+        node_rows = [
+            (ev_id, node["type"], node["description"], node["location"], int(node["analyzed"]))
+            for ev_id, node in graph.evidence_nodes.items()
+        ]
+        connection_rows = [
+            (conn["from"], conn["to"], conn["type"], conn["strength"])
+            for conn in graph.connections
+        ]
+        return node_rows, connection_rows
+    
+    def _write_graph(self, connection: sqlite3.Connection, case_id: str,
+                     node_rows: List[tuple], connection_rows: List[tuple]):
+        """Replace a case's rows in one transaction"""
+        with connection:
+            connection.execute("DELETE FROM evidence_nodes WHERE case_id = ?", (case_id,))
+            connection.execute("DELETE FROM evidence_connections WHERE case_id = ?", (case_id,))
+            connection.executemany(
+                "INSERT INTO evidence_nodes VALUES (?, ?, ?, ?, ?, ?)",
+                ((case_id,) + row for row in node_rows)
+            )
+            connection.executemany(
+                "INSERT INTO evidence_connections VALUES (?, ?, ?, ?, ?, ?)",
+                ((case_id, seq) + row for seq, row in enumerate(connection_rows))
+            )
+    
+    def _node_exists(self, case_id: str, evidence_id: str) -> bool:
+        row = self.connection.execute(
+            "SELECT 1 FROM evidence_nodes WHERE case_id = ? AND evidence_id = ?", (case_id, evidence_id)
+        ).fetchone()
+        return row is not None
+    
+    def _connections_touching(self, case_id: str, node_ids: List[str]) -> List[tuple]:
+        """Fetch connections with either endpoint in node_ids (uses both endpoint indexes)"""
+        placeholders = ", ".join("?" * len(node_ids))
+        query = (
+            "SELECT seq, from_id, to_id, type, strength FROM evidence_connections "
+            f"WHERE case_id = ? AND from_id IN ({placeholders}) "
+            "UNION "
+            "SELECT seq, from_id, to_id, type, strength FROM evidence_connections "
+            f"WHERE case_id = ? AND to_id IN ({placeholders})"
+        )
+        return self.connection.execute(query, [case_id, *node_ids, case_id, *node_ids]).fetchall()
+    
+    def _fetch_nodes(self, case_id: str, node_ids: Set[str]) -> List[tuple]:
+        rows = []
+        ids = list(node_ids)
+        for chunk_start in range(0, len(ids), QUERY_CHUNK_SIZE):
+            chunk = ids[chunk_start:chunk_start + QUERY_CHUNK_SIZE]
+            placeholders = ", ".join("?" * len(chunk))
+            rows.extend(self.connection.execute(
+                "SELECT evidence_id, type, description, location, analyzed FROM evidence_nodes "
+                f"WHERE case_id = ? AND evidence_id IN ({placeholders})",
+                [case_id, *chunk]
+            ))
+        return rows
+    
+    def _build_graph(self, node_rows: Iterable[tuple], connection_rows: Iterable[tuple]) -> EvidenceGraph:
+        """Rebuild an EvidenceGraph from stored rows, keeping stored strengths (the load itself can't be undone)"""
+        graph = EvidenceGraph()
+        with graph.unjournaled():
+            graph.add_evidence_bulk(node_rows)
+            graph.connect_bulk((row[1:] for row in connection_rows), deduplicate=False)  # drop seq
+        return graph
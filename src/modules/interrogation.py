@@ -4,10 +4,11 @@ Integrates with LLM APIs for dynamic suspect dialogue
 """
 
 import json
-import requests
+import time
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from src.engine import telemetry
 
 class StressLevel(Enum):
     CALM = 1
@@ -36,6 +37,31 @@ class SuspectProfile:
     stress_triggers: List[str]
 
 class InterrogationEngine:
+    # Stress mechanics (tuned with src/modules/interrogation_sim.py)
+    START_STRESS = 10.0
+    MAX_STRESS = 100.0
+    BASE_QUESTION_STRESS = 2.0
+    APPROACH_MODIFIERS = {
+        "ACP": 1.0,      # Balanced approach
+        "DAYA": 2.5,     # High intimidation
+        "ABHIJEET": 0.8, # Gentle but persistent
+        "SALUNKHE": 1.2  # Scientific, methodical
+    }
+    TRIGGER_BONUS = 8.0
+    AGGRESSIVE_BONUS = 5.0
+    AGGRESSIVE_WORDS = ("lie", "lying", "liar", "guilty", "did it", "confess", "admit")
+    EVIDENCE_STRESS = 15.0
+    GUILTY_EVIDENCE_MULTIPLIER = 1.5
+    CONTRADICTION_BONUS = 10.0
+    BREAKTHROUGH_STRESS = 90.0
+    # Behavioral notes: (measure, threshold, note), measure being the question's stress change or the new stress level
+    BEHAVIOR_CUES = (
+        ("change", 15.0, "Suspect shows visible signs of distress"),
+        ("change", 25.0, "Suspect's voice is shaking"),
+        ("stress", 70.0, "Suspect is sweating profusely"),
+        ("stress", 85.0, "Suspect appears to be on the verge of breaking")
+    )
+    
     def __init__(self, api_type: str = "ollama", api_key: Optional[str] = None):
         self.api_type = api_type
         self.api_key = api_key
@@ -57,7 +83,7 @@ class InterrogationEngine:
         self.current_suspect = suspect
         self.available_evidence = available_evidence
         self.conversation_history = []
-        self.stress_meter = 10.0  # Start with slight nervousness
+        self.stress_meter = self.START_STRESS  # Start with slight nervousness
         self.evidence_presented = []
         
         # Generate initial suspect response
@@ -99,7 +125,7 @@ class InterrogationEngine:
         
         # Update stress meter
         question_stress = self._calculate_stress_impact(question, team_member, evidence_id)
-        self.stress_meter = min(100.0, self.stress_meter + question_stress + stress_modifier)
+        self.stress_meter = min(self.MAX_STRESS, self.stress_meter + question_stress + stress_modifier)
         
         # Analyze behavioral changes
         behavioral_notes = self._analyze_behavior_change(question_stress + stress_modifier)
@@ -139,11 +165,11 @@ class InterrogationEngine:
         evidence.revealed = True
         
         # Calculate stress based on evidence strength and suspect's guilt
-        base_stress = evidence.strength * 15.0
+        base_stress = evidence.strength * self.EVIDENCE_STRESS
         
         # Guilty suspects are more affected by strong evidence
         if self.current_suspect.guilty:
-            base_stress *= 1.5
+            base_stress *= self.GUILTY_EVIDENCE_MULTIPLIER
         
         # Check if evidence contradicts suspect's previous statements
         contradiction_bonus = self._check_contradiction(evidence)
@@ -152,27 +178,17 @@ class InterrogationEngine:
     
     def _calculate_stress_impact(self, question: str, team_member: str, evidence_id: Optional[str]) -> float:
         """Calculate how much stress a question/approach adds"""
-        base_stress = 2.0
-        
         # Team member approach modifiers
-        approach_modifiers = {
-            "ACP": 1.0,      # Balanced approach
-            "DAYA": 2.5,     # High intimidation
-            "ABHIJEET": 0.8, # Gentle but persistent
-            "SALUNKHE": 1.2  # Scientific, methodical
-        }
-        
-        stress = base_stress * approach_modifiers.get(team_member, 1.0)
+        stress = self.BASE_QUESTION_STRESS * self.APPROACH_MODIFIERS.get(team_member, 1.0)
         
         # Check for stress triggers in the question
         for trigger in self.current_suspect.stress_triggers:
             if trigger.lower() in question.lower():
-                stress += 8.0
+                stress += self.TRIGGER_BONUS
         
         # Aggressive questioning detection
-        aggressive_words = ["lie", "lying", "liar", "guilty", "did it", "confess", "admit"]
-        if any(word in question.lower() for word in aggressive_words):
-            stress += 5.0
+        if any(word in question.lower() for word in self.AGGRESSIVE_WORDS):
+            stress += self.AGGRESSIVE_BONUS
         
         return stress
     
@@ -223,19 +239,30 @@ Respond as {self.current_suspect.name} would, showing appropriate stress level t
     
     def _get_ai_response(self, prompt: str) -> str:
         """Get response from AI service"""
+        start = time.perf_counter()
+        usage = {}  # filled in by the backend: token counts, HTTP status, whether it fell back
         try:
             if self.api_type == "ollama":
-                return self._query_ollama(prompt)
+                response = self._query_ollama(prompt, usage)
             elif self.api_type == "gemini":
-                return self._query_gemini(prompt)
+                response = self._query_gemini(prompt, usage)
             else:
-                return self._fallback_response()
+                usage["fallback"] = True
+                response = self._fallback_response()
         except Exception as e:
             print(f"AI API Error: {e}")
-            return self._fallback_response()
+            usage.update(fallback=True, error=str(e))
+            response = self._fallback_response()
+        
+        latency_ms = round((time.perf_counter() - start) * 1000, 3)
+        telemetry.bus.emit("llm_request", backend=self.api_type, latency_ms=latency_ms,
+                           prompt_chars=len(prompt), response_chars=len(response), **usage)
+        return response
     
-    def _query_ollama(self, prompt: str) -> str:
+    def _query_ollama(self, prompt: str, usage: Dict) -> str:
         """Query Ollama local LLM"""
+        import requests  # deferred: slow to import and only needed once questioning starts
+        
         url = "http://localhost:11434/api/generate"
         data = {
             "model": "llama2",  # or another model you have installed
@@ -244,13 +271,19 @@ Respond as {self.current_suspect.name} would, showing appropriate stress level t
         }
         
         response = requests.post(url, json=data)
+        usage["status"] = response.status_code
         if response.status_code == 200:
-            return response.json().get("response", self._fallback_response())
-        else:
-            return self._fallback_response()
+            result = response.json()
+            usage["prompt_tokens"] = result.get("prompt_eval_count")
+            usage["response_tokens"] = result.get("eval_count")
+            if "response" in result:
+                return result["response"]
+        usage["fallback"] = True
+        return self._fallback_response()
     
-    def _query_gemini(self, prompt: str) -> str:
+    def _query_gemini(self, prompt: str, usage: Dict) -> str:
         """Query Google Gemini API"""
+        usage["fallback"] = True
         if not self.api_key:
             return self._fallback_response()
         
@@ -296,28 +329,18 @@ Respond as {self.current_suspect.name} would, showing appropriate stress level t
     
     def _analyze_behavior_change(self, stress_change: float) -> List[str]:
         """Analyze behavioral changes based on stress"""
-        notes = []
-        
-        if stress_change > 15:
-            notes.append("Suspect shows visible signs of distress")
-        if stress_change > 25:
-            notes.append("Suspect's voice is shaking")
-        if self.stress_meter > 70:
-            notes.append("Suspect is sweating profusely")
-        if self.stress_meter > 85:
-            notes.append("Suspect appears to be on the verge of breaking")
-        
-        return notes
+        levels = {"change": stress_change, "stress": self.stress_meter}
+        return [note for measure, threshold, note in self.BEHAVIOR_CUES if levels[measure] > threshold]
     
     def _check_breakthrough(self) -> bool:
         """Check if we've reached a breakthrough moment"""
-        return self.stress_meter > 90 and self.current_suspect.guilty
+        return self.stress_meter > self.BREAKTHROUGH_STRESS and self.current_suspect.guilty
     
     def _check_contradiction(self, evidence: Evidence) -> float:
         """Check if evidence contradicts previous statements"""
         # Simple implementation - in a real game, this would be more sophisticated
         if len(self.conversation_history) > 2:
-            return 10.0  # Bonus stress for contradictory evidence
+            return self.CONTRADICTION_BONUS  # Bonus stress for contradictory evidence
         return 0.0
     
     def get_interrogation_summary(self) -> Dict:
@@ -0,0 +1,235 @@
+"""
+Interrogation Simulator - Batch runs of the stress mechanics for tuning
+Plays many interrogation sessions at once on a StressModel: one suspect
+slot per session, one vectorized step per question, so a session here ends
+on exactly the stress InterrogationEngine would reach (--verify checks this
+against the engine with offline replies). Dialogue is left out: replies never
+change stress.
+
+A policy chooses, for every session each turn, who asks (team member index),
+how many of the suspect's stress triggers the question mentions, whether it
+is aggressive and which exhibit is presented (-1 for none).
+
+Usage: python -m src.modules.interrogation_sim --cases 2000 --turns 30 --set TRIGGER_BONUS=6 --set DAYA=2.0
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.modules.stress_model import TEAM_MEMBERS, StressModel, check_against_engine, stress_parameters
+
+MAX_EXHIBITS = 9
+
+# Turn decisions: (member index, trigger hits, aggressive, exhibit index or -1), one array entry per session
+Decisions = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+class SessionBatch:
+    """Suspects under interrogation, one per session, as parallel arrays"""
+    
+    def __init__(self, guilty: Sequence[bool], trigger_counts: Sequence[int], strengths: Sequence[Sequence[float]]):
+        count = len(guilty)
+        self.guilty = np.asarray(guilty, dtype=bool)
+        self.trigger_counts = np.asarray(trigger_counts, dtype=np.int64)
+        self.strengths = np.zeros((count, MAX_EXHIBITS))
+        self.exhibit_counts = np.zeros(count, dtype=np.int64)
+        for i, row in enumerate(strengths):
+            self.strengths[i, :len(row)] = row
+            self.exhibit_counts[i] = len(row)
+    
+    def __len__(self) -> int:
+        return len(self.guilty)
+    
+    @classmethod
+    def from_packs(cls, packs: Iterable[Dict], every_suspect: bool = True) -> "SessionBatch":
+        """One session per suspect of each case (or just the suspect the case interrogates)"""
+        guilty, triggers, strengths = [], [], []
+        for pack in packs:
+            exhibits = [exhibit["strength"] for exhibit in pack["interrogation"]["evidence"]]
+            names = ([suspect["name"] for suspect in pack["suspects"]] if every_suspect
+                     else [pack["interrogation"]["suspect"]])
+            for name in names:
+                suspect = next(suspect for suspect in pack["suspects"] if suspect["name"] == name)
+                guilty.append(suspect["guilty"])
+                triggers.append(len(suspect["stress_triggers"]))
+                strengths.append(exhibits)
+        return cls(guilty, triggers, strengths)
+    
+    def repeat(self, times: int) -> "SessionBatch":
+        """The same suspects, each interrogated times times"""
+        batch = SessionBatch.__new__(SessionBatch)
+        batch.guilty = np.tile(self.guilty, times)
+        batch.trigger_counts = np.tile(self.trigger_counts, times)
+        batch.strengths = np.tile(self.strengths, (times, 1))
+        batch.exhibit_counts = np.tile(self.exhibit_counts, times)
+        return batch
+
+class RandomPolicy:
+    """
+    Randomized questioning
+    member picks one team member for every question (None: chosen at random
+    each turn); each trigger is mentioned with trigger_rate, questions are
+    aggressive with aggressive_rate and an unpresented exhibit is shown with
+    evidence_rate (strongest first when strongest_first).
+    """
+    
+    def __init__(self, member: Optional[str] = None, trigger_rate: float = 0.3, aggressive_rate: float = 0.2,
+                 evidence_rate: float = 0.25, strongest_first: bool = False):
+        self.member = None if member is None else TEAM_MEMBERS.index(member)
+        self.trigger_rate = trigger_rate
+        self.aggressive_rate = aggressive_rate
+        self.evidence_rate = evidence_rate
+        self.strongest_first = strongest_first
+    
+    def __call__(self, turn: int, batch: SessionBatch, presented: np.ndarray, rng: np.random.Generator) -> Decisions:
+        count = len(batch)
+        if self.member is None:
+            members = rng.integers(0, len(TEAM_MEMBERS), count)
+        else:
+            members = np.full(count, self.member)
+        hits = rng.binomial(batch.trigger_counts, self.trigger_rate)
+        aggressive = rng.random(count) < self.aggressive_rate
+        
+        # Pick an exhibit not yet shown: random, or the strongest left
+        available = (np.arange(MAX_EXHIBITS) < batch.exhibit_counts[:, None]) & ~presented
+        if self.strongest_first:
+            scores = np.where(available, batch.strengths, -1.0)
+        else:
+            scores = np.where(available, rng.random((count, MAX_EXHIBITS)), -1.0)
+        exhibits = np.argmax(scores, axis=1)
+        show = (rng.random(count) < self.evidence_rate) & available.any(axis=1)
+        return members, hits, aggressive, np.where(show, exhibits, -1)
+
+class ScriptedPolicy:
+    """The same questions for every session: (member, trigger hits, aggressive, exhibit index or -1) per turn"""
+    
+    def __init__(self, script: Sequence[Tuple[str, int, bool, int]]):
+        self.script = script
+    
+    def __call__(self, turn: int, batch: SessionBatch, presented: np.ndarray, rng: np.random.Generator) -> Decisions:
+        member, hits, aggressive, exhibit = self.script[turn % len(self.script)]
+        count = len(batch)
+        return (np.full(count, TEAM_MEMBERS.index(member)),
+                np.minimum(hits, batch.trigger_counts),
+                np.full(count, aggressive),
+                np.where(exhibit < batch.exhibit_counts, exhibit, -1))
+
+class SimulationResult:
+    """Outcome of a batch: the question each session broke on (0: never) and final stress"""
+    
+    def __init__(self, batch: SessionBatch, breakthrough_turn: np.ndarray, stress: np.ndarray,
+                 history: Optional[np.ndarray], turns: int, elapsed: float):
+        self.batch = batch
+        self.breakthrough_turn = breakthrough_turn
+        self.stress = stress
+        self.history = history
+        self.turns = turns
+        self.elapsed = elapsed
+    
+    def questions_to_breakthrough(self) -> Dict:
+        """Distribution over guilty suspects; sessions that never broke count as censored"""
+        turns = self.breakthrough_turn[self.batch.guilty]
+        broke = turns[turns > 0]
+        summary = {"guilty_sessions": int(turns.size), "breakthrough_rate": round(broke.size / max(1, turns.size), 4)}
+        if broke.size:
+            summary.update({
+                "mean": round(float(broke.mean()), 2),
+                "p10": int(np.percentile(broke, 10)),
+                "median": int(np.median(broke)),
+                "p90": int(np.percentile(broke, 90)),
+                "histogram": np.bincount(broke)[1:].tolist()
+            })
+        return summary
+
+class InterrogationSimulator:
+    """Vectorized InterrogationEngine stress updates over a batch of sessions"""
+    
+    def __init__(self, parameters: Optional[Dict[str, float]] = None):
+        self.parameters = parameters or stress_parameters()
+    
+    def run(self, batch: SessionBatch, policy, turns: int, seed: int = 0,
+            keep_history: bool = False) -> SimulationResult:
+        rng = np.random.default_rng(seed)
+        available = np.arange(MAX_EXHIBITS) < batch.exhibit_counts[:, None]
+        model = StressModel(batch.guilty, batch.strengths, available, self.parameters)
+        breakthrough_turn = np.zeros(len(batch), dtype=np.int64)
+        history = np.empty((turns, len(batch))) if keep_history else None
+        
+        start = time.perf_counter()
+        for turn in range(turns):
+            model.step(*policy(turn, batch, model.presented, rng))
+            if keep_history:
+                history[turn] = model.stress
+            
+            broke = (breakthrough_turn == 0) & model.breakthrough()
+            breakthrough_turn[broke] = turn + 1
+        
+        return SimulationResult(batch, breakthrough_turn, model.stress, history, turns, time.perf_counter() - start)
+
+def main():
+    from src.modules.case_generator import CaseGenerator
+    
+    parser = argparse.ArgumentParser(description="Simulate interrogations in bulk to tune stress mechanics")
+    parser.add_argument("--cases", type=int, default=2000, help="generated cases (every suspect is questioned)")
+    parser.add_argument("--repeat", type=int, default=25, help="sessions per suspect")
+    parser.add_argument("--turns", type=int, default=30, help="questions per session")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--trigger-rate", type=float, default=0.3)
+    parser.add_argument("--aggressive-rate", type=float, default=0.2)
+    parser.add_argument("--evidence-rate", type=float, default=0.25)
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE",
+                        help="override a stress constant or a team member's approach modifier")
+    parser.add_argument("--verify", type=int, default=0, metavar="CASES",
+                        help="first check the simulator against the engine on this many cases")
+    parser.add_argument("--json", action="store_true", help="print the full report as JSON")
+    args = parser.parse_args()
+    
+    overrides = {}
+    try:
+        for setting in args.set:
+            name, _, value = setting.partition("=")
+            overrides[name.strip()] = float(value)
+        parameters = stress_parameters(overrides)
+    except ValueError as e:
+        parser.error(f"--set: {e}")
+    
+    generator = CaseGenerator(seed=args.seed)
+    packs = [generator.generate(index) for index in range(args.cases)]
+    if args.verify:
+        # The simulator steps a StressModel, so checking the model covers it
+        checked = check_against_engine(packs[:args.verify], args.turns, args.seed)
+        print(f"verified {checked} suspects against InterrogationEngine", file=sys.stderr)
+    
+    batch = SessionBatch.from_packs(packs).repeat(args.repeat)
+    simulator = InterrogationSimulator(parameters)
+    report = {"parameters": parameters, "sessions": len(batch), "turns": args.turns, "members": {}}
+    simulated = 0.0
+    for member in list(TEAM_MEMBERS) + [None]:
+        policy = RandomPolicy(member, args.trigger_rate, args.aggressive_rate, args.evidence_rate)
+        result = simulator.run(batch, policy, args.turns, args.seed)
+        simulated += result.elapsed
+        report["members"][member or "mixed"] = result.questions_to_breakthrough()
+    
+    total_turns = len(batch) * args.turns * (len(TEAM_MEMBERS) + 1)
+    report["simulated_turns"] = total_turns
+    report["turns_per_second"] = round(total_turns / simulated) if simulated else None
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    
+    print(f"{len(batch)} sessions x {args.turns} questions, {total_turns / simulated:,.0f} turns/s")
+    print(f"{'member':<10}{'broke':>8}{'mean':>7}{'p10':>5}{'median':>8}{'p90':>5}  questions to breakthrough")
+    for member, summary in report["members"].items():
+        if "mean" not in summary:
+            print(f"{member:<10}{summary['breakthrough_rate']:>8.1%}")
+            continue
+        histogram = " ".join(str(count) for count in summary["histogram"])
+        print(f"{member:<10}{summary['breakthrough_rate']:>8.1%}{summary['mean']:>7}{summary['p10']:>5}"
+              f"{summary['median']:>8}{summary['p90']:>5}  {histogram}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+Lab Result Store - Forensic results under a memory budget
+Small values (scores, counts, face locations) stay in memory. Large NumPy
+buffers such as the original and enhanced images count against a byte
+budget; once it is exceeded, the least recently used buffers are written to
+spill files and dropped. Reading a buffer back is transparent: .npy spill
+files are memory-mapped (the OS pages them in on demand), compressed .npz
+files are decompressed and become resident again. Results never change, so a
+buffer is written at most once however often it is evicted.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from src.engine import telemetry
+
+# Arrays smaller than this stay with the metrics instead of being budgeted
+MIN_BUFFER_BYTES = 64 * 1024
+
+class LabResult(Mapping):
+    """A stored result; buffers are fetched from the store when read, so don't hold on to them"""
+    
+    def __init__(self, store: "LabResultStore", result_id: str, metrics: Dict, buffers: Tuple[str, ...]):
+        self._store = store
+        self.result_id = result_id
+        self.metrics = metrics
+        self.buffers = buffers
+    
+    def __getitem__(self, key):
+        if key in self.metrics:
+            return self.metrics[key]
+        if key in self.buffers:
+            return self._store.buffer(self.result_id, key)
+        raise KeyError(key)
+    
+    def __contains__(self, key) -> bool:
+        return key in self.metrics or key in self.buffers
+    
+    def __iter__(self) -> Iterator[str]:
+        yield from self.metrics
+        yield from self.buffers
+    
+    def __len__(self) -> int:
+        return len(self.metrics) + len(self.buffers)
+
+class LabResultStore:
+    """
+    Results by id, with large buffers kept within budget_bytes of memory
+    Spill files go in a private directory under spill_dir, removed with the
+    store. Stored arrays are made read-only.
+    """
+    
+    def __init__(self, budget_bytes: int, spill_dir: str, compress: bool = False):
+        self.budget_bytes = budget_bytes
+        self.spill_dir = spill_dir
+        self.compress = compress
+        self._lock = threading.RLock()
+        
+        self._metrics = {}
+        self._buffer_keys = {}
+        # (result id, key) -> array in memory, least recently used first
+        self._resident = OrderedDict()
+        self.resident_bytes = 0
+        # (result id, key) -> spill file
+        self._spilled = {}
+        self._directory = None
+        self._finalizer = None
+        self._file_count = 0
+        
+        # Buffers written out, buffers read back from spill files
+        self.spills = 0
+        self.reloads = 0
+    
+    def __contains__(self, result_id: str) -> bool:
+        return result_id in self._metrics
+    
+    def __len__(self) -> int:
+        return len(self._metrics)
+    
+    @property
+    def disk_bytes(self) -> int:
+        """Size of the spill files"""
+        with self._lock:
+            return sum(os.path.getsize(path) for path in self._spilled.values())
+    
+    def put(self, result_id: str, result: Dict) -> LabResult:
+        """Store a result, replacing any with the same id, and evict buffers over budget"""
+        with self._lock:
+            self.remove(result_id)
+            metrics = {}
+            buffers = []
+            for key, value in result.items():
+                if isinstance(value, np.ndarray) and value.nbytes >= MIN_BUFFER_BYTES:
+                    value.flags.writeable = False
+                    self._resident[(result_id, key)] = value
+                    self.resident_bytes += value.nbytes
+                    buffers.append(key)
+                else:
+                    metrics[key] = value
+            self._metrics[result_id] = metrics
+            self._buffer_keys[result_id] = tuple(buffers)
+            self._enforce_budget()
+            return self.get(result_id)
+    
+    def get(self, result_id: str) -> Optional[LabResult]:
+        with self._lock:
+            if result_id not in self._metrics:
+                return None
+            return LabResult(self, result_id, self._metrics[result_id], self._buffer_keys[result_id])
+    
+    def metrics(self, result_id: str) -> Dict:
+        """The small values of a result (never touches spill files)"""
+        with self._lock:
+            return dict(self._metrics[result_id])
+    
+    def buffer(self, result_id: str, key: str) -> np.ndarray:
+        """A large array of a result, read back from its spill file if it was evicted"""
+        with self._lock:
+            buffer_key = (result_id, key)
+            array = self._resident.get(buffer_key)
+            if array is not None:
+                self._resident.move_to_end(buffer_key)
+                return array
+            if buffer_key not in self._spilled:
+                raise KeyError(buffer_key)
+            
+            start = time.perf_counter()
+            path = self._spilled[buffer_key]
+            self.reloads += 1
+            if self.compress:
+                with np.load(path) as archive:
+                    array = archive["buffer"]
+                array.flags.writeable = False
+                self._resident[buffer_key] = array
+                self.resident_bytes += array.nbytes
+                self._enforce_budget(keep=buffer_key)
+            else:
+                # Mapped pages belong to the OS page cache, not the budget
+                array = np.load(path, mmap_mode="r")
+            telemetry.bus.emit("lab_result", action="reload", result=result_id, buffer=key, bytes=array.nbytes,
+                               ms=round((time.perf_counter() - start) * 1000, 3))
+            return array
+    
+    def remove(self, result_id: str):
+        """Forget a result and delete its spill files"""
+        with self._lock:
+            self._metrics.pop(result_id, None)
+            for key in self._buffer_keys.pop(result_id, ()):
+                array = self._resident.pop((result_id, key), None)
+                if array is not None:
+                    self.resident_bytes -= array.nbytes
+                path = self._spilled.pop((result_id, key), None)
+                if path:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass  # still mapped on some platforms; the directory goes with the store
+    
+    def clear(self):
+        with self._lock:
+            for result_id in list(self._metrics):
+                self.remove(result_id)
+    
+    def close(self):
+        """Drop every result and remove the spill directory"""
+        with self._lock:
+            self.clear()
+            if self._finalizer:
+                self._finalizer()
+            self._directory = None
+            self._finalizer = None
+    
+    def _enforce_budget(self, keep: Optional[Tuple[str, str]] = None):
+        """Evict least recently used buffers until the resident ones fit the budget"""
+        for buffer_key in list(self._resident):
+            if self.resident_bytes <= self.budget_bytes:
+                return
+            if buffer_key == keep:
+                continue
+            array = self._resident.pop(buffer_key)
+            self.resident_bytes -= array.nbytes
+            if buffer_key not in self._spilled:
+                self._spill(buffer_key, array)
+    
+    def _spill(self, buffer_key: Tuple[str, str], array: np.ndarray):
+        start = time.perf_counter()
+        if self._directory is None:
+            os.makedirs(self.spill_dir, exist_ok=True)
+            self._directory = tempfile.mkdtemp(prefix="results-", dir=self.spill_dir)
+            self._finalizer = weakref.finalize(self, shutil.rmtree, self._directory, True)
+        self._file_count += 1
+        path = os.path.join(self._directory, f"{self._file_count:06d}.{'npz' if self.compress else 'npy'}")
+        if self.compress:
+            np.savez_compressed(path, buffer=array)
+        else:
+            np.save(path, array)
+        self._spilled[buffer_key] = path
+        self.spills += 1
+        telemetry.bus.emit("lab_result", action="spill", result=buffer_key[0], buffer=buffer_key[1],
+                           bytes=array.nbytes, ms=round((time.perf_counter() - start) * 1000, 3))
@@ -0,0 +1,283 @@
+"""
+Save Game - Versioned save container with incremental background autosave
+A save file is a header, a section table and one zlib-compressed payload per
+section (session, evidence graph and each saved state). Payloads are msgpack
+when it is installed and JSON otherwise; the codec is recorded per section so
+either build can read the other's files (msgpack sections need msgpack).
+
+Autosave snapshots only the sections whose revision changed since the last
+write, then encodes them and rewrites the file on a background thread. Clean
+sections reuse the bytes encoded by an earlier write or read by the last load.
+"""
+
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+from src.engine import telemetry
+from src.modules.evidence_graph import EvidenceGraph
+
+MAGIC = b"CIDSAVE\x00"
+FORMAT_VERSION = 1
+
+CODEC_JSON = 0
+CODEC_MSGPACK = 1
+
+# Speed over ratio: autosaves run during play
+COMPRESSION_LEVEL = 1
+
+# magic, format version, section count
+HEADER = struct.Struct("<8sHH")
+# codec, raw length, payload length, crc32 of the payload (after the section name)
+SECTION_ENTRY = struct.Struct("<BIII")
+
+# Section name -> (revision, snapshot function returning plain data)
+Sections = Dict[str, Tuple[int, Callable[[], object]]]
+
+def encode(data, codec: int) -> bytes:
+    if codec == CODEC_MSGPACK:
+        return msgpack.packb(data, use_bin_type=True)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+def decode(raw: bytes, codec: int):
+    if codec == CODEC_MSGPACK:
+        if msgpack is None:
+            raise ValueError("save section was written with msgpack, which is not installed")
+        return msgpack.unpackb(raw, raw=False, strict_map_key=False)
+    return json.loads(raw)
+
+def evidence_graph_data(graph: EvidenceGraph) -> Dict:
+    """
+    The graph as parallel columns
+    Columns of shared strings allocate far fewer objects than one row per node.
+    """
+    ids = list(graph.evidence_nodes)
+    nodes = list(graph.evidence_nodes.values())
+    connections = graph.connections
+    return {
+        "ids": ids,
+        "types": [node["type"] for node in nodes],
+        "descriptions": [node["description"] for node in nodes],
+        "locations": [node["location"] for node in nodes],
+        "analyzed": [node["analyzed"] for node in nodes],
+        "from": [conn["from"] for conn in connections],
+        "to": [conn["to"] for conn in connections],
+        "connection_types": [conn["type"] for conn in connections],
+        "strengths": [conn["strength"] for conn in connections]
+    }
+
+def evidence_graph_from_data(data: Dict) -> EvidenceGraph:
+    """Rebuild a saved graph with its stored strengths (saves without them get computed ones) and no undo history"""
+    graph = EvidenceGraph()
+    connections = [data["from"], data["to"], data["connection_types"]]
+    if "strengths" in data:
+        connections.append(data["strengths"])
+    with graph.unjournaled():
+        graph.add_evidence_bulk(zip(data["ids"], data["types"], data["descriptions"], data["locations"],
+                                    data["analyzed"]))
+        graph.connect_bulk(zip(*connections), deduplicate=False)
+    return graph
+
+class SaveGame:
+    """A single save file, written incrementally from section snapshots"""
+    
+    def __init__(self, path: str, use_msgpack: bool = True):
+        self.path = path
+        self.codec = CODEC_MSGPACK if use_msgpack and msgpack is not None else CODEC_JSON
+        
+        # Timings of the last background write and the last load (read + decode)
+        self.last_save_ms = None
+        self.last_load_ms = None
+        self.last_size = 0
+        
+        # Section revisions already handed to the writer (main thread only)
+        self._saved_revisions = {}
+        
+        # Encoded sections: name -> (codec, raw length, payload, crc32)
+        self._blobs = {}
+        
+        # Background writer state (latest snapshot per section wins; None discards it)
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._writer = None
+    
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+    
+    def dirty_sections(self, sections: Sections) -> List[str]:
+        """Names of sections changed since they were last saved or loaded"""
+        return [name for name, (revision, _snapshot) in sections.items()
+                if revision != self._saved_revisions.get(name, 0)]
+    
+    def mark_saved(self, sections: Sections):
+        """Treat the current revisions as saved (after a load)"""
+        self._saved_revisions = {name: revision for name, (revision, _snapshot) in sections.items()}
+    
+    def autosave(self, sections: Sections) -> List[str]:
+        """
+        Snapshot the dirty sections and write them on a background thread
+        Snapshots are taken here so the game can keep changing state while the
+        write runs. Returns the names of the sections queued.
+        """
+        dirty = self.dirty_sections(sections)
+        if not dirty:
+            return []
+        
+        snapshots = {name: sections[name][1]() for name in dirty}
+        for name in dirty:
+            self._saved_revisions[name] = sections[name][0]
+        
+        with self._lock:
+            self._pending.update(snapshots)
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_worker, daemon=True)
+                self._writer.start()
+        return dirty
+    
+    def discard(self, names):
+        """Drop sections from the file at the next write (e.g. states of a case no longer open)"""
+        for name in names:
+            self._saved_revisions.pop(name, None)
+        with self._lock:
+            self._pending.update(dict.fromkeys(names))
+    
+    def save(self, sections: Sections) -> List[str]:
+        """Autosave and wait for the write to finish"""
+        dirty = self.autosave(sections)
+        self.flush()
+        return dirty
+    
+    @property
+    def save_pending(self) -> bool:
+        """True while a background write is queued or running"""
+        with self._lock:
+            return self._writer is not None
+    
+    def flush(self):
+        """Block until queued writes have finished"""
+        with self._lock:
+            writer = self._writer
+        if writer:
+            writer.join()
+    
+    def load(self) -> Optional[Dict[str, object]]:
+        """Read and decode every section; None when there is no save file"""
+        self.flush()
+        if not self.exists():
+            return None
+        with self._lock:
+            self._pending.clear()  # discards queued against the replaced session
+        
+        start = time.perf_counter()
+        with open(self.path, "rb") as save_file:
+            blobs = self._parse(save_file.read())
+        sections = {name: decode(zlib.decompress(payload, bufsize=length), codec)
+                    for name, (codec, length, payload, _crc) in blobs.items()}
+        self._blobs = blobs
+        self.last_load_ms = (time.perf_counter() - start) * 1000
+        return sections
+    
+    def _write_worker(self):
+        """Encode queued snapshots and rewrite the file until the queue is empty"""
+        try:
+            while True:
+                with self._lock:
+                    if not self._pending:
+                        self._writer = None
+                        return
+                    snapshots = self._pending
+                    self._pending = {}
+                
+                start = time.perf_counter()
+                for name, data in snapshots.items():
+                    if data is None:
+                        self._blobs.pop(name, None)
+                        continue
+                    try:
+                        raw = encode(data, self.codec)
+                    except Exception as error:
+                        # The section keeps its last good bytes; the rest are still written
+                        self._report_failure([name], error)
+                        continue
+                    payload = zlib.compress(raw, COMPRESSION_LEVEL)
+                    self._blobs[name] = (self.codec, len(raw), payload, zlib.crc32(payload))
+                try:
+                    self._write_file()
+                except Exception as error:
+                    self._report_failure(list(snapshots), error)
+                    continue
+                self.last_save_ms = (time.perf_counter() - start) * 1000
+                telemetry.bus.emit("save", sections=list(snapshots), ms=round(self.last_save_ms, 3))
+        finally:
+            # However the worker ends, a later autosave must be able to start a new one
+            with self._lock:
+                if self._writer is threading.current_thread():
+                    self._writer = None
+    
+    def _report_failure(self, sections: List[str], error: Exception):
+        """Log a section that couldn't be encoded or a write that failed"""
+        print(f"Save failed: {error}")
+        telemetry.bus.emit("save", sections=sections, error=str(error))
+    
+    def _write_file(self):
+        """Write every section to a temporary file and swap it in"""
+        parts = [HEADER.pack(MAGIC, FORMAT_VERSION, len(self._blobs))]
+        for name, (codec, length, payload, crc) in self._blobs.items():
+            encoded_name = name.encode("utf-8")
+            parts.append(bytes([len(encoded_name)]) + encoded_name)
+            parts.append(SECTION_ENTRY.pack(codec, length, len(payload), crc))
+        parts.extend(payload for _codec, _length, payload, _crc in self._blobs.values())
+        
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "wb") as save_file:
+            for part in parts:
+                save_file.write(part)
+        os.replace(temp_path, self.path)
+        self.last_size = sum(len(part) for part in parts)
+    
+    def _parse(self, data: bytes) -> Dict[str, tuple]:
+        """Split a save file into its encoded sections, checking the header and checksums"""
+        if len(data) < HEADER.size:
+            raise ValueError(f"{self.path} is not a save file")
+        magic, version, count = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a save file")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{self.path} is save format {version}, expected {FORMAT_VERSION}")
+        
+        offset = HEADER.size
+        table = []
+        for _ in range(count):
+            if offset >= len(data):
+                raise ValueError(f"{self.path} is corrupt")
+            name_length = data[offset]
+            name_end = offset + 1 + name_length
+            if name_end + SECTION_ENTRY.size > len(data):
+                raise ValueError(f"{self.path} is corrupt")
+            try:
+                name = data[offset + 1:name_end].decode("utf-8")
+            except UnicodeDecodeError:
+                raise ValueError(f"{self.path} is corrupt") from None
+            table.append((name, *SECTION_ENTRY.unpack_from(data, name_end)))
+            offset = name_end + SECTION_ENTRY.size
+        
+        blobs = {}
+        for name, codec, length, payload_length, crc in table:
+            payload = data[offset:offset + payload_length]
+            offset += payload_length
+            if len(payload) != payload_length or zlib.crc32(payload) != crc:
+                raise ValueError(f"{self.path}: section {name!r} is corrupt")
+            blobs[name] = (codec, length, payload, crc)
+        return blobs
@@ -0,0 +1,94 @@
+"""
+Spatial Grid - Uniform grid index over points for hit testing and culling
+Each point lives in the square cell containing it, so radius and rectangle
+queries only look at the few cells they overlap instead of every point.
+"""
+
+from typing import Callable, Hashable, Iterator, List, Optional, Tuple
+
+class SpatialGrid:
+    """Points bucketed into square cells of a fixed size"""
+    
+    def __init__(self, cell_size: int = 64):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.positions = {}
+    
+    def __len__(self) -> int:
+        return len(self.positions)
+    
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return int(x // self.cell_size), int(y // self.cell_size)
+    
+    def insert(self, item: Hashable, x: float, y: float):
+        """Add a point (an item already in the grid is moved)"""
+        if item in self.positions:
+            self.remove(item)
+        self.positions[item] = (x, y)
+        self.cells.setdefault(self._cell(x, y), []).append(item)
+    
+    def remove(self, item: Hashable):
+        x, y = self.positions.pop(item)
+        cell = self._cell(x, y)
+        bucket = self.cells[cell]
+        bucket.remove(item)
+        if not bucket:
+            del self.cells[cell]
+    
+    def _cells_in(self, left: float, top: float, right: float, bottom: float) -> Iterator[List[Hashable]]:
+        """Buckets of the cells overlapping a rectangle"""
+        first_x, first_y = self._cell(left, top)
+        last_x, last_y = self._cell(right, bottom)
+        
+        # A huge rectangle over a sparse grid: walk the occupied cells instead
+        if (last_x - first_x + 1) * (last_y - first_y + 1) > len(self.cells):
+            for (cell_x, cell_y), bucket in self.cells.items():
+                if first_x <= cell_x <= last_x and first_y <= cell_y <= last_y:
+                    yield bucket
+            return
+        
+        cells = self.cells
+        for cell_x in range(first_x, last_x + 1):
+            for cell_y in range(first_y, last_y + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if bucket:
+                    yield bucket
+    
+    def query_rect(self, left: float, top: float, width: float, height: float) -> List[Hashable]:
+        """Items whose points lie inside a rectangle (edges included)"""
+        right, bottom = left + width, top + height
+        positions = self.positions
+        found = []
+        for bucket in self._cells_in(left, top, right, bottom):
+            for item in bucket:
+                x, y = positions[item]
+                if left <= x <= right and top <= y <= bottom:
+                    found.append(item)
+        return found
+    
+    def query_radius(self, x: float, y: float, radius: float) -> List[Hashable]:
+        """Items within a distance of a point"""
+        radius_squared = radius * radius
+        positions = self.positions
+        found = []
+        for bucket in self._cells_in(x - radius, y - radius, x + radius, y + radius):
+            for item in bucket:
+                item_x, item_y = positions[item]
+                if (item_x - x) ** 2 + (item_y - y) ** 2 <= radius_squared:
+                    found.append(item)
+        return found
+    
+    def nearest(self, x: float, y: float, radius: float,
+                accept: Optional[Callable[[Hashable], bool]] = None) -> Optional[Hashable]:
+        """The closest item strictly within a distance of a point, optionally only items accept() allows"""
+        best = None
+        best_distance = radius * radius
+        positions = self.positions
+        for bucket in self._cells_in(x - radius, y - radius, x + radius, y + radius):
+            for item in bucket:
+                item_x, item_y = positions[item]
+                distance = (item_x - x) ** 2 + (item_y - y) ** 2
+                if distance < best_distance and (accept is None or accept(item)):
+                    best = item
+                    best_distance = distance
+        return best
@@ -0,0 +1,239 @@
+"""
+Stress Model - InterrogationEngine's stress mechanics for many suspects at once
+Holds stress levels, guilt flags, stress triggers and evidence strengths for
+N suspects in NumPy arrays and applies a question (and any evidence shown
+with it) to all of them in one vectorized step. Every operation follows the
+engine's scalar float arithmetic in the same order, so each suspect ends up
+with exactly the stress, stress change, behavioral notes and breakthrough the
+engine would give it (python -m src.modules.stress_model --check replays
+generated cases through both).
+"""
+
+import argparse
+import random
+import sys
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from src.modules.interrogation import Evidence, InterrogationEngine, SuspectProfile
+
+TEAM_MEMBERS = tuple(InterrogationEngine.APPROACH_MODIFIERS)
+
+ENGINE_PARAMETERS = ("START_STRESS", "MAX_STRESS", "BASE_QUESTION_STRESS", "TRIGGER_BONUS", "AGGRESSIVE_BONUS",
+                     "EVIDENCE_STRESS", "GUILTY_EVIDENCE_MULTIPLIER", "CONTRADICTION_BONUS", "BREAKTHROUGH_STRESS")
+
+def stress_parameters(overrides: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+    """
+    The engine's stress constants, with overrides
+    Team member names (ACP, DAYA, ...) override that member's approach modifier.
+    """
+    parameters = {name: getattr(InterrogationEngine, name) for name in ENGINE_PARAMETERS}
+    parameters.update(InterrogationEngine.APPROACH_MODIFIERS)
+    for name, value in (overrides or {}).items():
+        if name not in parameters:
+            raise ValueError(f"unknown stress parameter {name!r}")
+        parameters[name] = float(value)
+    return parameters
+
+class StressModel:
+    """
+    Stress state of N suspects
+    strengths is an (N, E) matrix of how strong each exhibit is against each
+    suspect; available masks the exhibits a suspect can be shown (all by default).
+    """
+    
+    def __init__(self, guilty: Sequence[bool], strengths, available=None,
+                 parameters: Optional[Dict[str, float]] = None):
+        self.parameters = parameters or stress_parameters()
+        p = self.parameters
+        self.guilty = np.asarray(guilty, dtype=bool)
+        count = len(self.guilty)
+        self.strengths = np.asarray(strengths, dtype=np.float64).reshape(count, -1)
+        self.available = (np.ones(self.strengths.shape, dtype=bool) if available is None
+                          else np.asarray(available, dtype=bool))
+        
+        # Members by index, plus the engine's default modifier for anyone else
+        self.approach = np.array([p[member] for member in TEAM_MEMBERS] + [1.0])
+        # What _present_evidence computes for each exhibit before the contradiction bonus
+        evidence_stress = self.strengths * p["EVIDENCE_STRESS"]
+        self.evidence_stress = np.where(self.guilty[:, None], evidence_stress * p["GUILTY_EVIDENCE_MULTIPLIER"],
+                                        evidence_stress)
+        self._rows = np.arange(count)
+        
+        # Text matching for ask(): trigger vocabulary and how often each suspect lists each trigger
+        self.suspects = []
+        self.evidence_ids = {}
+        self.triggers = []
+        self.trigger_counts = np.zeros((count, 0), dtype=np.int64)
+        self.reset()
+    
+    def __len__(self) -> int:
+        return len(self.guilty)
+    
+    @classmethod
+    def for_suspects(cls, suspects: Sequence[SuspectProfile], evidence: Sequence[Evidence],
+                     parameters: Optional[Dict[str, float]] = None) -> "StressModel":
+        """Every suspect facing the same exhibits, as in one InterrogationEngine session each"""
+        strengths = [[item.strength for item in evidence] for _ in suspects]
+        model = cls([suspect.guilty for suspect in suspects], np.array(strengths).reshape(len(suspects), -1),
+                    parameters=parameters)
+        model.suspects = list(suspects)
+        # The engine only finds the first exhibit with an id
+        for column, item in enumerate(evidence):
+            model.evidence_ids.setdefault(item.id, column)
+        
+        vocabulary = {}
+        for suspect in suspects:
+            for trigger in suspect.stress_triggers:
+                vocabulary.setdefault(trigger.lower(), len(vocabulary))
+        model.triggers = list(vocabulary)
+        model.trigger_counts = np.zeros((len(suspects), len(vocabulary)), dtype=np.int64)
+        for row, suspect in enumerate(suspects):
+            for trigger in suspect.stress_triggers:
+                model.trigger_counts[row, vocabulary[trigger.lower()]] += 1
+        return model
+    
+    def reset(self):
+        """Start every suspect's interrogation over"""
+        self.stress = np.full(len(self), self.parameters["START_STRESS"])
+        self.presented = np.zeros(self.strengths.shape, dtype=bool)
+        self.questions = 0
+    
+    def step(self, members, hits, aggressive, exhibits) -> np.ndarray:
+        """
+        Ask every suspect one question; returns each suspect's stress change
+        members are team member indexes (len(TEAM_MEMBERS) for anyone else),
+        hits how many of the suspect's triggers the question mentions, and
+        exhibits the exhibit column shown (-1 for none). Each argument is a
+        scalar or one value per suspect.
+        """
+        p = self.parameters
+        count = len(self)
+        rows = self._rows
+        members = np.broadcast_to(members, (count,))
+        hits = np.broadcast_to(hits, (count,))
+        aggressive = np.broadcast_to(aggressive, (count,))
+        exhibits = np.broadcast_to(exhibits, (count,))
+        
+        # _present_evidence: unknown or already presented exhibits add nothing
+        shown = (exhibits >= 0) & (exhibits < self.strengths.shape[1])
+        column = np.where(shown, exhibits, 0)
+        if self.strengths.shape[1]:
+            fresh = shown & self.available[rows, column] & ~self.presented[rows, column]
+            # The opening statement plus two entries per question: contradictions from the second question on
+            contradiction = p["CONTRADICTION_BONUS"] if self.questions >= 1 else 0.0
+            modifier = np.where(fresh, self.evidence_stress[rows, column] + contradiction, 0.0)
+            self.presented[rows[fresh], column[fresh]] = True
+        else:
+            modifier = np.zeros(count)
+        
+        # _calculate_stress_impact: triggers are added one at a time, as the engine does
+        question = p["BASE_QUESTION_STRESS"] * self.approach[members]
+        for hit in range(int(hits.max(initial=0))):
+            question = np.where(hits > hit, question + p["TRIGGER_BONUS"], question)
+        question = np.where(aggressive, question + p["AGGRESSIVE_BONUS"], question)
+        
+        self.stress = np.minimum(p["MAX_STRESS"], self.stress + question + modifier)
+        self.questions += 1
+        return question + modifier
+    
+    def ask(self, question: str, team_member: str = "ACP", evidence_id: Optional[str] = None) -> Dict:
+        """
+        ask_question for every suspect at once (needs for_suspects)
+        Returns arrays: stress_change, new_stress_level, behavior (see
+        behavior()) and breakthrough.
+        """
+        lowered = question.lower()
+        mentioned = np.array([trigger in lowered for trigger in self.triggers], dtype=np.int64)
+        hits = self.trigger_counts @ mentioned
+        aggressive = any(word in lowered for word in InterrogationEngine.AGGRESSIVE_WORDS)
+        member = TEAM_MEMBERS.index(team_member) if team_member in TEAM_MEMBERS else len(TEAM_MEMBERS)
+        exhibit = self.evidence_ids.get(evidence_id, -1) if evidence_id else -1
+        
+        change = self.step(member, hits, aggressive, exhibit)
+        return {
+            "stress_change": change,
+            "new_stress_level": self.stress,
+            "behavior": self.behavior(change),
+            "breakthrough": self.breakthrough()
+        }
+    
+    def breakthrough(self) -> np.ndarray:
+        return (self.stress > self.parameters["BREAKTHROUGH_STRESS"]) & self.guilty
+    
+    def behavior(self, stress_change: np.ndarray) -> np.ndarray:
+        """(N, len(BEHAVIOR_CUES)) flags: which behavioral notes each suspect shows"""
+        levels = {"change": stress_change, "stress": self.stress}
+        return np.stack([levels[measure] > threshold
+                         for measure, threshold, _note in InterrogationEngine.BEHAVIOR_CUES], axis=1)
+    
+    @staticmethod
+    def behavioral_notes(behavior_row: np.ndarray) -> List[str]:
+        """One suspect's row of behavior() as the engine's notes"""
+        return [note for (_measure, _threshold, note), shown in zip(InterrogationEngine.BEHAVIOR_CUES, behavior_row)
+                if shown]
+
+def check_against_engine(packs: Sequence[Dict], questions: int, seed: int = 0) -> int:
+    """
+    Question every suspect of each case through InterrogationEngine (offline
+    replies) and StressModel side by side; raises AssertionError on the first
+    difference, otherwise returns the suspects checked
+    """
+    from src.modules.case_packs import interrogation_evidence, suspect_profile
+    
+    rng = random.Random(seed)
+    checked = 0
+    for pack in packs:
+        suspects = [suspect_profile(pack, suspect["name"]) for suspect in pack["suspects"]]
+        evidence = interrogation_evidence(pack)
+        model = StressModel.for_suspects(suspects, evidence)
+        engines = []
+        for suspect in suspects:
+            engine = InterrogationEngine("offline")
+            engine.start_interrogation(suspect, interrogation_evidence(pack))
+            engines.append(engine)
+        
+        triggers = [trigger for suspect in suspects for trigger in suspect.stress_triggers]
+        for turn in range(questions):
+            words = [trigger for trigger in triggers if rng.random() < 0.2] or ["that night"]
+            question = "Tell me about " + " and ".join(words) + rng.choice(("", ". Admit it", "? You're lying"))
+            member = rng.choice(TEAM_MEMBERS + ("INSPECTOR",))
+            evidence_id = rng.choice(evidence).id if evidence and rng.random() < 0.3 else None
+            
+            result = model.ask(question, member, evidence_id)
+            for row, engine in enumerate(engines):
+                expected = engine.ask_question(question, member, evidence_id)
+                actual = {
+                    "stress_change": float(result["stress_change"][row]),
+                    "new_stress_level": float(result["new_stress_level"][row]),
+                    "behavioral_notes": StressModel.behavioral_notes(result["behavior"][row]),
+                    "breakthrough": bool(result["breakthrough"][row])
+                }
+                for key, value in actual.items():
+                    if expected[key] != value:
+                        raise AssertionError(f"{pack['case_id']} {engine.current_suspect.name} question {turn + 1}: "
+                                             f"{key} {value!r} != engine {expected[key]!r}")
+        checked += len(suspects)
+    return checked
+
+def main():
+    from src.modules.case_generator import CaseGenerator
+    
+    parser = argparse.ArgumentParser(description="Check the vectorized stress model against InterrogationEngine")
+    parser.add_argument("--check", type=int, default=200, metavar="CASES", help="generated cases to replay")
+    parser.add_argument("--questions", type=int, default=25)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    
+    generator = CaseGenerator(seed=args.seed)
+    packs = [generator.generate(index) for index in range(args.check)]
+    try:
+        checked = check_against_engine(packs, args.questions, args.seed)
+    except AssertionError as e:
+        print(f"mismatch: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"{checked} suspects x {args.questions} questions match InterrogationEngine exactly")
+
+if __name__ == "__main__":
+    main()
@@ -2,18 +2,46 @@
 Base State class - All game states inherit from this
 """
 
+import pygame
+from src.engine.config import Config
+from src.engine.text_cache import TextCache
+from src.engine.text_layout import TextLayout
+
 class BaseState:
+    # Rendered text shared by every state
+    text_cache = TextCache(Config.TEXT_CACHE_SIZE)
+    text_layout = TextLayout(Config.TEXT_LAYOUT_CACHE_SIZE)
+    
+    # States with progress worth keeping get a section in save files
+    persistent = False
+    
     def __init__(self, state_manager):
         self.state_manager = state_manager
         self.font = None
         self._load_fonts()
+        
+        # Static layer cache and pending screen regions to redraw
+        self._static_layer = None
+        self._static_stale = True
+        self._dirty_rects = []
+        self._full_redraw = True
+        
+        # Bumped whenever saved data changes, so autosave skips untouched states
+        self.save_revision = 0
     
     def _load_fonts(self):
-        """Load fonts for the state"""
-        import pygame
-        pygame.font.init()
-        self.font = pygame.font.Font(None, 36)
-        self.title_font = pygame.font.Font(None, 48)
+        """Fetch the engine-wide fonts for the state"""
+        fonts = self.state_manager.fonts
+        self.font = fonts.get("body")
+        self.title_font = fonts.get("title")
+    
+    def render_text(self, text, color, font=None):
+        """Render antialiased text through the shared cache (defaults to the body font)"""
+        return self.text_cache.render(font or self.font, text, color)
+    
+    def render_paragraph(self, text, color, width, font=None, line_height=None, bullet=""):
+        """Render text wrapped to width pixels as one cached surface (defaults to the body font)"""
+        return self.text_layout.render(font or self.font, text, color, width, line_height, bullet)
     
     def enter(self):
         """Called when entering this state"""
@@ -31,6 +59,68 @@ class BaseState:
         """Update state logic"""
         pass
     
+    def save_data(self):
+        """Plain data (dicts, lists, strings, numbers) to store in save files"""
+        return None
+    
+    def load_data(self, data):
+        """Restore what save_data returned"""
+        pass
+    
+    def mark_unsaved(self):
+        """Flag saved data as changed"""
+        self.save_revision += 1
+    
+    def is_idle(self):
+        """True when nothing is animating or redrawing; the main loop then sleeps until input"""
+        return not self._full_redraw and not self._dirty_rects
+    
+    def invalidate(self, rect=None):
+        """Mark a screen region for redraw (the whole screen when rect is None)"""
+        if rect is None:
+            self._full_redraw = True
+        else:
+            self._dirty_rects.append(pygame.Rect(rect))
+    
+    def invalidate_static(self):
+        """Rebuild the static layer on the next frame (its surface is reused)"""
+        self._static_stale = True
+        self._full_redraw = True
+    
+    def render_static(self, surface):
+        """Draw content that never changes (backgrounds, titles, panels, instructions)"""
+        surface.fill(Config.BLACK)
+    
+    def render_dynamic(self, screen):
+        """Draw content that changes; called with the screen clipped to the dirty region"""
+        pass
+    
     def render(self, screen):
-        """Render state to screen"""
-        pass
\ No newline at end of file
+        """
+        Render state to screen
+        Restores the cached static layer under the dirty region, redraws dynamic
+        content inside it and returns the changed rects ([] when nothing changed).
+        """
+        if not self._full_redraw and not self._dirty_rects:
+            return []
+        
+        if self._static_layer is None or self._static_layer.get_size() != screen.get_size():
+            self._static_layer = pygame.Surface(screen.get_size(), 0, screen)
+            self._static_stale = True
+        if self._static_stale:
+            self.render_static(self._static_layer)
+            self._static_stale = False
+        
+        if self._full_redraw:
+            dirty = screen.get_rect()
+        else:
+            dirty = self._dirty_rects[0].unionall(self._dirty_rects[1:]).clip(screen.get_rect())
+        
+        screen.set_clip(dirty)
+        screen.blit(self._static_layer, dirty, dirty)
+        self.render_dynamic(screen)
+        screen.set_clip(None)
+        
+        self._dirty_rects = []
+        self._full_redraw = False
+        return [dirty]
\ No newline at end of file
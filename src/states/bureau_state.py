@@ -18,6 +18,7 @@ class BureauState(BaseState):
             ("Back to Menu", Config.STATE_MENU)
         ]
         self.selected_option = 0
+        self.options_rect = pygame.Rect(0, 380, Config.SCREEN_WIDTH, len(self.menu_options) * 40)
         self.team_status = {
             "ACP": "Available - Ready for leadership",
             "DAYA": "Available - Ready for action", 
@@ -29,8 +30,10 @@ class BureauState(BaseState):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_UP:
                 self.selected_option = (self.selected_option - 1) % len(self.menu_options)
+                self.invalidate(self.options_rect)
             elif event.key == pygame.K_DOWN:
                 self.selected_option = (self.selected_option + 1) % len(self.menu_options)
+                self.invalidate(self.options_rect)
             elif event.key == pygame.K_RETURN:
                 self._select_option()
             elif event.key == pygame.K_ESCAPE:
@@ -43,18 +46,18 @@ class BureauState(BaseState):
         if action:
             self.state_manager.change_state(action)
     
-    def render(self, screen):
+    def render_static(self, screen):
         # Background
         screen.fill(Config.CID_BLUE)
         
         # Title
-        title_text = self.title_font.render("CID Bureau - Mumbai", True, Config.EVIDENCE_YELLOW)
+        title_text = self.render_text("CID Bureau - Mumbai", Config.EVIDENCE_YELLOW, self.title_font)
         title_rect = title_text.get_rect(center=(Config.SCREEN_WIDTH // 2, 80))
         screen.blit(title_text, title_rect)
         
         # Team status panel
         team_y = 150
-        team_title = self.font.render("Team Status:", True, Config.WHITE)
+        team_title = self.render_text("Team Status:", Config.WHITE)
         screen.blit(team_title, (50, team_y))
         
         for i, (member, status) in enumerate(self.team_status.items()):
@@ -62,24 +65,28 @@ class BureauState(BaseState):
             text = f"{member_info['name']}: {status}"
             color = Config.EVIDENCE_YELLOW if "Available" in status else Config.CID_GRAY
             
-            member_text = self.font.render(text, True, color)
+            member_text = self.render_text(text, color)
             screen.blit(member_text, (70, team_y + 40 + i * 30))
         
         # Main menu
         menu_x = Config.SCREEN_WIDTH // 2
         menu_y = 350
         
-        menu_title = self.font.render("Select Investigation Area:", True, Config.WHITE)
+        menu_title = self.render_text("Select Investigation Area:", Config.WHITE)
         menu_title_rect = menu_title.get_rect(center=(menu_x, menu_y))
         screen.blit(menu_title, menu_title_rect)
         
+        # Instructions
+        instruction_text = self.render_text("Arrow Keys: Navigate | Enter: Select | Escape: Back", Config.CID_GRAY)
+        instruction_rect = instruction_text.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT - 30))
+        screen.blit(instruction_text, instruction_rect)
+    
+    def render_dynamic(self, screen):
+        # Menu options
+        menu_x = Config.SCREEN_WIDTH // 2
+        menu_y = 350
         for i, (option_text, _) in enumerate(self.menu_options):
             color = Config.EVIDENCE_YELLOW if i == self.selected_option else Config.WHITE
-            text = self.font.render(f"> {option_text}" if i == self.selected_option else f"  {option_text}", True, color)
+            text = self.render_text(f"> {option_text}" if i == self.selected_option else f"  {option_text}", color)
             text_rect = text.get_rect(center=(menu_x, menu_y + 50 + i * 40))
-            screen.blit(text, text_rect)
-        
-        # Instructions
-        instruction_text = self.font.render("Arrow Keys: Navigate | Enter: Select | Escape: Back", True, Config.CID_GRAY)
-        instruction_rect = instruction_text.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT - 30))
-        screen.blit(instruction_text, instruction_rect)
\ No newline at end of file
+            screen.blit(text, text_rect)
\ No newline at end of file
@@ -1,132 +1,372 @@
 """
 Case Files State - Review active and closed cases
+The archive lives in a SQLite repository; the screen keeps a few pages of
+case summaries around the selection, fetched by keyset from neighbouring rows,
+and loads the full file of the selected case only. Searches rank every match,
+so they run on a worker thread and the list fills in when the ids arrive.
 """
 
+import threading
 import pygame
 from src.states.base_state import BaseState
 from src.engine.config import Config
+from src.modules.case_repository import CaseRepository, sort_key
+
+# Seeded into an empty archive so a fresh install has something to open
+SAMPLE_CASES = [
+    {
+        "case_id": "CASE_001",
+        "title": "The Office Murder",
+        "status": "Active",
+        "victim": "Mr. Sharma",
+        "location": "Corporate Office, Floor 12",
+        "date": "2024-12-20",
+        "evidence_count": 4,
+        "suspects": ["Rajesh Kumar", "Priya Singh", "Amit Patel"],
+        "description": "Senior manager found dead in his office. Signs of struggle. Multiple suspects with motives.",
+        "progress": 65
+    },
+    {
+        "case_id": "CASE_002",
+        "title": "The Missing Diamond",
+        "status": "Cold",
+        "victim": "Mrs. Gupta",
+        "location": "Jewelry Store, Linking Road",
+        "date": "2024-11-15",
+        "evidence_count": 2,
+        "suspects": ["Security Guard", "Store Assistant"],
+        "description": "Rare diamond worth 50 lakhs stolen during business hours. No signs of break-in.",
+        "progress": 30
+    },
+    {
+        "case_id": "CASE_003",
+        "title": "The Cyber Fraud",
+        "status": "Solved",
+        "victim": "Tech Company",
+        "location": "IT Park, Andheri",
+        "date": "2024-10-08",
+        "evidence_count": 8,
+        "suspects": ["Former Employee"],
+        "description": "Company database hacked, sensitive data stolen. Inside job suspected.",
+        "progress": 100
+    }
+]
+
+# Status filters cycled with Left/Right (None shows every case)
+STATUS_FILTERS = [None, "Active", "Cold", "Solved"]
+
+STATUS_COLORS = {
+    "Active": Config.EVIDENCE_YELLOW,
+    "Cold": Config.CID_GRAY,
+    "Solved": (0, 255, 0)
+}
 
 class CaseFilesState(BaseState):
+    # Case rows shown in the list at once
+    VISIBLE_ROWS = 5
+    # Pages of summaries kept in memory around the selection
+    CACHED_PAGES = 4
+    
     def __init__(self, state_manager):
         super().__init__(state_manager)
+        self.selected_case = 0  # index into the filtered, sorted archive
+        self.scroll_top = 0
+        self.content_rect = pygame.Rect(0, 110, Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT - 165)
+        
+        # Opened on first entry, from the main thread that will query it
+        self.repository = None
+        
+        # Current query and its cached results: list index -> summary, and a search's case ids
+        self.status_index = 0
+        self.order = "date"
+        self.search = ""
+        self.search_input = None  # text being typed after "/", None when not searching
+        self.total = 0
+        self._rows = {}
+        self._matches = None
+        self._details = None
+        
+        # Search running on the worker thread, and its (query, case ids) once done
+        self._search_thread = None
+        self._search_result = None
+    
+    def enter(self):
+        if self.repository is None:
+            self.repository = CaseRepository(Config.CASE_DATABASE)
+            if self.repository.count() == 0:
+                self.repository.add_cases(SAMPLE_CASES)
+        self._refresh()
+    
+    @property
+    def status_filter(self):
+        return STATUS_FILTERS[self.status_index]
+    
+    @property
+    def searching(self):
+        """True while a search is waiting for its matches"""
+        return self._search_thread is not None
+    
+    def _refresh(self):
+        """Count the current filter (or start the search) and drop cached rows"""
+        self._rows.clear()
+        self._matches = None
+        self._details = None
         self.selected_case = 0
-        self.cases = [
-            {
-                "id": "CASE_001",
-                "title": "The Office Murder",
-                "status": "Active",
-                "victim": "Mr. Sharma",
-                "location": "Corporate Office, Floor 12",
-                "date": "2024-12-20",
-                "evidence_count": 4,
-                "suspects": ["Rajesh Kumar", "Priya Singh", "Amit Patel"],
-                "description": "Senior manager found dead in his office. Signs of struggle. Multiple suspects with motives.",
-                "progress": 65
-            },
-            {
-                "id": "CASE_002", 
-                "title": "The Missing Diamond",
-                "status": "Cold",
-                "victim": "Mrs. Gupta",
-                "location": "Jewelry Store, Linking Road",
-                "date": "2024-11-15",
-                "evidence_count": 2,
-                "suspects": ["Security Guard", "Store Assistant"],
-                "description": "Rare diamond worth 50 lakhs stolen during business hours. No signs of break-in.",
-                "progress": 30
-            },
-            {
-                "id": "CASE_003",
-                "title": "The Cyber Fraud",
-                "status": "Solved",
-                "victim": "Tech Company",
-                "location": "IT Park, Andheri",
-                "date": "2024-10-08",
-                "evidence_count": 8,
-                "suspects": ["Former Employee"],
-                "description": "Company database hacked, sensitive data stolen. Inside job suspected.",
-                "progress": 100
-            }
-        ]
+        self.scroll_top = 0
+        self.total = 0
+        if self.search:
+            self._start_search()
+        else:
+            self.total = self.repository.count(self.status_filter)
+        self.invalidate(self.content_rect)
+    
+    def _start_search(self):
+        """Look up every match on a worker thread (inline for headless runs and replays)"""
+        if not Config.CASE_SEARCH_THREADED:
+            self._show_matches(self.repository.search(self.search, self.status_filter))
+        elif self._search_thread is None:
+            # A search already running is redone for the new filters when it finishes
+            self._search_result = None
+            self._search_thread = threading.Thread(target=self._search, args=((self.search, self.status_filter),),
+                                                   daemon=True)
+            self._search_thread.start()
+    
+    def _search(self, query):
+        # SQLite connections belong to the thread that opened them
+        repository = CaseRepository(Config.CASE_DATABASE)
+        try:
+            self._search_result = (query, repository.search(*query))
+        finally:
+            repository.close()
+    
+    def _show_matches(self, case_ids):
+        self._matches = case_ids
+        self.total = len(case_ids)
+        self.invalidate(self.content_rect)
+    
+    def update(self, dt):
+        """Pick up a finished search"""
+        if self._search_thread is None or self._search_thread.is_alive():
+            return
+        self._search_thread = None
+        if self._search_result is None:
+            self.invalidate(self.content_rect)  # failed; shows as no matches
+            return
+        query, case_ids = self._search_result
+        if not self.search:
+            return
+        if query == (self.search, self.status_filter):
+            self._show_matches(case_ids)
+        else:
+            self._start_search()
+    
+    def is_idle(self):
+        return not self.searching and super().is_idle()
+    
+    def _case_at(self, index):
+        """Summary row at an index, fetching pages towards it on a miss"""
+        while index not in self._rows:
+            if not self._fetch_towards(index):
+                return None
+        return self._rows[index]
+    
+    def _fetch_towards(self, index):
+        """
+        Fetch the page of rows between index and the nearest cached row (or end of the list)
+        Search results are read by id; other lists continue from a neighbour's sort key.
+        """
+        page_size = Config.CASE_PAGE_SIZE
+        if self._matches is not None:
+            first = index - index % page_size
+            rows = self.repository.summaries(self._matches[first:first + page_size])
+        else:
+            below = max((cached for cached in self._rows if cached < index), default=-1)
+            above = min((cached for cached in self._rows if cached > index), default=self.total)
+            if index - below <= above - index:
+                after = sort_key(self._rows[below], self.order) if below >= 0 else None
+                rows = self.repository.list_cases(self.status_filter, page_size, self.order, after=after)
+                first = below + 1
+            else:
+                before = sort_key(self._rows[above], self.order) if above < self.total else None
+                rows = self.repository.list_cases(self.status_filter, page_size, self.order,
+                                                  before=before, last=before is None)
+                first = above - len(rows)
+        if not rows:
+            return False
+        self._rows.update(zip(range(first, first + len(rows)), rows))
         
+        # Keep the rows nearest the one being read
+        excess = len(self._rows) - self.CACHED_PAGES * page_size
+        if excess > 0:
+            for cached in sorted(self._rows, key=lambda cached: abs(cached - index), reverse=True)[:excess]:
+                del self._rows[cached]
+        return True
+    
+    def _selected_details(self):
+        """Full case file of the selection, loaded once per selection"""
+        summary = self._case_at(self.selected_case) if self.total else None
+        if summary is None:
+            return None
+        if self._details is None or self._details["case_id"] != summary["case_id"]:
+            self._details = self.repository.get_case(summary["case_id"])
+        return self._details
+    
+    def _select(self, index):
+        if not self.total:
+            return
+        self.selected_case = min(max(0, index), self.total - 1)
+        if self.selected_case < self.scroll_top:
+            self.scroll_top = self.selected_case
+        elif self.selected_case >= self.scroll_top + self.VISIBLE_ROWS:
+            self.scroll_top = self.selected_case - self.VISIBLE_ROWS + 1
+        self.invalidate(self.content_rect)
+    
     def handle_event(self, event):
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_UP:
-                self.selected_case = (self.selected_case - 1) % len(self.cases)
-            elif event.key == pygame.K_DOWN:
-                self.selected_case = (self.selected_case + 1) % len(self.cases)
-            elif event.key == pygame.K_RETURN:
-                self._open_case()
-            elif event.key == pygame.K_ESCAPE:
+        if event.type != pygame.KEYDOWN:
+            return
+        if self.search_input is not None:
+            self._handle_search_key(event)
+            return
+        
+        if event.key == pygame.K_UP:
+            self._select(self.selected_case - 1 if self.selected_case else self.total - 1)
+        elif event.key == pygame.K_DOWN:
+            self._select(self.selected_case + 1 if self.selected_case < self.total - 1 else 0)
+        elif event.key == pygame.K_PAGEUP:
+            self._select(self.selected_case - self.VISIBLE_ROWS)
+        elif event.key == pygame.K_PAGEDOWN:
+            self._select(self.selected_case + self.VISIBLE_ROWS)
+        elif event.key == pygame.K_HOME:
+            self._select(0)
+        elif event.key == pygame.K_END:
+            self._select(self.total - 1)
+        elif event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+            step = 1 if event.key == pygame.K_RIGHT else -1
+            self.status_index = (self.status_index + step) % len(STATUS_FILTERS)
+            self._refresh()
+        elif event.key == pygame.K_TAB and not self.search:
+            self.order = "title" if self.order == "date" else "date"
+            self._refresh()
+        elif event.unicode == "/":
+            self.search_input = self.search
+            self.invalidate(self.content_rect)
+        elif event.key == pygame.K_RETURN:
+            self._open_case()
+        elif event.key == pygame.K_ESCAPE:
+            if self.search:
+                self.search = ""
+                self._refresh()
+            else:
                 self.state_manager.change_state(Config.STATE_BUREAU)
     
+    def _handle_search_key(self, event):
+        """Edit the search text; Enter runs it, Escape cancels"""
+        if event.key == pygame.K_RETURN:
+            self.search = self.search_input.strip()
+            self.search_input = None
+            self._refresh()
+        elif event.key == pygame.K_ESCAPE:
+            self.search_input = None
+        elif event.key == pygame.K_BACKSPACE:
+            self.search_input = self.search_input[:-1]
+        elif event.unicode and event.unicode.isprintable():
+            self.search_input += event.unicode
+        self.invalidate(self.content_rect)
+    
     def _open_case(self):
         """Open selected case for investigation"""
-        case = self.cases[self.selected_case]
-        if case["status"] == "Active":
-            # For active cases, go to crime scene
+        case = self._selected_details()
+        if case and case["status"] == "Active" and self.state_manager.open_case(case["case_id"]):
+            # Active cases with a case pack go to their crime scene
             self.state_manager.change_state(Config.STATE_CRIME_SCENE)
-        # For solved/cold cases, just display details (already shown)
+        # Other cases just display details (already shown)
     
-    def render(self, screen):
+    def render_static(self, screen):
         # Background
         screen.fill(Config.CID_BLUE)
         
         # Title
-        title_text = self.title_font.render("CID Case Files Database", True, Config.EVIDENCE_YELLOW)
+        title_text = self.render_text("CID Case Files Database", Config.EVIDENCE_YELLOW, self.title_font)
         title_rect = title_text.get_rect(center=(Config.SCREEN_WIDTH // 2, 50))
         screen.blit(title_text, title_rect)
         
+        # Panel titles
+        details_title = self.render_text("Case Details:", Config.WHITE)
+        screen.blit(details_title, (500, 120))
+        
+        # Instructions
+        instruction_text = self.render_text("Up/Down: Navigate | Left/Right: Filter | /: Search | Enter: Open | Esc: Back", Config.CID_GRAY)
+        instruction_rect = instruction_text.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT - 30))
+        screen.blit(instruction_text, instruction_rect)
+    
+    def render_dynamic(self, screen):
         # Case list (left side)
         list_x = 50
         list_y = 120
         list_width = 400
         
-        list_title = self.font.render("Active Cases:", True, Config.WHITE)
+        list_title = self.render_text(f"{self.status_filter or 'All'} Cases ({self.total:,}):", Config.WHITE)
         screen.blit(list_title, (list_x, list_y))
         
-        for i, case in enumerate(self.cases):
+        clip = screen.get_clip()
+        last_row = min(self.total, self.scroll_top + self.VISIBLE_ROWS)
+        for i, index in enumerate(range(self.scroll_top, last_row)):
+            case = self._case_at(index)
+            if case is None:
+                break
             y_pos = list_y + 40 + i * 80
             
             # Case background
-            if i == self.selected_case:
+            if index == self.selected_case:
                 pygame.draw.rect(screen, Config.EVIDENCE_YELLOW, (list_x, y_pos, list_width, 70), 2)
                 bg_color = (40, 40, 80)
             else:
                 bg_color = (30, 30, 60)
             
-            pygame.draw.rect(screen, bg_color, (list_x + 2, y_pos + 2, list_width - 4, 66))
+            row_rect = pygame.Rect(list_x + 2, y_pos + 2, list_width - 4, 66)
+            pygame.draw.rect(screen, bg_color, row_rect)
             
-            # Case info
-            case_title = self.font.render(f"{case['id']}: {case['title']}", True, Config.WHITE)
+            # Case info, clipped so long titles stay inside the row
+            screen.set_clip(row_rect.clip(clip))
+            case_title = self.render_text(f"{case['case_id']}: {case['title']}", Config.WHITE)
             screen.blit(case_title, (list_x + 10, y_pos + 10))
             
-            # Status color coding
-            status_colors = {
-                "Active": Config.EVIDENCE_YELLOW,
-                "Cold": Config.CID_GRAY,
-                "Solved": (0, 255, 0)
-            }
-            status_color = status_colors.get(case["status"], Config.WHITE)
-            
-            status_text = self.font.render(f"Status: {case['status']}", True, status_color)
+            status_color = STATUS_COLORS.get(case["status"], Config.WHITE)
+            status_text = self.render_text(f"Status: {case['status']}", status_color)
             screen.blit(status_text, (list_x + 10, y_pos + 35))
             
-            progress_text = self.font.render(f"Progress: {case['progress']}%", True, Config.WHITE)
+            progress_text = self.render_text(f"Progress: {case['progress']}%", Config.WHITE)
             screen.blit(progress_text, (list_x + 200, y_pos + 35))
+            screen.set_clip(clip)
+        
+        # Position and search line under the list
+        footer_y = list_y + 40 + self.VISIBLE_ROWS * 80
+        if self.searching:
+            position = "Searching..."
+        elif self.total:
+            sort = "Relevance" if self._matches is not None else f"{self.order.title()} (Tab)"
+            position = f"{self.scroll_top + 1}-{last_row} of {self.total:,} | Sort: {sort}"
+        else:
+            position = "No cases match"
+        position_text = self.render_text(position, Config.CID_GRAY)
+        screen.blit(position_text, (list_x, footer_y))
+        
+        if self.search_input is not None:
+            search_text = self.render_text(f"Search: {self.search_input}_", Config.EVIDENCE_YELLOW)
+            screen.blit(search_text, (list_x, footer_y + 35))
+        elif self.search:
+            search_text = self.render_text(f"Search: {self.search} (Esc clears)", Config.WHITE)
+            screen.blit(search_text, (list_x, footer_y + 35))
         
         # Case details (right side)
-        if self.cases:
-            selected_case = self.cases[self.selected_case]
+        selected_case = self._selected_details()
+        if selected_case:
             details_x = list_x + list_width + 50
             details_y = 120
             
-            details_title = self.font.render("Case Details:", True, Config.WHITE)
-            screen.blit(details_title, (details_x, details_y))
-            
             # Case details
             details = [
-                f"Case ID: {selected_case['id']}",
+                f"Case ID: {selected_case['case_id']}",
                 f"Title: {selected_case['title']}",
                 f"Victim: {selected_case['victim']}",
                 f"Location: {selected_case['location']}",
@@ -134,57 +374,33 @@ class CaseFilesState(BaseState):
                 f"Evidence Collected: {selected_case['evidence_count']} items",
                 f"Suspects: {len(selected_case['suspects'])} persons",
                 "",
-                "Description:",
-                selected_case['description']
+                "Description:"
             ]
             
             for i, detail in enumerate(details):
-                if detail == "Description:":
-                    color = Config.EVIDENCE_YELLOW
-                elif detail == "":
+                if detail == "":
                     continue
-                else:
-                    color = Config.WHITE
-                
-                # Wrap long descriptions
-                if len(detail) > 50 and detail.startswith(selected_case['description']):
-                    words = detail.split()
-                    lines = []
-                    current_line = ""
-                    
-                    for word in words:
-                        if len(current_line + word) < 50:
-                            current_line += word + " "
-                        else:
-                            lines.append(current_line.strip())
-                            current_line = word + " "
-                    
-                    if current_line:
-                        lines.append(current_line.strip())
-                    
-                    for j, line in enumerate(lines):
-                        detail_text = self.font.render(line, True, color)
-                        screen.blit(detail_text, (details_x + 10, details_y + 40 + (i + j) * 25))
-                else:
-                    detail_text = self.font.render(detail, True, color)
-                    screen.blit(detail_text, (details_x + 10, details_y + 40 + i * 25))
+                color = Config.EVIDENCE_YELLOW if detail == "Description:" else Config.WHITE
+                detail_text = self.render_text(detail, color)
+                screen.blit(detail_text, (details_x + 10, details_y + 40 + i * 25))
+            
+            # Description wrapped to the panel width
+            description_y = details_y + 40 + len(details) * 25
+            description_width = Config.SCREEN_WIDTH - details_x - 60
+            description = self.render_paragraph(selected_case['description'], Config.WHITE, description_width)
+            screen.blit(description, (details_x + 10, description_y))
             
             # Suspects list
-            suspects_y = details_y + 300
-            suspects_title = self.font.render("Suspects:", True, Config.EVIDENCE_YELLOW)
+            suspects_y = max(details_y + 300, description_y + description.get_height() + 15)
+            suspects_title = self.render_text("Suspects:", Config.EVIDENCE_YELLOW)
             screen.blit(suspects_title, (details_x, suspects_y))
             
             for i, suspect in enumerate(selected_case['suspects']):
-                suspect_text = self.font.render(f"• {suspect}", True, Config.WHITE)
+                suspect_text = self.render_text(f"• {suspect}", Config.WHITE)
                 screen.blit(suspect_text, (details_x + 10, suspects_y + 30 + i * 25))
             
             # Action hint
-            if selected_case["status"] == "Active":
-                action_text = self.font.render("Press ENTER to investigate this case", True, Config.EVIDENCE_YELLOW)
-                action_rect = action_text.get_rect(center=(details_x + 200, suspects_y + 120))
+            if selected_case["status"] == "Active" and self.state_manager.case_packs.has_case(selected_case["case_id"]):
+                action_text = self.render_text("Press ENTER to investigate this case", Config.EVIDENCE_YELLOW)
+                action_rect = action_text.get_rect(center=(details_x + 200, suspects_y + 55 + len(selected_case['suspects']) * 25))
                 screen.blit(action_text, action_rect)
-        
-        # Instructions
-        instruction_text = self.font.render("Arrow Keys: Navigate | Enter: Open Case | Escape: Back to Bureau", True, Config.CID_GRAY)
-        instruction_rect = instruction_text.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT - 30))
-        screen.blit(instruction_text, instruction_rect)
\ No newline at end of file
@@ -4,22 +4,65 @@ Crime Scene Investigation State
 
 import pygame
 from src.states.base_state import BaseState
+from src.engine.camera import Camera
 from src.engine.config import Config
+from src.engine.tile_cache import TileCache
+from src.modules.spatial_grid import SpatialGrid
+
+# Held keys -> pan direction
+PAN_KEYS = {
+    pygame.K_LEFT: (-1, 0), pygame.K_a: (-1, 0),
+    pygame.K_RIGHT: (1, 0), pygame.K_d: (1, 0),
+    pygame.K_UP: (0, -1), pygame.K_w: (0, -1),
+    pygame.K_DOWN: (0, 1), pygame.K_s: (0, 1)
+}
+ZOOM_KEYS = {pygame.K_EQUALS: 1, pygame.K_PLUS: 1, pygame.K_KP_PLUS: 1, pygame.K_MINUS: -1, pygame.K_KP_MINUS: -1}
 
 class CrimeSceneState(BaseState):
+    persistent = True
+    
+    # Clicks and hovers within this many pixels of a marker pick it
+    HIT_RADIUS = 50
+    # Largest marker drawn (found markers, hover ring), for culling and dirty rects
+    MARKER_RADIUS = 16
+    # Keyboard pan speed (screen pixels per second) and floor tile pattern size (world pixels)
+    PAN_SPEED = 900
+    FLOOR_TILE = 64
+    FLOOR_COLOR = (40, 40, 60)
+    FLOOR_LINE_COLOR = (46, 46, 68)
+    OUTSIDE_COLOR = (22, 22, 32)
+    
     def __init__(self, state_manager):
         super().__init__(state_manager)
         self.evidence_found = []
         self.investigation_progress = 0
-        self.current_scene = "Office Building - Floor 12"
-        
-        # Available evidence at the scene
-        self.available_evidence = [
-            {"id": "fingerprint_1", "name": "Fingerprint on Door", "found": False, "x": 200, "y": 300},
-            {"id": "blood_sample", "name": "Blood Sample", "found": False, "x": 400, "y": 250},
-            {"id": "security_footage", "name": "Security Camera", "found": False, "x": 600, "y": 150},
-            {"id": "witness_statement", "name": "Witness", "found": False, "x": 300, "y": 400}
-        ]
+        self.progress_rect = pygame.Rect((Config.SCREEN_WIDTH - 400) // 2, 100, 400, 20)
+        
+        # Evidence markers at the scene, from the open case's pack
+        scene = state_manager.case["scene"]
+        self.current_scene = scene["name"]
+        self.available_evidence = [dict(evidence, found=False) for evidence in scene["evidence"]]
+        
+        # Scenes can be larger than the screen: the camera pans and zooms over
+        # background tiles rendered on demand
+        self.camera = Camera(
+            pygame.Rect(0, 0, Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT),
+            scene["width"] or Config.SCREEN_WIDTH,
+            scene["height"] or Config.SCREEN_HEIGHT
+        )
+        self.tiles = TileCache(self._render_floor_tile, Config.SCENE_TILE_SIZE, Config.SCENE_TILE_CACHE)
+        self.pan_keys = set()
+        self.dragging = False
+        self.mouse_pos = self.camera.viewport.center
+        
+        # Marker positions indexed by list position, for hit testing and drawing only what's in view
+        self.evidence_grid = SpatialGrid()
+        for index, evidence in enumerate(self.available_evidence):
+            self.evidence_grid.insert(index, evidence["x"], evidence["y"])
+        
+        # Markers not yet collected, in scene order (Space takes the first)
+        self.unfound = dict(enumerate(self.available_evidence))
+        self.hovered = None
     
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
@@ -27,95 +70,223 @@ class CrimeSceneState(BaseState):
                 self.state_manager.change_state(Config.STATE_BUREAU)
             elif event.key == pygame.K_SPACE:
                 self._investigate_nearby_evidence()
+            elif event.key in PAN_KEYS:
+                self.pan_keys.add(event.key)
+            elif event.key in ZOOM_KEYS:
+                self._zoom(ZOOM_KEYS[event.key], self.camera.viewport.center)
+            elif event.key == pygame.K_HOME:
+                self.camera.reset()
+                self._camera_moved()
+        
+        elif event.type == pygame.KEYUP:
+            self.pan_keys.discard(event.key)
         
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
                 self._check_evidence_click(event.pos)
+            elif event.button in (2, 3):  # Middle or right drag pans
+                self.dragging = True
+        
+        elif event.type == pygame.MOUSEBUTTONUP:
+            if event.button in (2, 3):
+                self.dragging = False
+        
+        elif event.type == pygame.MOUSEMOTION:
+            self.mouse_pos = event.pos
+            if self.dragging and self.camera.pan(-event.rel[0], -event.rel[1]):
+                self._camera_moved()
+            else:
+                self._update_hover(event.pos)
+        
+        elif event.type == pygame.MOUSEWHEEL and event.y:
+            # Horizontal wheel and trackpad scrolls (y == 0) don't zoom
+            self._zoom(1 if event.y > 0 else -1, self.mouse_pos)
+    
+    def exit(self):
+        # Key releases go to the next state, so stop panning now
+        self.pan_keys.clear()
+        self.dragging = False
+    
+    def update(self, dt):
+        """Pan while arrow/WASD keys are held"""
+        if self.pan_keys:
+            dx = sum(PAN_KEYS[key][0] for key in self.pan_keys)
+            dy = sum(PAN_KEYS[key][1] for key in self.pan_keys)
+            if self.camera.pan(dx * self.PAN_SPEED * dt, dy * self.PAN_SPEED * dt):
+                self._camera_moved()
+    
+    def is_idle(self):
+        return super().is_idle() and not self.pan_keys
+    
+    def _zoom(self, step, screen_pos):
+        if self.camera.zoom_at(step, screen_pos):
+            self._camera_moved()
+    
+    def _camera_moved(self):
+        """Redraw the background for the new view and re-pick the marker under the mouse"""
+        self.invalidate_static()
+        self._update_hover(self.mouse_pos)
     
     def _investigate_nearby_evidence(self):
         """Investigate evidence near the player"""
         # Simple implementation - find first unfound evidence
-        for evidence in self.available_evidence:
-            if not evidence["found"]:
-                evidence["found"] = True
-                self.evidence_found.append(evidence)
-                self.investigation_progress = len(self.evidence_found) / len(self.available_evidence) * 100
-                break
+        if self.unfound:
+            self._collect_evidence(next(iter(self.unfound)))
+    
+    def _evidence_at(self, pos):
+        """Index of the nearest unfound marker within reach of a screen point, or None"""
+        x, y = self.camera.screen_to_world(*pos)
+        radius = self.HIT_RADIUS / self.camera.zoom
+        return self.evidence_grid.nearest(x, y, radius, self.unfound.__contains__)
     
     def _check_evidence_click(self, pos):
         """Check if player clicked on evidence"""
-        mouse_x, mouse_y = pos
-        
+        index = self._evidence_at(pos)
+        if index is not None:
+            self._collect_evidence(index)
+    
+    def _update_hover(self, pos):
+        """Highlight the marker under the mouse, redrawing only the markers that changed"""
+        index = self._evidence_at(pos)
+        if index != self.hovered:
+            for changed in (self.hovered, index):
+                if changed is not None:
+                    self.invalidate(self._marker_rect(self.available_evidence[changed]))
+            self.hovered = index
+    
+    def _marker_rect(self, evidence):
+        """Screen area covered by a marker"""
+        size = self.MARKER_RADIUS * 2 + 2
+        x, y = self.camera.world_to_screen(evidence["x"], evidence["y"])
+        return pygame.Rect(x - size // 2, y - size // 2, size, size)
+    
+    def _collect_evidence(self, index):
+        """Mark evidence as found and file it in the shared evidence graph"""
+        evidence = self.unfound.pop(index)
+        evidence["found"] = True
+        self.evidence_found.append(evidence)
+        self.investigation_progress = len(self.evidence_found) / len(self.available_evidence) * 100
+        if self.hovered == index:
+            self.hovered = None
+        self.state_manager.evidence_graph.add_evidence(
+            evidence["id"], evidence["type"], evidence["name"], self.current_scene
+        )
+        self.mark_unsaved()
+        self.invalidate()
+    
+    def save_data(self):
+        return {"found": [evidence["id"] for evidence in self.evidence_found]}
+    
+    def load_data(self, data):
+        """Restore which markers were collected (the graph is restored separately)"""
+        found = set(data["found"])
         for evidence in self.available_evidence:
-            if not evidence["found"]:
-                # Check if click is near evidence location
-                distance = ((mouse_x - evidence["x"]) ** 2 + (mouse_y - evidence["y"]) ** 2) ** 0.5
-                if distance < 50:  # 50 pixel radius
-                    evidence["found"] = True
-                    self.evidence_found.append(evidence)
-                    self.investigation_progress = len(self.evidence_found) / len(self.available_evidence) * 100
-                    break
-    
-    def render(self, screen):
-        # Background
-        screen.fill((40, 40, 60))  # Dark scene
+            evidence["found"] = evidence["id"] in found
+        self.evidence_found = [evidence for evidence in self.available_evidence if evidence["found"]]
+        self.unfound = {index: evidence for index, evidence in enumerate(self.available_evidence)
+                        if not evidence["found"]}
+        self.hovered = None
+        self.investigation_progress = len(self.evidence_found) / len(self.available_evidence) * 100
+        self.invalidate()
+    
+    def _render_floor_tile(self, tile, zoom, tile_x, tile_y):
+        """Draw one background tile: the scene floor with its tile pattern, darker outside the scene"""
+        size = tile.get_width()
+        left, top = tile_x * size, tile_y * size
+        tile.fill(self.OUTSIDE_COLOR)
+        floor = pygame.Rect(-left, -top, round(self.camera.world_width * zoom), round(self.camera.world_height * zoom))
+        floor = floor.clip(tile.get_rect())
+        if not floor.width or not floor.height:
+            return
+        tile.fill(self.FLOOR_COLOR, floor)
+        
+        # Pattern lines every FLOOR_TILE world pixels inside the floor
+        step = self.FLOOR_TILE * zoom
+        first = int(left // step) + 1
+        for line in range(first, int((left + size) // step) + 1):
+            x = round(line * step) - left
+            if floor.left <= x < floor.right:
+                pygame.draw.line(tile, self.FLOOR_LINE_COLOR, (x, floor.top), (x, floor.bottom - 1))
+        first = int(top // step) + 1
+        for line in range(first, int((top + size) // step) + 1):
+            y = round(line * step) - top
+            if floor.top <= y < floor.bottom:
+                pygame.draw.line(tile, self.FLOOR_LINE_COLOR, (floor.left, y), (floor.right - 1, y))
+    
+    def render_static(self, screen):
+        # Background: the part of the scene in view
+        self.tiles.draw(screen, self.camera)
         
         # Scene title
-        title_text = self.title_font.render(f"Crime Scene: {self.current_scene}", True, Config.EVIDENCE_YELLOW)
+        title_text = self.render_text(f"Crime Scene: {self.current_scene}", Config.EVIDENCE_YELLOW, self.title_font)
         title_rect = title_text.get_rect(center=(Config.SCREEN_WIDTH // 2, 50))
         screen.blit(title_text, title_rect)
         
-        # Progress bar
-        progress_width = 400
-        progress_height = 20
-        progress_x = (Config.SCREEN_WIDTH - progress_width) // 2
-        progress_y = 100
-        
         # Progress background
-        pygame.draw.rect(screen, Config.CID_GRAY, (progress_x, progress_y, progress_width, progress_height))
+        pygame.draw.rect(screen, Config.CID_GRAY, self.progress_rect)
         
+        # Evidence list title
+        evidence_title = self.render_text("Evidence Found:", Config.WHITE)
+        screen.blit(evidence_title, (50, 200))
+        
+        # Instructions
+        instructions = [
+            "Click on yellow circles to investigate evidence | Space: Quick investigate | Escape: Return to Bureau",
+            "Arrows/WASD or right-drag: Pan | Wheel or +/-: Zoom | Home: Reset view"
+        ]
+        
+        for i, instruction in enumerate(instructions):
+            instruction_text = self.render_text(instruction, Config.CID_GRAY)
+            screen.blit(instruction_text, (50, Config.SCREEN_HEIGHT - 60 + i * 25))
+    
+    def render_dynamic(self, screen):
         # Progress fill
-        fill_width = int(progress_width * (self.investigation_progress / 100))
-        pygame.draw.rect(screen, Config.EVIDENCE_YELLOW, (progress_x, progress_y, fill_width, progress_height))
+        fill_width = int(self.progress_rect.width * (self.investigation_progress / 100))
+        pygame.draw.rect(screen, Config.EVIDENCE_YELLOW, (self.progress_rect.x, self.progress_rect.y, fill_width, self.progress_rect.height))
         
         # Progress text
-        progress_text = self.font.render(f"Investigation Progress: {self.investigation_progress:.0f}%", True, Config.WHITE)
-        progress_text_rect = progress_text.get_rect(center=(Config.SCREEN_WIDTH // 2, progress_y + 35))
+        progress_text = self.render_text(f"Investigation Progress: {self.investigation_progress:.0f}%", Config.WHITE)
+        progress_text_rect = progress_text.get_rect(center=(Config.SCREEN_WIDTH // 2, self.progress_rect.y + 35))
         screen.blit(progress_text, progress_text_rect)
         
-        # Draw evidence locations
-        for evidence in self.available_evidence:
+        # Draw evidence locations (only markers in view and inside the redrawn region)
+        clip = screen.get_clip().clip(self.camera.viewport).inflate(self.MARKER_RADIUS * 2, self.MARKER_RADIUS * 2)
+        world_to_screen = self.camera.world_to_screen
+        for index in self.evidence_grid.query_rect(*self.camera.world_rect(clip)):
+            evidence = self.available_evidence[index]
+            position = world_to_screen(evidence["x"], evidence["y"])
             if evidence["found"]:
                 # Found evidence - green circle
-                pygame.draw.circle(screen, (0, 255, 0), (evidence["x"], evidence["y"]), 15)
-                pygame.draw.circle(screen, Config.WHITE, (evidence["x"], evidence["y"]), 15, 2)
+                pygame.draw.circle(screen, (0, 255, 0), position, 15)
+                pygame.draw.circle(screen, Config.WHITE, position, 15, 2)
             else:
                 # Unfound evidence - yellow circle (investigation point)
-                pygame.draw.circle(screen, Config.EVIDENCE_YELLOW, (evidence["x"], evidence["y"]), 10)
-                pygame.draw.circle(screen, Config.WHITE, (evidence["x"], evidence["y"]), 10, 2)
+                pygame.draw.circle(screen, Config.EVIDENCE_YELLOW, position, 10)
+                pygame.draw.circle(screen, Config.WHITE, position, 10, 2)
+                if index == self.hovered:
+                    pygame.draw.circle(screen, Config.WHITE, position, self.MARKER_RADIUS, 2)
         
-        # Evidence list
+        # Evidence list (as many lines as fit above the instructions)
         evidence_y = 200
-        evidence_title = self.font.render("Evidence Found:", True, Config.WHITE)
-        screen.blit(evidence_title, (50, evidence_y))
-        
-        for i, evidence in enumerate(self.evidence_found):
-            evidence_text = self.font.render(f"• {evidence['name']}", True, Config.EVIDENCE_YELLOW)
+        evidence_graph = self.state_manager.evidence_graph
+        collected = evidence_graph.find_evidence(location=self.current_scene)
+        max_lines = (Config.SCREEN_HEIGHT - 70 - evidence_y - 30) // 25
+        if len(collected) > max_lines:
+            more = len(collected) - max_lines + 1
+            collected = collected[:max_lines - 1]
+        else:
+            more = 0
+        for i, evidence_id in enumerate(collected):
+            name = evidence_graph.evidence_nodes[evidence_id]["description"]
+            evidence_text = self.render_text(f"• {name}", Config.EVIDENCE_YELLOW)
             screen.blit(evidence_text, (70, evidence_y + 30 + i * 25))
-        
-        # Instructions
-        instructions = [
-            "Click on yellow circles to investigate evidence",
-            "Space: Quick investigate | Escape: Return to Bureau"
-        ]
-        
-        for i, instruction in enumerate(instructions):
-            instruction_text = self.font.render(instruction, True, Config.CID_GRAY)
-            screen.blit(instruction_text, (50, Config.SCREEN_HEIGHT - 60 + i * 25))
+        if more:
+            more_text = self.render_text(f"... and {more} more", Config.CID_GRAY)
+            screen.blit(more_text, (70, evidence_y + 30 + len(collected) * 25))
         
         # Scene completion check
         if self.investigation_progress >= 100:
-            completion_text = self.title_font.render("Scene Investigation Complete!", True, Config.EVIDENCE_YELLOW)
+            completion_text = self.render_text("Scene Investigation Complete!", Config.EVIDENCE_YELLOW, self.title_font)
             completion_rect = completion_text.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2))
             
             # Semi-transparent background
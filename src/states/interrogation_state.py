@@ -5,46 +5,52 @@ Interrogation Room State - AI-powered suspect questioning
 import pygame
 from src.states.base_state import BaseState
 from src.engine.config import Config
-from src.modules.interrogation import InterrogationEngine, SuspectProfile, Evidence
+from src.engine.transcript_view import TranscriptView
+from src.modules.case_packs import interrogation_evidence, suspect_profile
+from src.modules.interrogation import InterrogationEngine
 
 class InterrogationState(BaseState):
+    persistent = True
+    
     def __init__(self, state_manager):
         super().__init__(state_manager)
-        self.interrogation_engine = InterrogationEngine()
+        self.interrogation_engine = InterrogationEngine(Config.AI_BACKEND, Config.GEMINI_API_KEY)
         self.current_suspect = None
-        self.conversation_display = []
         self.input_text = ""
         self.selected_team_member = "ACP"
         self.team_members = ["ACP", "DAYA", "ABHIJEET", "SALUNKHE"]
         self.team_index = 0
         
-        # Sample suspect for demo
-        self.setup_demo_suspect()
-    
-    def setup_demo_suspect(self):
-        """Setup a demo suspect for testing"""
-        self.current_suspect = SuspectProfile(
-            name="Rajesh Kumar",
-            age=35,
-            occupation="Office Manager",
-            background="Works at the victim's company, recently passed over for promotion",
-            personality_traits=["nervous", "defensive", "ambitious"],
-            guilty=True,
-            alibi="I was at home watching TV",
-            secrets=["Had argument with victim", "Needed money badly"],
-            stress_triggers=["promotion", "money", "argument", "victim's name"]
+        # Layout shared by the static and dynamic layers
+        self.stress_rect = pygame.Rect(Config.SCREEN_WIDTH - 350, 70, 300, 20)
+        self.team_rect = pygame.Rect(50, 110, Config.SCREEN_WIDTH // 2, 50)
+        self.conversation_rect = pygame.Rect(50, 170, Config.SCREEN_WIDTH - 100, 300)
+        self.input_rect = pygame.Rect(50, self.conversation_rect.bottom + 50, Config.SCREEN_WIDTH - 100, 30)
+        
+        # Full conversation history; only the lines in view are drawn
+        self.transcript = TranscriptView(
+            self.font,
+            self.conversation_rect.inflate(-20, -20),
+            {
+                "suspect": Config.WHITE,
+                "note": Config.EVIDENCE_YELLOW,
+                "team": Config.CID_GRAY
+            },
+            layout=self.text_layout
         )
         
-        # Sample evidence
-        evidence = [
-            Evidence("fingerprint", "Fingerprints found on victim's desk", 0.8),
-            Evidence("witness", "Witness saw suspect near office", 0.6),
-            Evidence("motive", "Financial records show suspect's debt", 0.9)
-        ]
+        # Suspect and exhibits from the open case's pack (number keys present them in order)
+        self.exhibits = []
+        self.setup_suspect(state_manager.case)
+    
+    def setup_suspect(self, case):
+        """Start interrogating the case's suspect"""
+        self.current_suspect = suspect_profile(case, case["interrogation"]["suspect"])
+        self.exhibits = case["interrogation"]["evidence"]
         
         # Start interrogation
-        opening = self.interrogation_engine.start_interrogation(self.current_suspect, evidence)
-        self.conversation_display.append(f"SUSPECT: {opening}")
+        opening = self.interrogation_engine.start_interrogation(self.current_suspect, interrogation_evidence(case))
+        self._add_line(f"SUSPECT: {opening}")
     
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
@@ -54,21 +60,75 @@ class InterrogationState(BaseState):
                 # Switch team member
                 self.team_index = (self.team_index + 1) % len(self.team_members)
                 self.selected_team_member = self.team_members[self.team_index]
+                self.mark_unsaved()
+                self.invalidate(self.team_rect)
             elif event.key == pygame.K_RETURN:
                 if self.input_text.strip():
                     self._ask_question()
+                    self.invalidate()
             elif event.key == pygame.K_BACKSPACE:
                 self.input_text = self.input_text[:-1]
-            elif event.key == pygame.K_1:
-                self._present_evidence("fingerprint")
-            elif event.key == pygame.K_2:
-                self._present_evidence("witness")
-            elif event.key == pygame.K_3:
-                self._present_evidence("motive")
+                self.invalidate(self.input_rect)
+            elif pygame.K_1 <= event.key < pygame.K_1 + len(self.exhibits):
+                self._present_evidence(self.exhibits[event.key - pygame.K_1]["id"])
+            elif event.key == pygame.K_PAGEUP:
+                self.transcript.page(-1)
+            elif event.key == pygame.K_PAGEDOWN:
+                self.transcript.page(1)
+            elif event.key == pygame.K_END:
+                self.transcript.scroll_to_end()
             else:
                 # Add character to input
                 if event.unicode.isprintable() and len(self.input_text) < 100:
                     self.input_text += event.unicode
+                    self.invalidate(self.input_rect)
+        elif event.type == pygame.MOUSEWHEEL:
+            self.transcript.scroll_lines(-3 * event.y)
+    
+    def update(self, dt):
+        """Advance transcript scrolling"""
+        if self.transcript.update(dt):
+            self.invalidate(self.conversation_rect)
+    
+    def is_idle(self):
+        """Stay at full frame rate while the transcript is scrolling"""
+        return not self.transcript.animating and super().is_idle()
+    
+    def _add_line(self, line):
+        """Append a line to the transcript, colored by who said it"""
+        if line.startswith("SUSPECT:"):
+            kind = "suspect"
+        elif line.startswith("["):
+            kind = "note"
+        else:
+            kind = "team"
+        self.transcript.append(line, kind)
+        self.mark_unsaved()
+    
+    def save_data(self):
+        engine = self.interrogation_engine
+        return {
+            "team_index": self.team_index,
+            "stress": engine.stress_meter,
+            "history": [dict(entry) for entry in engine.conversation_history],
+            "presented": list(engine.evidence_presented),
+            "transcript": self.transcript.export()
+        }
+    
+    def load_data(self, data):
+        """Resume the session with the open case's suspect where it was saved"""
+        engine = self.interrogation_engine
+        engine.stress_meter = data["stress"]
+        engine.conversation_history = data["history"]
+        engine.evidence_presented = data["presented"]
+        for evidence in engine.available_evidence:
+            evidence.revealed = evidence.id in engine.evidence_presented
+        
+        self.team_index = data["team_index"]
+        self.selected_team_member = self.team_members[self.team_index]
+        
+        self.transcript.restore(data["transcript"])
+        self.invalidate()
     
     def _ask_question(self):
         """Ask the current question"""
@@ -78,7 +138,7 @@ class InterrogationState(BaseState):
         
         # Add question to display
         team_name = Config.TEAM_MEMBERS[self.selected_team_member]["name"]
-        self.conversation_display.append(f"{team_name}: {question}")
+        self._add_line(f"{team_name}: {question}")
         
         # Get AI response
         result = self.interrogation_engine.ask_question(
@@ -87,23 +147,19 @@ class InterrogationState(BaseState):
         )
         
         if "response" in result:
-            self.conversation_display.append(f"SUSPECT: {result['response']}")
+            self._add_line(f"SUSPECT: {result['response']}")
             
             # Add behavioral notes
             if result["behavioral_notes"]:
                 for note in result["behavioral_notes"]:
-                    self.conversation_display.append(f"[OBSERVATION: {note}]")
+                    self._add_line(f"[OBSERVATION: {note}]")
             
             # Check for breakthrough
             if result["breakthrough"]:
-                self.conversation_display.append("[BREAKTHROUGH MOMENT!]")
+                self._add_line("[BREAKTHROUGH MOMENT!]")
         
         # Clear input
         self.input_text = ""
-        
-        # Limit conversation display
-        if len(self.conversation_display) > 15:
-            self.conversation_display = self.conversation_display[-15:]
     
     def _present_evidence(self, evidence_id):
         """Present evidence during questioning"""
@@ -115,120 +171,88 @@ class InterrogationState(BaseState):
             )
             
             team_name = Config.TEAM_MEMBERS[self.selected_team_member]["name"]
-            self.conversation_display.append(f"{team_name}: {self.input_text} [PRESENTS EVIDENCE]")
+            self._add_line(f"{team_name}: {self.input_text} [PRESENTS EVIDENCE]")
             
             if "response" in result:
-                self.conversation_display.append(f"SUSPECT: {result['response']}")
+                self._add_line(f"SUSPECT: {result['response']}")
             
             self.input_text = ""
+            self.invalidate()
     
-    def render(self, screen):
+    def render_static(self, screen):
         # Background
         screen.fill((30, 30, 30))  # Dark interrogation room
         
         # Title
-        title_text = self.title_font.render("Interrogation Room", True, Config.EVIDENCE_YELLOW)
+        title_text = self.render_text("Interrogation Room", Config.EVIDENCE_YELLOW, self.title_font)
         title_rect = title_text.get_rect(center=(Config.SCREEN_WIDTH // 2, 30))
         screen.blit(title_text, title_rect)
         
         # Suspect info
         if self.current_suspect:
             suspect_info = f"{self.current_suspect.name} - {self.current_suspect.occupation}"
-            suspect_text = self.font.render(suspect_info, True, Config.WHITE)
+            suspect_text = self.render_text(suspect_info, Config.WHITE)
             screen.blit(suspect_text, (50, 70))
         
-        # Stress meter
-        stress_level = self.interrogation_engine.stress_meter
-        stress_width = 300
-        stress_height = 20
-        stress_x = Config.SCREEN_WIDTH - stress_width - 50
-        stress_y = 70
-        
         # Stress meter background
-        pygame.draw.rect(screen, Config.CID_GRAY, (stress_x, stress_y, stress_width, stress_height))
+        pygame.draw.rect(screen, Config.CID_GRAY, self.stress_rect)
+        
+        # Conversation background
+        pygame.draw.rect(screen, (20, 20, 20), self.conversation_rect)
+        pygame.draw.rect(screen, Config.CID_GRAY, self.conversation_rect, 2)
+        
+        # Input area
+        input_label = self.render_text("Your Question:", Config.WHITE)
+        screen.blit(input_label, (50, self.input_rect.y - 30))
+        
+        # Input box
+        pygame.draw.rect(screen, Config.WHITE, self.input_rect)
+        pygame.draw.rect(screen, Config.BLACK, self.input_rect.inflate(-4, -4))
+        
+        # Evidence shortcuts
+        evidence_y = self.input_rect.y + 50
+        evidence_title = self.render_text("Evidence (Press number key):", Config.WHITE)
+        screen.blit(evidence_title, (50, evidence_y))
+        
+        for i, exhibit in enumerate(self.exhibits):
+            evidence_text = self.render_text(f"{i + 1}. {exhibit['label']}", Config.EVIDENCE_YELLOW)
+            screen.blit(evidence_text, (70, evidence_y + 30 + i * 25))
+        
+        # Instructions
+        instructions = [
+            f"Tab: Switch Team Member | Enter: Ask Question | 1-{len(self.exhibits)}: Present Evidence | Escape: Back"
+        ]
         
+        for i, instruction in enumerate(instructions):
+            instruction_text = self.render_text(instruction, Config.CID_GRAY)
+            screen.blit(instruction_text, (50, Config.SCREEN_HEIGHT - 30 + i * 20))
+    
+    def render_dynamic(self, screen):
         # Stress meter fill
+        stress_level = self.interrogation_engine.stress_meter
+        stress_x, stress_y, stress_width, stress_height = self.stress_rect
         stress_fill = int(stress_width * (stress_level / 100))
         stress_color = Config.DANGER_RED if stress_level > 70 else Config.EVIDENCE_YELLOW
         pygame.draw.rect(screen, stress_color, (stress_x, stress_y, stress_fill, stress_height))
         
         # Stress meter label
-        stress_text = self.font.render(f"Stress: {stress_level:.0f}%", True, Config.WHITE)
+        stress_text = self.render_text(f"Stress: {stress_level:.0f}%", Config.WHITE)
         screen.blit(stress_text, (stress_x, stress_y + 25))
         
         # Team member selection
-        team_y = 110
-        team_text = self.font.render(f"Active: {Config.TEAM_MEMBERS[self.selected_team_member]['name']}", True, Config.EVIDENCE_YELLOW)
+        team_y = self.team_rect.y
+        team_text = self.render_text(f"Active: {Config.TEAM_MEMBERS[self.selected_team_member]['name']}", Config.EVIDENCE_YELLOW)
         screen.blit(team_text, (50, team_y))
         
         specialty = Config.TEAM_MEMBERS[self.selected_team_member]['specialty']
-        specialty_text = self.font.render(f"Specialty: {specialty}", True, Config.CID_GRAY)
+        specialty_text = self.render_text(f"Specialty: {specialty}", Config.CID_GRAY)
         screen.blit(specialty_text, (50, team_y + 25))
         
-        # Conversation display
-        conv_y = 170
-        conv_height = 300
+        # Conversation (only the lines in view are laid out and drawn)
+        self.transcript.render(screen)
         
-        # Conversation background
-        pygame.draw.rect(screen, (20, 20, 20), (50, conv_y, Config.SCREEN_WIDTH - 100, conv_height))
-        pygame.draw.rect(screen, Config.CID_GRAY, (50, conv_y, Config.SCREEN_WIDTH - 100, conv_height), 2)
-        
-        # Display conversation
-        line_height = 20
-        start_line = max(0, len(self.conversation_display) - (conv_height // line_height))
-        
-        for i, line in enumerate(self.conversation_display[start_line:]):
-            y_pos = conv_y + 10 + i * line_height
-            
-            if line.startswith("SUSPECT:"):
-                color = Config.WHITE
-            elif line.startswith("["):
-                color = Config.EVIDENCE_YELLOW
-            else:
-                color = Config.CID_GRAY
-            
-            # Wrap long lines
-            if len(line) > 80:
-                line = line[:77] + "..."
-            
-            line_text = self.font.render(line, True, color)
-            screen.blit(line_text, (60, y_pos))
-        
-        # Input area
-        input_y = conv_y + conv_height + 20
-        input_label = self.font.render("Your Question:", True, Config.WHITE)
-        screen.blit(input_label, (50, input_y))
-        
-        # Input box
-        input_box_y = input_y + 30
-        pygame.draw.rect(screen, Config.WHITE, (50, input_box_y, Config.SCREEN_WIDTH - 100, 30))
-        pygame.draw.rect(screen, Config.BLACK, (52, input_box_y + 2, Config.SCREEN_WIDTH - 104, 26))
-        
-        # Input text
+        # Input text, rendered directly: every keystroke makes a new string that
+        # would only push reusable surfaces out of the shared text cache
         input_display = self.input_text + "|"  # Cursor
         input_text_surface = self.font.render(input_display, True, Config.WHITE)
-        screen.blit(input_text_surface, (60, input_box_y + 5))
-        
-        # Evidence shortcuts
-        evidence_y = input_box_y + 50
-        evidence_title = self.font.render("Evidence (Press number key):", True, Config.WHITE)
-        screen.blit(evidence_title, (50, evidence_y))
-        
-        evidence_list = [
-            "1. Fingerprint Evidence",
-            "2. Witness Testimony", 
-            "3. Financial Motive"
-        ]
-        
-        for i, evidence in enumerate(evidence_list):
-            evidence_text = self.font.render(evidence, True, Config.EVIDENCE_YELLOW)
-            screen.blit(evidence_text, (70, evidence_y + 30 + i * 25))
-        
-        # Instructions
-        instructions = [
-            "Tab: Switch Team Member | Enter: Ask Question | 1-3: Present Evidence | Escape: Back"
-        ]
-        
-        for i, instruction in enumerate(instructions):
-            instruction_text = self.font.render(instruction, True, Config.CID_GRAY)
-            screen.blit(instruction_text, (50, Config.SCREEN_HEIGHT - 30 + i * 20))
\ No newline at end of file
+        screen.blit(input_text_surface, (60, self.input_rect.y + 5))
@@ -2,11 +2,27 @@
 Forensic Lab State - Dr. Salunkhe's domain
 """
 
+import os
+import threading
+import numpy as np
 import pygame
 from src.states.base_state import BaseState
 from src.engine.config import Config
+from src.modules.forensics import ForensicAnalyzer
+from src.modules.lab_results import LabResultStore
 
 class LabState(BaseState):
+    persistent = True
+    
+    # Evidence type each analysis processes
+    ANALYSIS_EVIDENCE_TYPES = {
+        "Fingerprint Analysis": "forensic",
+        "DNA Testing": "forensic",
+        "Ballistics Report": "forensic",
+        "Image Enhancement": "digital",
+        "Chemical Analysis": "forensic"
+    }
+    
     def __init__(self, state_manager):
         super().__init__(state_manager)
         self.analysis_options = [
@@ -20,15 +36,36 @@ class LabState(BaseState):
         self.selected_option = 0
         self.analysis_results = {}
         self.current_analysis = None
+        
+        # Real image enhancement for evidence with an image; the image buffers live in a
+        # memory-budgeted store and only small thumbnails stay around while the lab is open
+        self.forensics = ForensicAnalyzer()
+        self.results = LabResultStore(Config.LAB_RESULT_MEMORY_BUDGET, Config.LAB_RESULT_SPILL_DIR,
+                                      Config.LAB_RESULT_COMPRESS)
+        self._enhancement = None
+        self._thumbnails = {}
+        self.thumbnail_size = (128, 72)
+        
+        # Layout shared by the static and dynamic layers
+        self.menu_x = 100
+        self.menu_y = 150
+        self.pending_y = self.menu_y + 40 + len(self.analysis_options) * 35 + 20
+        self.results_y = 150
+        self.options_rect = pygame.Rect(self.menu_x, self.menu_y + 35, 400, len(self.analysis_options) * 35 + 10)
+        self.results_rect = pygame.Rect(Config.SCREEN_WIDTH // 2 + 50, self.results_y + 35,
+                                        Config.SCREEN_WIDTH // 2 - 50, Config.SCREEN_HEIGHT - 300)
     
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_UP:
                 self.selected_option = (self.selected_option - 1) % len(self.analysis_options)
+                self.invalidate(self.options_rect)
             elif event.key == pygame.K_DOWN:
                 self.selected_option = (self.selected_option + 1) % len(self.analysis_options)
+                self.invalidate(self.options_rect)
             elif event.key == pygame.K_RETURN:
                 self._select_analysis()
+                self.invalidate()
             elif event.key == pygame.K_ESCAPE:
                 self.state_manager.change_state(Config.STATE_BUREAU)
     
@@ -44,69 +81,218 @@ class LabState(BaseState):
             self.analysis_results["image_enhancement"] = {
                 "status": "Processing",
                 "progress": 0,
-                "result": "Face detected with 78% confidence"
+                "result": "Face detected with 78% confidence",
+                "evidence_id": self._next_pending_evidence(selected)
             }
+            self.state_manager.telemetry.emit("lab_analysis", analysis="image_enhancement", status="started",
+                                              evidence_id=self.analysis_results["image_enhancement"]["evidence_id"])
+            self._start_enhancement("image_enhancement")
+            self.mark_unsaved()
         else:
             # Simulate other analyses
             self.current_analysis = f"Running {selected}..."
-            self.analysis_results[selected.lower().replace(" ", "_")] = {
+            analysis_id = selected.lower().replace(" ", "_")
+            self.analysis_results[analysis_id] = {
                 "status": "Processing",
                 "progress": 0,
-                "result": f"{selected} completed successfully"
+                "result": f"{selected} completed successfully",
+                "evidence_id": self._next_pending_evidence(selected)
             }
+            self.state_manager.telemetry.emit("lab_analysis", analysis=analysis_id, status="started",
+                                              evidence_id=self.analysis_results[analysis_id]["evidence_id"])
+            self.mark_unsaved()
+    
+    def _pending_evidence(self):
+        """Evidence from the scene that still needs lab work"""
+        evidence_graph = self.state_manager.evidence_graph
+        return (evidence_graph.find_evidence("forensic", analyzed=False) +
+                evidence_graph.find_evidence("digital", analyzed=False))
+    
+    def _next_pending_evidence(self, analysis):
+        """Pick the next unanalyzed evidence this analysis applies to"""
+        evidence_type = self.ANALYSIS_EVIDENCE_TYPES.get(analysis)
+        if not evidence_type:
+            return None
+        
+        claimed = {data.get("evidence_id") for data in self.analysis_results.values()
+                   if data["status"] == "Processing"}
+        for evidence_id in self.state_manager.evidence_graph.find_evidence(evidence_type, analyzed=False):
+            if evidence_id not in claimed:
+                return evidence_id
+        return None
+    
+    def _evidence_image(self, evidence_id):
+        """Path of the image the case pack gives a piece of evidence, if any"""
+        for evidence in self.state_manager.case["scene"]["evidence"]:
+            if evidence["id"] == evidence_id and evidence.get("image"):
+                return os.path.join(self.state_manager.case_packs.pack_dir, evidence["image"])
+        return None
+    
+    def _start_enhancement(self, analysis_id):
+        """Enhance the evidence's image on a background thread while the progress bar runs"""
+        if self._enhancement is not None:
+            self._enhancement.join()  # an earlier run must not store its result over this one
+            self._enhancement = None
+        self.results.remove(analysis_id)
+        self._thumbnails.pop(analysis_id, None)
+        image = self._evidence_image(self.analysis_results[analysis_id].get("evidence_id"))
+        if image:
+            self._enhancement = threading.Thread(target=self._enhance, args=(analysis_id, image), daemon=True)
+            self._enhancement.start()
+    
+    def _enhance(self, analysis_id, image):
+        self.results.put(analysis_id, self.forensics.enhance_image(image))
+    
+    def _finish_enhancement(self):
+        """
+        Wait for the enhancement and show its result
+        Called when the analysis completes (or on the first update after loading a completed
+        one), never when the thread happens to finish, so replays reach the same frame.
+        """
+        if self._enhancement is None:
+            return
+        self._enhancement.join()
+        self._enhancement = None
+        self._show_enhancement("image_enhancement")
+    
+    def _show_enhancement(self, analysis_id):
+        """Summarize a finished enhancement from its stored metrics"""
+        data = self.analysis_results.get(analysis_id)
+        if data is None or analysis_id not in self.results:
+            return
+        metrics = self.results.metrics(analysis_id)
+        if "error" in metrics:
+            data["result"] = metrics["error"]
+        else:
+            data["result"] = f"Faces: {metrics['faces_detected']} | clarity +{metrics['enhancement_score']:.0%}"
+        self.mark_unsaved()
+        self.invalidate(self.results_rect)
+    
+    def _thumbnail(self, analysis_id):
+        """Small surface of an enhanced image; the image itself is read back from the store if it was paged out"""
+        thumbnail = self._thumbnails.get(analysis_id)
+        if thumbnail is None:
+            result = self.results.get(analysis_id)
+            if result is None or "enhanced" not in result:
+                return None
+            image = self.forensics.pygame_surface_from_cv2(np.asarray(result["enhanced"]))
+            scale = min(self.thumbnail_size[0] / image.get_width(), self.thumbnail_size[1] / image.get_height())
+            size = (max(1, int(image.get_width() * scale)), max(1, int(image.get_height() * scale)))
+            thumbnail = pygame.transform.smoothscale(image, size)
+            self._thumbnails[analysis_id] = thumbnail
+        return thumbnail
+    
+    def exit(self):
+        """Thumbnails are rebuilt from the store next time the lab is shown"""
+        self._thumbnails.clear()
+    
+    def is_idle(self):
+        """Stay at full frame rate while an analysis is in progress"""
+        if self.current_analysis and any(data["status"] == "Processing" for data in self.analysis_results.values()):
+            return False
+        if self._enhancement is not None:
+            return False
+        return super().is_idle()
     
     def update(self, dt):
         """Update analysis progress"""
+        enhancement = self.analysis_results.get("image_enhancement")
+        if enhancement is not None and enhancement["status"] == "Complete":
+            self._finish_enhancement()
+        
         if self.current_analysis:
             # Simulate analysis progress
             for analysis_id, data in self.analysis_results.items():
                 if data["status"] == "Processing":
                     data["progress"] += dt * 20  # 20% per second
+                    self.invalidate(self.results_rect)
                     if data["progress"] >= 100:
                         data["status"] = "Complete"
                         data["progress"] = 100
+                        self.state_manager.telemetry.emit("lab_analysis", analysis=analysis_id, status="complete",
+                                                          evidence_id=data.get("evidence_id"))
+                        if data.get("evidence_id"):
+                            self.state_manager.evidence_graph.mark_analyzed(data["evidence_id"])
                         if analysis_id == "image_enhancement":
                             self.current_analysis = None
+                            self._finish_enhancement()
+                        self.mark_unsaved()
+                        self.invalidate()
+    
+    def save_data(self):
+        return {
+            "results": {analysis_id: dict(data) for analysis_id, data in self.analysis_results.items()},
+            "current_analysis": self.current_analysis
+        }
     
-    def render(self, screen):
+    def load_data(self, data):
+        self.analysis_results = data["results"]
+        self.current_analysis = data["current_analysis"]
+        # Image buffers aren't saved; enhance again for the thumbnail
+        if "image_enhancement" in self.analysis_results:
+            self._start_enhancement("image_enhancement")
+        self.invalidate()
+    
+    def render_static(self, screen):
         # Background
         screen.fill((20, 30, 40))  # Lab-like dark blue
         
         # Title
-        title_text = self.title_font.render("Forensic Laboratory - Dr. Salunkhe", True, Config.EVIDENCE_YELLOW)
+        title_text = self.render_text("Forensic Laboratory - Dr. Salunkhe", Config.EVIDENCE_YELLOW, self.title_font)
         title_rect = title_text.get_rect(center=(Config.SCREEN_WIDTH // 2, 50))
         screen.blit(title_text, title_rect)
         
         # Dr. Salunkhe quote
-        quote_text = self.font.render('"Science never lies, it only reveals the truth"', True, Config.WHITE)
+        quote_text = self.render_text('"Science never lies, it only reveals the truth"', Config.WHITE)
         quote_rect = quote_text.get_rect(center=(Config.SCREEN_WIDTH // 2, 90))
         screen.blit(quote_text, quote_rect)
         
-        # Analysis menu
-        menu_x = 100
-        menu_y = 150
+        # Panel titles
+        menu_title = self.render_text("Available Analyses:", Config.WHITE)
+        screen.blit(menu_title, (self.menu_x, self.menu_y))
         
-        menu_title = self.font.render("Available Analyses:", True, Config.WHITE)
-        screen.blit(menu_title, (menu_x, menu_y))
+        pending_title = self.render_text("Evidence Awaiting Analysis:", Config.WHITE)
+        screen.blit(pending_title, (self.menu_x, self.pending_y))
+        
+        results_title = self.render_text("Analysis Results:", Config.WHITE)
+        screen.blit(results_title, (self.results_rect.x, self.results_y))
+        
+        # Instructions
+        instruction_text = self.render_text("Arrow Keys: Navigate | Enter: Start Analysis | Escape: Back", Config.CID_GRAY)
+        instruction_rect = instruction_text.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT - 30))
+        screen.blit(instruction_text, instruction_rect)
+    
+    def render_dynamic(self, screen):
+        # Analysis menu
+        menu_x = self.menu_x
+        menu_y = self.menu_y
         
         for i, option in enumerate(self.analysis_options):
             color = Config.EVIDENCE_YELLOW if i == self.selected_option else Config.WHITE
             prefix = "> " if i == self.selected_option else "  "
-            text = self.font.render(f"{prefix}{option}", True, color)
+            text = self.render_text(f"{prefix}{option}", color)
             screen.blit(text, (menu_x + 20, menu_y + 40 + i * 35))
         
-        # Analysis results panel
-        results_x = Config.SCREEN_WIDTH // 2 + 50
-        results_y = 150
+        # Evidence awaiting analysis
+        pending_y = self.pending_y
+        evidence_nodes = self.state_manager.evidence_graph.evidence_nodes
+        pending = self._pending_evidence()
+        if not pending:
+            none_text = self.render_text("  None - visit the crime scene", Config.CID_GRAY)
+            screen.blit(none_text, (menu_x + 20, pending_y + 30))
+        for i, evidence_id in enumerate(pending[:4]):
+            pending_text = self.render_text(f"• {evidence_nodes[evidence_id]['description']}", Config.EVIDENCE_YELLOW)
+            screen.blit(pending_text, (menu_x + 20, pending_y + 30 + i * 25))
         
-        results_title = self.font.render("Analysis Results:", True, Config.WHITE)
-        screen.blit(results_title, (results_x, results_y))
+        # Analysis results panel
+        results_x = self.results_rect.x
+        results_y = self.results_y
         
         y_offset = 40
         for analysis_id, data in self.analysis_results.items():
             # Analysis name
             name = analysis_id.replace("_", " ").title()
-            name_text = self.font.render(name, True, Config.EVIDENCE_YELLOW)
+            name_text = self.render_text(name, Config.EVIDENCE_YELLOW)
             screen.blit(name_text, (results_x + 20, results_y + y_offset))
             
             # Status and progress
@@ -117,13 +303,17 @@ class LabState(BaseState):
                 progress_text = "Complete ✓"
                 color = (0, 255, 0)
             
-            status_text = self.font.render(progress_text, True, color)
+            status_text = self.render_text(progress_text, color)
             screen.blit(status_text, (results_x + 40, results_y + y_offset + 25))
             
             # Result (if complete)
             if data["status"] == "Complete":
-                result_text = self.font.render(data["result"], True, Config.WHITE)
+                result_text = self.render_text(data["result"], Config.WHITE)
                 screen.blit(result_text, (results_x + 40, results_y + y_offset + 50))
+                finished = analysis_id in self.results and self._enhancement is None
+                thumbnail = self._thumbnail(analysis_id) if finished else None
+                if thumbnail:
+                    screen.blit(thumbnail, (self.results_rect.right - self.thumbnail_size[0] - 20, results_y + y_offset))
                 y_offset += 75
             else:
                 y_offset += 50
@@ -132,11 +322,6 @@ class LabState(BaseState):
         
         # Current analysis status
         if self.current_analysis:
-            status_text = self.font.render(self.current_analysis, True, Config.EVIDENCE_YELLOW)
+            status_text = self.render_text(self.current_analysis, Config.EVIDENCE_YELLOW)
             status_rect = status_text.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT - 100))
-            screen.blit(status_text, status_rect)
-        
-        # Instructions
-        instruction_text = self.font.render("Arrow Keys: Navigate | Enter: Start Analysis | Escape: Back", True, Config.CID_GRAY)
-        instruction_rect = instruction_text.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT - 30))
-        screen.blit(instruction_text, instruction_rect)
\ No newline at end of file
+            screen.blit(status_text, status_rect)
\ No newline at end of file
@@ -11,17 +11,24 @@ class MenuState(BaseState):
         super().__init__(state_manager)
         self.menu_options = [
             ("New Case", Config.STATE_BUREAU),
-            ("Load Case", None),
+            ("Load Case", "load"),
             ("Exit", "exit")
         ]
         self.selected_option = 0
+        self.options_rect = pygame.Rect(0, 320, Config.SCREEN_WIDTH, len(self.menu_options) * 60)
+        
+        # Feedback under the options (e.g. when there is nothing to load)
+        self.message = ""
+        self.message_rect = pygame.Rect(0, self.options_rect.bottom + 10, Config.SCREEN_WIDTH, 40)
     
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_UP:
                 self.selected_option = (self.selected_option - 1) % len(self.menu_options)
+                self.invalidate(self.options_rect)
             elif event.key == pygame.K_DOWN:
                 self.selected_option = (self.selected_option + 1) % len(self.menu_options)
+                self.invalidate(self.options_rect)
             elif event.key == pygame.K_RETURN:
                 self._select_option()
     
@@ -30,30 +37,47 @@ class MenuState(BaseState):
         option_text, action = self.menu_options[self.selected_option]
         
         if action == "exit":
-            pygame.quit()
-            exit()
+            # Let the main loop (or a headless runner) shut down cleanly
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+        elif action == "load":
+            try:
+                loaded = self.state_manager.load_game()
+            except ValueError as error:
+                print(f"Load failed: {error}")
+                self.message = "The saved case could not be read"
+            else:
+                if not loaded:
+                    self.message = "No saved case yet"
+            self.invalidate(self.message_rect)
         elif action:
             self.state_manager.change_state(action)
     
-    def render(self, screen):
+    def render_static(self, screen):
+        screen.fill(Config.BLACK)
+        
         # Title
-        title_text = self.title_font.render("CID: The Silicon Casefiles", True, Config.EVIDENCE_YELLOW)
+        title_text = self.render_text("CID: The Silicon Casefiles", Config.EVIDENCE_YELLOW, self.title_font)
         title_rect = title_text.get_rect(center=(Config.SCREEN_WIDTH // 2, 150))
         screen.blit(title_text, title_rect)
         
         # Subtitle
-        subtitle_text = self.font.render("A Detective Simulation Experience", True, Config.WHITE)
+        subtitle_text = self.render_text("A Detective Simulation Experience", Config.WHITE)
         subtitle_rect = subtitle_text.get_rect(center=(Config.SCREEN_WIDTH // 2, 200))
         screen.blit(subtitle_text, subtitle_rect)
         
+        # Instructions
+        instruction_text = self.render_text("Use Arrow Keys and Enter to navigate", Config.CID_GRAY)
+        instruction_rect = instruction_text.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT - 50))
+        screen.blit(instruction_text, instruction_rect)
+    
+    def render_dynamic(self, screen):
         # Menu options
         for i, (option_text, _) in enumerate(self.menu_options):
             color = Config.EVIDENCE_YELLOW if i == self.selected_option else Config.WHITE
-            text = self.font.render(option_text, True, color)
+            text = self.render_text(option_text, color)
             text_rect = text.get_rect(center=(Config.SCREEN_WIDTH // 2, 350 + i * 60))
             screen.blit(text, text_rect)
         
-        # Instructions
-        instruction_text = self.font.render("Use Arrow Keys and Enter to navigate", True, Config.CID_GRAY)
-        instruction_rect = instruction_text.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT - 50))
-        screen.blit(instruction_text, instruction_rect)
\ No newline at end of file
+        if self.message:
+            message_text = self.render_text(self.message, Config.DANGER_RED)
+            screen.blit(message_text, message_text.get_rect(center=self.message_rect.center))
\ No newline at end of file
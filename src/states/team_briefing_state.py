@@ -12,91 +12,37 @@ class TeamBriefingState(BaseState):
         self.selected_member = 0
         self.team_members = ["ACP", "DAYA", "ABHIJEET", "SALUNKHE"]
         
-        # Team member briefings and current status
-        self.briefings = {
-            "ACP": {
-                "status": "Coordinating Investigation",
-                "current_task": "Reviewing case evidence and planning next steps",
-                "briefing": [
-                    "Team, we have a complex case on our hands.",
-                    "The victim was found in his locked office with signs of struggle.",
-                    "We need to examine all evidence carefully and question suspects thoroughly.",
-                    "Daya, I want you to check the building security.",
-                    "Abhijeet, review the victim's recent activities.",
-                    "Dr. Salunkhe, prioritize the forensic analysis.",
-                    "Remember: Every detail matters in solving this case."
-                ],
-                "availability": "Available for consultation"
-            },
-            "DAYA": {
-                "status": "Security Investigation",
-                "current_task": "Checking building security and interviewing guards",
-                "briefing": [
-                    "Boss, I've been investigating the building security.",
-                    "The main entrance has CCTV but the back exit camera was broken.",
-                    "Security guard mentions seeing someone suspicious around 9 PM.",
-                    "I found signs of forced entry at the emergency exit.",
-                    "The suspect might have used the service elevator to avoid detection.",
-                    "I'm ready to bring in suspects for questioning.",
-                    "Just give me the word, and I'll make them talk!"
-                ],
-                "availability": "Ready for field work"
-            },
-            "ABHIJEET": {
-                "status": "Evidence Analysis",
-                "current_task": "Analyzing victim's background and recent activities",
-                "briefing": [
-                    "I've been studying the victim's profile and recent behavior.",
-                    "Mr. Sharma had been receiving threatening calls last week.",
-                    "His secretary mentioned he was worried about something.",
-                    "Bank records show unusual transactions in his account.",
-                    "He had meetings with three different people on the day he died.",
-                    "I've prepared detailed profiles of all potential suspects.",
-                    "The pattern suggests this wasn't a random crime."
-                ],
-                "availability": "Analyzing evidence"
-            },
-            "SALUNKHE": {
-                "status": "Forensic Analysis",
-                "current_task": "Processing physical evidence from crime scene",
-                "briefing": [
-                    "The forensic analysis reveals several important findings.",
-                    "Time of death was between 8:30 and 9:30 PM yesterday.",
-                    "The victim was struck with a blunt object, likely a paperweight.",
-                    "I found three different sets of fingerprints on the desk.",
-                    "Blood spatter analysis suggests the attacker was right-handed.",
-                    "DNA analysis is still in progress, results expected soon.",
-                    "The evidence clearly indicates this was a planned attack."
-                ],
-                "availability": "In laboratory"
-            }
-        }
-        
-        self.case_updates = [
-            "New witness came forward with information",
-            "Forensic analysis of fingerprints completed", 
-            "Suspect's alibi has been verified as false",
-            "Additional evidence found at secondary location"
-        ]
+        # Team member briefings, current status and case updates from the open case's pack
+        case = state_manager.case
+        self.briefings = case["briefings"]
+        self.case_updates = case["updates"]
     
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_LEFT:
                 self.selected_member = (self.selected_member - 1) % len(self.team_members)
+                self.invalidate()
             elif event.key == pygame.K_RIGHT:
                 self.selected_member = (self.selected_member + 1) % len(self.team_members)
+                self.invalidate()
             elif event.key == pygame.K_ESCAPE:
                 self.state_manager.change_state(Config.STATE_BUREAU)
     
-    def render(self, screen):
+    def render_static(self, screen):
         # Background
         screen.fill(Config.CID_BLUE)
         
         # Title
-        title_text = self.title_font.render("Team Briefing - Case Status Update", True, Config.EVIDENCE_YELLOW)
+        title_text = self.render_text("Team Briefing - Case Status Update", Config.EVIDENCE_YELLOW, self.title_font)
         title_rect = title_text.get_rect(center=(Config.SCREEN_WIDTH // 2, 40))
         screen.blit(title_text, title_rect)
         
+        # Instructions
+        instruction_text = self.render_text("Left/Right Arrow: Switch Team Members | Escape: Back to Bureau", Config.CID_GRAY)
+        instruction_rect = instruction_text.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT - 30))
+        screen.blit(instruction_text, instruction_rect)
+    
+    def render_dynamic(self, screen):
         # Team member tabs
         tab_width = Config.SCREEN_WIDTH // len(self.team_members)
         tab_height = 50
@@ -118,7 +64,7 @@ class TeamBriefingState(BaseState):
             
             # Tab text
             member_info = Config.TEAM_MEMBERS[member]
-            tab_text = self.font.render(member_info["name"], True, text_color)
+            tab_text = self.render_text(member_info["name"], text_color)
             tab_rect = tab_text.get_rect(center=(tab_x + tab_width // 2, tab_y + tab_height // 2))
             screen.blit(tab_text, tab_rect)
         
@@ -136,83 +82,54 @@ class TeamBriefingState(BaseState):
         pygame.draw.rect(screen, Config.EVIDENCE_YELLOW, (50, panel_y, Config.SCREEN_WIDTH - 100, panel_height), 2)
         
         # Member name and specialty
-        name_text = self.title_font.render(member_info["name"], True, Config.EVIDENCE_YELLOW)
+        name_text = self.render_text(member_info["name"], Config.EVIDENCE_YELLOW, self.title_font)
         screen.blit(name_text, (70, panel_y + 20))
         
-        specialty_text = self.font.render(f"Specialty: {member_info['specialty']}", True, Config.WHITE)
+        specialty_text = self.render_text(f"Specialty: {member_info['specialty']}", Config.WHITE)
         screen.blit(specialty_text, (70, panel_y + 60))
         
         # Current status
-        status_text = self.font.render(f"Status: {briefing_data['status']}", True, Config.EVIDENCE_YELLOW)
+        status_text = self.render_text(f"Status: {briefing_data['status']}", Config.EVIDENCE_YELLOW)
         screen.blit(status_text, (70, panel_y + 90))
         
-        task_text = self.font.render(f"Current Task: {briefing_data['current_task']}", True, Config.WHITE)
+        task_text = self.render_text(f"Current Task: {briefing_data['current_task']}", Config.WHITE)
         screen.blit(task_text, (70, panel_y + 115))
         
-        availability_text = self.font.render(f"Availability: {briefing_data['availability']}", True, Config.CID_GRAY)
+        availability_text = self.render_text(f"Availability: {briefing_data['availability']}", Config.CID_GRAY)
         screen.blit(availability_text, (70, panel_y + 140))
         
         # Briefing content
-        briefing_title = self.font.render("Briefing:", True, Config.EVIDENCE_YELLOW)
+        briefing_title = self.render_text("Briefing:", Config.EVIDENCE_YELLOW)
         screen.blit(briefing_title, (70, panel_y + 180))
         
-        for i, line in enumerate(briefing_data["briefing"]):
-            # Wrap long lines
-            if len(line) > 80:
-                words = line.split()
-                wrapped_lines = []
-                current_line = ""
-                
-                for word in words:
-                    if len(current_line + word) < 80:
-                        current_line += word + " "
-                    else:
-                        wrapped_lines.append(current_line.strip())
-                        current_line = word + " "
-                
-                if current_line:
-                    wrapped_lines.append(current_line.strip())
-                
-                for j, wrapped_line in enumerate(wrapped_lines):
-                    line_text = self.font.render(f"• {wrapped_line}" if j == 0 else f"  {wrapped_line}", True, Config.WHITE)
-                    screen.blit(line_text, (90, panel_y + 210 + (i * len(wrapped_lines) + j) * 25))
-            else:
-                line_text = self.font.render(f"• {line}", True, Config.WHITE)
-                screen.blit(line_text, (90, panel_y + 210 + i * 25))
-        
         # Case updates sidebar
         updates_x = Config.SCREEN_WIDTH - 300
         updates_y = panel_y
         updates_width = 250
         
+        # Briefing lines stop short of the sidebar
+        line_y = panel_y + 210
+        briefing_width = updates_x - 20 - 90
+        for line in briefing_data["briefing"]:
+            line_surface = self.render_paragraph(line, Config.WHITE, briefing_width, line_height=25, bullet="• ")
+            screen.blit(line_surface, (90, line_y))
+            line_y += line_surface.get_height()
+        
+        # Updates are laid out first so the box fits them
+        update_surfaces = [
+            self.render_paragraph(update, Config.WHITE, updates_width - 25, bullet="• ")
+            for update in self.case_updates
+        ]
+        updates_height = 50 + sum(surface.get_height() for surface in update_surfaces)
+        
         # Updates background
-        pygame.draw.rect(screen, (40, 20, 20), (updates_x, updates_y, updates_width, 200))
-        pygame.draw.rect(screen, Config.DANGER_RED, (updates_x, updates_y, updates_width, 200), 2)
+        pygame.draw.rect(screen, (40, 20, 20), (updates_x, updates_y, updates_width, updates_height))
+        pygame.draw.rect(screen, Config.DANGER_RED, (updates_x, updates_y, updates_width, updates_height), 2)
         
-        updates_title = self.font.render("Recent Updates:", True, Config.DANGER_RED)
+        updates_title = self.render_text("Recent Updates:", Config.DANGER_RED)
         screen.blit(updates_title, (updates_x + 10, updates_y + 10))
         
-        for i, update in enumerate(self.case_updates):
-            # Wrap update text
-            words = update.split()
-            lines = []
-            current_line = ""
-            
-            for word in words:
-                if len(current_line + word) < 30:
-                    current_line += word + " "
-                else:
-                    lines.append(current_line.strip())
-                    current_line = word + " "
-            
-            if current_line:
-                lines.append(current_line.strip())
-            
-            for j, line in enumerate(lines):
-                update_text = self.font.render(f"• {line}" if j == 0 else f"  {line}", True, Config.WHITE)
-                screen.blit(update_text, (updates_x + 15, updates_y + 40 + (i * len(lines) + j) * 20))
-        
-        # Instructions
-        instruction_text = self.font.render("Left/Right Arrow: Switch Team Members | Escape: Back to Bureau", True, Config.CID_GRAY)
-        instruction_rect = instruction_text.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT - 30))
-        screen.blit(instruction_text, instruction_rect)
\ No newline at end of file
+        update_y = updates_y + 40
+        for update_surface in update_surfaces:
+            screen.blit(update_surface, (updates_x + 15, update_y))
+            update_y += update_surface.get_height()
\ No newline at end of file
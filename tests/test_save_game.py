@@ -0,0 +1,44 @@
+"""
+SaveGame container: damaged files are reported as ValueError
+(the menu's "Load Case" shows a message instead of crashing).
+"""
+
+import pytest
+
+from src.modules.save_game import HEADER, SaveGame
+
+def sections(**data):
+    return {name: (1, lambda value=value: value) for name, value in data.items()}
+
+@pytest.fixture
+def save_bytes(tmp_path):
+    path = tmp_path / "savegame.cid"
+    SaveGame(str(path), use_msgpack=False).save(sections(session={"state": "lab"}, lab={"results": [1, 2, 3]}))
+    return path, path.read_bytes()
+
+def test_round_trip(save_bytes):
+    path, _data = save_bytes
+    assert SaveGame(str(path)).load() == {"session": {"state": "lab"}, "lab": {"results": [1, 2, 3]}}
+
+def test_truncated_save_is_value_error(save_bytes):
+    path, data = save_bytes
+    for length in range(len(data)):
+        path.write_bytes(data[:length])
+        with pytest.raises(ValueError):
+            SaveGame(str(path)).load()
+
+def test_undecodable_section_name_is_value_error(save_bytes):
+    path, data = save_bytes
+    # First section name starts just after the header and its length byte
+    path.write_bytes(data[:HEADER.size + 1] + b"\xff" + data[HEADER.size + 2:])
+    with pytest.raises(ValueError):
+        SaveGame(str(path)).load()
+
+def test_writer_survives_unencodable_section(tmp_path):
+    save = SaveGame(str(tmp_path / "savegame.cid"), use_msgpack=False)
+    save.save(sections(session={"state": "lab"}, lab=object()))
+    assert not save.save_pending
+    # The other sections were still written, and later saves start a new writer
+    assert SaveGame(save.path).load() == {"session": {"state": "lab"}}
+    save.save({"lab": (2, lambda: {"results": []})})
+    assert SaveGame(save.path).load() == {"session": {"state": "lab"}, "lab": {"results": []}}
@@ -0,0 +1,35 @@
+"""
+StressModel parity with InterrogationEngine
+Every suspect of each case is questioned through the scalar engine (offline
+replies) and the vectorized model side by side; stress, stress change,
+behavioral notes and breakthroughs must match exactly.
+"""
+
+import pytest
+
+from src.engine.config import Config
+from src.modules.case_generator import CaseGenerator
+from src.modules.case_packs import CasePackLibrary
+from src.modules.interrogation import InterrogationEngine
+from src.modules.stress_model import check_against_engine
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_generated_packs_match_engine(seed):
+    generator = CaseGenerator(seed=seed)
+    packs = [generator.generate(index) for index in range(40)]
+    assert check_against_engine(packs, questions=30, seed=seed) == sum(len(pack["suspects"]) for pack in packs)
+
+def test_shipped_packs_match_engine(tmp_path):
+    library = CasePackLibrary(Config.CASE_PACK_DIR, str(tmp_path))
+    packs = [library.load(case_id) for case_id in library.case_ids()]
+    assert packs
+    assert check_against_engine(packs, questions=40, seed=7) == sum(len(pack["suspects"]) for pack in packs)
+
+def test_tuned_constants_match_engine(monkeypatch):
+    # The model reads the engine's constants, so tuning them keeps the two in step
+    monkeypatch.setattr(InterrogationEngine, "TRIGGER_BONUS", 6.0)
+    monkeypatch.setattr(InterrogationEngine, "BREAKTHROUGH_STRESS", 70.0)
+    monkeypatch.setattr(InterrogationEngine, "APPROACH_MODIFIERS", {**InterrogationEngine.APPROACH_MODIFIERS, "DAYA": 2.0})
+    generator = CaseGenerator(seed=3)
+    packs = [generator.generate(index) for index in range(20)]
+    assert check_against_engine(packs, questions=30, seed=3) > 0